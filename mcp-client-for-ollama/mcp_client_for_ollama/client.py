@@ -2,8 +2,10 @@
 
 import asyncio
 import os
-from typing import List, Optional, Dict, Any
-from contextlib import AsyncExitStack
+import signal
+import time
+from typing import List, Optional, Dict, Any, Callable, Tuple
+from contextlib import AsyncExitStack, asynccontextmanager, contextmanager
 
 import typer
 from prompt_toolkit import PromptSession
@@ -22,12 +24,27 @@ from .utils.constants import (
     DEFAULT_MODEL,
     DEFAULT_OLLAMA_HOST,
     DEFAULT_COMPLETION_STYLE,
+    DEFAULT_AGENT_LOOP_MAX_ROUNDS,
+    DEFAULT_AGENT_LOOP_MAX_DURATION,
+    DEFAULT_STREAM_INACTIVITY_TIMEOUT,
+    BUILTIN_SERVER_NAME,
+    CHARS_PER_TOKEN_ESTIMATE,
 )
 from .server.connector import ServerConnector
 from .models.manager import ModelManager
 from .models.config_manager import ModelConfigManager
 from .tools.manager import ToolManager
-from .utils.streaming import StreamingManager
+from .tools.executor import ToolExecutor
+from .tools.output_governor import ToolOutputGovernor
+from .tools.result_encoder import ToolResultEncoder
+from .tools.result_cache import canonicalize_args
+from .tools.result_store import READ_RESULT_TOOL, READ_RESULT_TOOL_NAME, ResultStore
+from .tools.result_content import ResultContentConverter
+from .utils.streaming import (
+    StreamingManager,
+    StreamInactivityError,
+    iterate_with_inactivity_timeout,
+)
 from .utils.tool_display import ToolDisplayManager
 from .utils.hil_manager import HumanInTheLoopManager
 from .utils.fzf_style_completion import FZFStyleCompleter
@@ -59,6 +76,16 @@ class MCPClient:
         self.tool_manager = ToolManager(
             console=self.console, server_connector=self.server_connector
         )
+        # Pick up tool changes from servers connecting in the background
+        self.server_connector.on_tools_changed = self._on_server_tools_changed
+        # Initialize the tool executor
+        self.tool_executor = ToolExecutor(
+            console=self.console, server_connector=self.server_connector
+        )
+        # Cached results may be stale once a server restarts or is removed
+        self.server_connector.on_server_reset = (
+            self.tool_executor.result_cache.invalidate_server
+        )
         # Initialize the streaming manager
         self.streaming_manager = StreamingManager(console=self.console)
         # Initialize the tool display manager
@@ -94,6 +121,26 @@ class MCPClient:
         self.current_config_name = (
             "default"  # Track the currently loaded configuration name
         )
+        # Budgets for the multi-round tool loop of a single query
+        self.agent_loop_settings = {
+            "maxRounds": DEFAULT_AGENT_LOOP_MAX_ROUNDS,
+            "maxTotalTokens": None,
+            "maxDurationSeconds": DEFAULT_AGENT_LOOP_MAX_DURATION,
+            "streamInactivitySeconds": DEFAULT_STREAM_INACTIVITY_TIMEOUT,
+        }
+        # Caps the size of tool results sent back to the model
+        self.output_governor = ToolOutputGovernor()
+        self.result_encoder = ToolResultEncoder()
+        self.tool_calls_collapsed = 0  # Duplicate tool calls not yet reported in metrics
+        self._cancel_query = None  # SIGINT handler of the running query, if installed
+        # Converts every MCP content type into tool message text and images
+        self.result_converter = ResultContentConverter()
+        # Oversized results are stored on disk and paged through with a built-in tool
+        self.result_store = ResultStore()
+        self.tool_manager.register_builtin_tool(READ_RESULT_TOOL)
+        self.tool_executor.register_builtin_handler(
+            READ_RESULT_TOOL_NAME, self.result_store.handle_read_result
+        )
 
         # Store server connection parameters for reloading
         self.server_connection_params = {
@@ -110,22 +157,13 @@ class MCPClient:
     async def supports_thinking_mode(self) -> bool:
         """Check if the current model supports thinking mode by checking its capabilities
 
+        Capabilities are read from the model manager's cache, so this does not
+        contact Ollama on every call.
+
         Returns:
             bool: True if the current model supports thinking mode, False otherwise
         """
-        try:
-            current_model = self.model_manager.get_current_model()
-            # Query the model's capabilities using ollama.show()
-            model_info = await self.ollama.show(current_model)
-
-            # Check if the model has 'thinking' capability
-            if "capabilities" in model_info and model_info["capabilities"]:
-                return "thinking" in model_info["capabilities"]
-
-            return False
-        except Exception:
-            # If we can't determine capabilities, assume no thinking support
-            return False
+        return await self.model_manager.supports_capability("thinking")
 
     async def select_model(self):
         """Let the user select an Ollama model from the available ones"""
@@ -138,6 +176,9 @@ class MCPClient:
         if new_model != old_model:
             self.save_configuration(self.current_config_name)
 
+        # Drop cached capabilities so the next prompt sees fresh model metadata
+        self.model_manager.capability_cache.invalidate()
+
         # After model selection, redisplay context
         self.display_available_tools()
         self.display_current_model()
@@ -187,10 +228,19 @@ class MCPClient:
         # Store the results
         self.sessions = sessions
 
+        # Server limits may have changed, so rebuild the limiters on next use
+        self.tool_executor.reset_server_limiters()
+
         # Set up the tool manager with the available tools and their enabled status
         self.tool_manager.set_available_tools(available_tools)
         self.tool_manager.set_enabled_tools(enabled_tools)
 
+    def _on_server_tools_changed(self):
+        """Refresh the tool manager after a background connection changed the tools"""
+        self.tool_manager.set_available_tools(
+            self.server_connector.get_available_tools()
+        )
+
     def select_tools(self):
         """Let the user select which tools to enable using interactive prompts with server-based grouping"""
         # Call the tool manager's select_tools method
@@ -277,17 +327,8 @@ class MCPClient:
                 "[yellow]Warning: No tools are enabled. Model will respond without tool access.[/yellow]"
             )
 
-        available_tools: List[Dict[str, Any]] = [
-            {
-                "type": "function",
-                "function": {
-                    "name": tool.name,
-                    "description": tool.description,
-                    "parameters": tool.inputSchema,
-                },
-            }
-            for tool in enabled_tool_objects
-        ]
+        # Precomputed tool spec payload, rebuilt only when the enabled set changes
+        available_tools: List[Dict[str, Any]] = self.tool_manager.get_tool_specs()
 
         # Get current model from the model manager
         model: str = self.model_manager.get_current_model()
@@ -309,117 +350,622 @@ class MCPClient:
             chat_params["think"] = self.thinking_mode
 
         # Initial Ollama API call with the query and available tools
+        loop_started_at = time.monotonic()
+        response_text, tool_calls, metrics, started_tool_calls = (
+            await self._stream_chat(chat_params)
+        )
+        loop_tokens = self._count_loop_tokens(metrics)
+
+        # Keep offering tools until the model stops calling them or a budget runs out
+        tool_round = 0
+        while len(tool_calls) > 0 and self.tool_manager.get_enabled_tool_objects():
+            tool_round += 1
+
+            # Record the assistant turn that requested the tools, then the results
+            messages.append(
+                {
+                    "role": "assistant",
+                    "content": response_text,
+                    "tool_calls": tool_calls,
+                }
+            )
+            await self._execute_tool_calls(tool_calls, messages, started_tool_calls)
+
+            budget_message = self._check_agent_loop_budget(
+                tool_round, loop_tokens, time.monotonic() - loop_started_at
+            )
+
+            # Get stream response from Ollama with the tool results, offering the
+            # tools again unless a budget is exhausted
+            chat_params_followup: Dict[str, Any] = {
+                "model": model,
+                "messages": messages,
+                "stream": True,
+                "options": model_options,
+            }
+            if budget_message:
+                self.console.print(f"[yellow]{budget_message}[/yellow]")
+                # Tell the model why it can no longer call tools
+                messages.append(
+                    {
+                        "role": "system",
+                        "content": f"{budget_message} Tools are no longer available; "
+                        "answer with the information gathered so far.",
+                    }
+                )
+            else:
+                chat_params_followup["tools"] = available_tools
+
+            # Add thinking parameter if thinking mode is enabled and model supports it
+            if await self.supports_thinking_mode():
+                chat_params_followup["think"] = self.thinking_mode
+
+            response_text, tool_calls, followup_metrics, started_tool_calls = (
+                await self._stream_chat(chat_params_followup)
+            )
+            loop_tokens += self._count_loop_tokens(followup_metrics)
+
+            if budget_message:
+                break
+
+        if not response_text:
+            self.console.print("[red]No content response received.[/red]")
+            response_text = ""
+
+        # Append query and response to chat history
+        self.chat_history.append({"query": query, "response": response_text})
+
+        return response_text
+
+    async def _run_cancellable_query(self, query: str) -> Optional[str]:
+        """Run a query that the user can cancel with Ctrl-C.
+
+        While the query runs, SIGINT cancels it instead of exiting the client.
+        Cancelling closes the model stream and any in-flight tool calls.
+
+        Args:
+            query: The user query string.
+
+        Returns:
+            Optional[str]: The generated response text, or None if cancelled
+        """
+        loop = asyncio.get_running_loop()
+        query_task = asyncio.ensure_future(self.process_query(query))
+        interrupted = False
+
+        def cancel_query():
+            nonlocal interrupted
+            interrupted = True
+            query_task.cancel()
+
+        try:
+            loop.add_signal_handler(signal.SIGINT, cancel_query)
+            self._cancel_query = cancel_query
+        except (NotImplementedError, RuntimeError):
+            # Signal handlers are unavailable (e.g. on Windows); Ctrl-C keeps its default behavior
+            pass
+
+        try:
+            return await query_task
+        except asyncio.CancelledError:
+            if not interrupted:
+                raise
+            self.console.print("\n[yellow]Query cancelled.[/yellow]")
+            return None
+        finally:
+            if self._cancel_query is not None:
+                self._cancel_query = None
+                loop.remove_signal_handler(signal.SIGINT)
+
+    @contextmanager
+    def _prompt_interrupts_query(self):
+        """Let Ctrl-C at a blocking prompt cancel the running query.
+
+        A synchronous prompt blocks the event loop, so the SIGINT handler of
+        the query could not run until the prompt returned. The default handler
+        is restored while the prompt is open, and the KeyboardInterrupt it
+        raises cancels the query instead.
+        """
+        cancel_query = self._cancel_query
+        if cancel_query is None:
+            yield
+            return
+        loop = asyncio.get_running_loop()
+        loop.remove_signal_handler(signal.SIGINT)
+        try:
+            yield
+        except KeyboardInterrupt:
+            cancel_query()
+            raise asyncio.CancelledError() from None
+        finally:
+            loop.add_signal_handler(signal.SIGINT, cancel_query)
+
+    async def _stream_chat(
+        self, chat_params: Dict[str, Any]
+    ) -> Tuple[str, List[Any], Optional[Dict[str, Any]], Dict[int, asyncio.Task]]:
+        """Send a chat request to Ollama and process the streamed response.
+
+        Args:
+            chat_params: Parameters for ollama.chat()
+
+        Returns:
+            Tuple of (response text, tool calls, metrics, tool call tasks started
+            while streaming keyed by id() of the tool call)
+        """
         stream = await self.ollama.chat(**chat_params)
+        chunks = iterate_with_inactivity_timeout(
+            stream, self.agent_loop_settings.get("streamInactivitySeconds") or None
+        )
+
+        # Tool calls are only dispatched early when tools were offered
+        started_tool_calls: Dict[int, asyncio.Task] = {}
+        on_tool_call = (
+            self._make_streaming_dispatcher(started_tool_calls)
+            if chat_params.get("tools")
+            else None
+        )
+
+        # Client-side savings for the tool results this request carries
+        extra_metrics = {
+            "tool_result_tokens_saved": self.result_encoder.take_savings(),
+            "tool_calls_collapsed": self.tool_calls_collapsed,
+            **self.tool_executor.progress.take_metrics(),
+        }
+        self.tool_calls_collapsed = 0
 
         # Process the streaming response with thinking mode support
-        response_text: str = ""
-        tool_calls: List[Dict[str, Any]] = []
-        response_text, tool_calls, metrics = (
-            await self.streaming_manager.process_streaming_response(
-                stream,
-                thinking_mode=self.thinking_mode,
-                show_thinking=self.show_thinking,
-                show_metrics=self.show_metrics,
+        try:
+            response_text, tool_calls, metrics = (
+                await self.streaming_manager.process_streaming_response(
+                    chunks,
+                    thinking_mode=self.thinking_mode,
+                    show_thinking=self.show_thinking,
+                    show_metrics=self.show_metrics,
+                    on_tool_call=on_tool_call,
+                    extra_metrics=extra_metrics,
+                )
             )
-        )
+        except BaseException:
+            # Don't leave early-dispatched tool calls running if the stream failed
+            for task in started_tool_calls.values():
+                task.cancel()
+            raise
+        finally:
+            # Close the HTTP response so Ollama frees the slot if we stopped early
+            await chunks.aclose()
+            if hasattr(stream, "aclose"):
+                await stream.aclose()
 
         # Update actual token count from metrics if available
         if metrics and metrics.get("eval_count"):
             self.actual_token_count += metrics["eval_count"]
-        # Check if there are any tool calls in the response
-        if len(tool_calls) > 0 and self.tool_manager.get_enabled_tool_objects():
-            for tool in tool_calls:
-                tool_name: str = tool["function"]["name"]
-                tool_args: Dict[str, Any] = tool["function"]["arguments"]
-
-                # Parse server name and actual tool name from the qualified name
-                server_name, actual_tool_name = (
-                    tool_name.split(".", 1) if "." in tool_name else (None, tool_name)
-                )
 
-                if not server_name or server_name not in self.sessions:
+        return response_text, tool_calls, metrics, started_tool_calls
+
+    def _count_loop_tokens(self, metrics: Optional[Dict[str, Any]]) -> int:
+        """Count the prompt and generated tokens of one chat round.
+
+        Args:
+            metrics: Metrics from the streamed response, if any
+
+        Returns:
+            int: Number of tokens evaluated and generated
+        """
+        if not metrics:
+            return 0
+        return (metrics.get("prompt_eval_count") or 0) + (
+            metrics.get("eval_count") or 0
+        )
+
+    def _check_agent_loop_budget(
+        self, tool_round: int, loop_tokens: int, elapsed: float
+    ) -> Optional[str]:
+        """Check whether the tool loop of the current query may run another round.
+
+        Args:
+            tool_round: Number of tool rounds executed so far
+            loop_tokens: Tokens used by the query so far
+            elapsed: Seconds since the query was sent
+
+        Returns:
+            Optional[str]: Why the loop must stop, or None if another round is allowed
+        """
+        max_rounds = self.agent_loop_settings.get("maxRounds")
+        max_tokens = self.agent_loop_settings.get("maxTotalTokens")
+        max_seconds = self.agent_loop_settings.get("maxDurationSeconds")
+
+        if max_rounds and tool_round >= max_rounds:
+            return f"Tool loop stopped after {tool_round} round(s) (maxRounds reached)."
+        if max_tokens and loop_tokens >= max_tokens:
+            return f"Tool loop stopped after {loop_tokens:,} tokens (maxTotalTokens reached)."
+        if max_seconds and elapsed >= max_seconds:
+            return f"Tool loop stopped after {elapsed:.0f}s (maxDurationSeconds reached)."
+        return None
+
+    def _resolve_tool_call(self, tool: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Resolve the server for a tool call requested by the model.
+
+        Args:
+            tool: Tool call from the model response
+
+        Returns:
+            Optional[Dict[str, Any]]: Tool call description for the ToolExecutor,
+            or None if the tool's server is unknown
+        """
+        tool_name: str = tool["function"]["name"]
+        tool_args: Dict[str, Any] = tool["function"]["arguments"]
+
+        # Parse server name and actual tool name from the qualified name
+        server_name, actual_tool_name = (
+            tool_name.split(".", 1) if "." in tool_name else (None, tool_name)
+        )
+
+        if not server_name or (
+            server_name not in self.sessions
+            and not self.server_connector.has_server(server_name)
+            and server_name != BUILTIN_SERVER_NAME
+        ):
+            return None
+
+        return {
+            "server_name": server_name,
+            "tool_name": tool_name,
+            "actual_tool_name": actual_tool_name,
+            "tool_args": tool_args,
+        }
+
+    def _prepare_tool_call(self, tool: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Resolve a tool call, reporting tools whose server is unknown.
+
+        Args:
+            tool: Tool call from the model response
+
+        Returns:
+            Optional[Dict[str, Any]]: Tool call description, or None if the server is unknown
+        """
+        call = self._resolve_tool_call(tool)
+        if call is None:
+            self.console.print(
+                f"[red]Error: Unknown server for tool {tool['function']['name']}[/red]"
+            )
+        return call
+
+    def _make_streaming_dispatcher(
+        self, started_tool_calls: Dict[int, asyncio.Task]
+    ) -> Optional[Callable[[Any], None]]:
+        """Create the callback that starts tool calls while the response streams.
+
+        Early dispatch needs no user interaction, so it is only used when
+        HIL confirmations are disabled.
+
+        Args:
+            started_tool_calls: Dict that receives the started tasks, keyed by id() of the tool call
+
+        Returns:
+            Optional[Callable[[Any], None]]: The callback, or None if early dispatch is off
+        """
+        if not self.tool_executor.dispatch_while_streaming or self.hil_manager.is_enabled():
+            return None
+
+        started_by_key: Dict[Tuple[str, str], asyncio.Task] = {}
+
+        def dispatch(tool: Any) -> None:
+            call = self._resolve_tool_call(tool)
+            if call is not None:
+                # A repeated call shares the task of its first occurrence
+                key = self._tool_call_key(call)
+                if key not in started_by_key:
+                    started_by_key[key] = self.tool_executor.start(call)
+                started_tool_calls[id(tool)] = started_by_key[key]
+
+        return dispatch
+
+    @staticmethod
+    def _tool_call_key(call: Dict[str, Any]) -> Tuple[str, str]:
+        """Build the key under which identical tool calls are collapsed.
+
+        Args:
+            call: Tool call description
+
+        Returns:
+            Tuple of (qualified tool name, canonicalized arguments)
+        """
+        return (call["tool_name"], canonicalize_args(call["tool_args"]))
+
+    async def _confirm_tool_call(self, call: Dict[str, Any]) -> bool:
+        """Display a tool call and request HIL confirmation for it.
+
+        Args:
+            call: Tool call description
+
+        Returns:
+            bool: True if the tool call should be executed
+        """
+        self.tool_display_manager.display_tool_execution(
+            call["tool_name"], call["tool_args"], show=self.show_tool_execution
+        )
+        # Built-in tools only read data the client already holds
+        if call["server_name"] == BUILTIN_SERVER_NAME:
+            return True
+        with self._prompt_interrupts_query():
+            return await self.hil_manager.request_tool_confirmation(
+                call["tool_name"], call["tool_args"]
+            )
+
+    def _append_tool_result(
+        self, call: Dict[str, Any], result: Any, messages: List[Dict[str, Any]]
+    ) -> None:
+        """Display a tool result and append it to the messages as a tool message.
+
+        Args:
+            call: Tool call description
+            result: CallToolResult, or the exception raised by the call
+            messages: Messages to append the tool message to
+        """
+        images: List[str] = []
+        structured = None
+        if isinstance(result, Exception):
+            tool_response = f"Error executing tool {call['tool_name']}: {result}"
+            display_response = tool_response
+        else:
+            tool_response, images = self.result_converter.convert(
+                result, include_images=self._model_supports_vision()
+            )
+            structured = self.result_converter.get_structured_payload(result)
+            # The display shows the readable result unless the model gets less of it
+            display_response = tool_response
+
+            # Rewrite JSON records compactly before measuring the result
+            tool_response, encoded = self.result_encoder.encode(
+                tool_response, parsed=structured
+            )
+            parsed = None if encoded else structured
+            saved_chars = len(display_response) - len(tool_response)
+
+            # Keep large results from flooding the follow-up prompt
+            if self.output_governor.exceeds_limit(
+                call["tool_name"], tool_response
+            ) and self._can_store_result(call):
+                result_id = self.result_store.put(tool_response)
+                preview_chars = min(
+                    self.output_governor.preview_chars,
+                    self.output_governor.get_limit(call["tool_name"]),
+                )
+                tool_response = self.result_store.preview(
+                    tool_response, result_id, preview_chars
+                )
+                display_response, structured = tool_response, None
+                if self.show_tool_execution:
                     self.console.print(
-                        f"[red]Error: Unknown server for tool {tool_name}[/red]"
+                        f"[dim]🗄 {call['tool_name']} output stored as result {result_id}; the model gets a preview[/dim]"
                     )
-                    continue
-
-                # Execute tool call
-                self.tool_display_manager.display_tool_execution(
-                    tool_name, tool_args, show=self.show_tool_execution
+            else:
+                tool_response, dropped_chars = self.output_governor.apply(
+                    call["tool_name"], tool_response, parsed=parsed
                 )
+                if dropped_chars:
+                    # Show what the model actually received
+                    display_response, structured = tool_response, None
+                if dropped_chars and self.show_tool_execution:
+                    self.console.print(
+                        f"[dim]✂ {call['tool_name']} output trimmed by {dropped_chars:,} characters before sending it to the model[/dim]"
+                    )
 
-                # Request HIL confirmation if enabled
-                should_execute: bool = await self.hil_manager.request_tool_confirmation(
-                    tool_name, tool_args
+            if encoded and self.show_tool_execution:
+                self.console.print(
+                    f"[dim]🗜 {call['tool_name']} output encoded compactly for the model, saving ~{saved_chars // CHARS_PER_TOKEN_ESTIMATE:,} tokens[/dim]"
                 )
 
-                if not should_execute:
-                    tool_response: str = "Tool call was skipped by user"
-                    self.tool_display_manager.display_tool_response(
-                        tool_name,
-                        tool_args,
-                        tool_response,
-                        show=self.show_tool_execution,
-                    )
-                    messages.append(
-                        {"role": "tool", "content": tool_response, "name": tool_name}
-                    )
-                    continue
+        if call.get("cached") and self.show_tool_execution:
+            self.console.print(
+                f"[dim]↺ {call['tool_name']} served from the tool result cache[/dim]"
+            )
 
-                # Call the tool on the specified server
-                result = None
-                with self.console.status(f"[cyan]⏳ Running {tool_name}...[/cyan]"):
-                    result = await self.sessions[server_name]["session"].call_tool(
-                        actual_tool_name, tool_args
-                    )
+        self.tool_display_manager.display_tool_response(
+            call["tool_name"],
+            call["tool_args"],
+            display_response,
+            show=self.show_tool_execution,
+            structured_response=structured,
+        )
+        tool_message = {
+            "role": "tool",
+            "content": tool_response,
+            "name": call["tool_name"],
+        }
+        if images:
+            tool_message["images"] = images
+        messages.append(tool_message)
 
-                tool_response = f"{result.content[0].text}"
+    def _model_supports_vision(self) -> bool:
+        """Check from cached model info whether the current model accepts images.
 
-                # Display the tool response
-                self.tool_display_manager.display_tool_response(
-                    tool_name, tool_args, tool_response, show=self.show_tool_execution
-                )
+        Returns:
+            bool: True if the model reports the 'vision' capability
+        """
+        model_info = self.model_manager.get_cached_model_info()
+        return bool(model_info) and "vision" in model_info["capabilities"]
 
-                messages.append(
-                    {"role": "tool", "content": tool_response, "name": tool_name}
-                )
+    def _can_store_result(self, call: Dict[str, Any]) -> bool:
+        """Check whether an oversized result may be stored instead of truncated.
 
-            # Get stream response from Ollama with the tool results
-            chat_params_followup: Dict[str, Any] = {
-                "model": model,
-                "messages": messages,
-                "stream": True,
-                "options": model_options,
-            }
+        Storing only helps if the model can page through the result, so the
+        read_result tool must be enabled. Its own output is never stored.
 
-            # Add thinking parameter if thinking mode is enabled and model supports it
-            if await self.supports_thinking_mode():
-                chat_params_followup["think"] = self.thinking_mode
+        Args:
+            call: Tool call description
 
-            stream = await self.ollama.chat(**chat_params_followup)
+        Returns:
+            bool: True if the result should go to the result store
+        """
+        return (
+            self.output_governor.store_large_results
+            and call["server_name"] != BUILTIN_SERVER_NAME
+            and self.tool_manager.get_enabled_tools().get(READ_RESULT_TOOL_NAME, False)
+        )
 
-            # Process the streaming response with thinking mode support
-            response_text, _, followup_metrics = (
-                await self.streaming_manager.process_streaming_response(
-                    stream,
-                    thinking_mode=self.thinking_mode,
-                    show_thinking=self.show_thinking,
-                    show_metrics=self.show_metrics,
-                )
+    def _append_skipped_tool_call(
+        self, call: Dict[str, Any], messages: List[Dict[str, Any]]
+    ) -> None:
+        """Display and record a tool call that was skipped by the user.
+
+        Args:
+            call: Tool call description
+            messages: Messages to append the tool message to
+        """
+        tool_response: str = "Tool call was skipped by user"
+        self.tool_display_manager.display_tool_response(
+            call["tool_name"],
+            call["tool_args"],
+            tool_response,
+            show=self.show_tool_execution,
+        )
+        messages.append(
+            {"role": "tool", "content": tool_response, "name": call["tool_name"]}
+        )
+
+    def _append_duplicate_tool_call(
+        self, call: Dict[str, Any], messages: List[Dict[str, Any]]
+    ) -> None:
+        """Record a repeated tool call with the result of its first occurrence.
+
+        Args:
+            call: Tool call description with 'duplicate_of' set to the first occurrence
+            messages: Messages to append the tool message to
+        """
+        if self.show_tool_execution:
+            self.console.print(
+                f"[dim]⧉ Repeated call to {call['tool_name']} with the same arguments; reusing its result[/dim]"
             )
+        messages.append(dict(call["duplicate_of"]["message"]))
 
-            # Update actual token count from followup metrics if available
-            if followup_metrics and followup_metrics.get("eval_count"):
-                self.actual_token_count += followup_metrics["eval_count"]
+    @asynccontextmanager
+    async def _tool_status(self, label: str):
+        """Show a status spinner with live elapsed time and progress of running tools.
 
-        if not response_text:
-            self.console.print("[red]No content response received.[/red]")
-            response_text = ""
+        Args:
+            label: Status text shown before the per-call details
+        """
+        with self.console.status(label) as status:
 
-        # Append query and response to chat history
-        self.chat_history.append({"query": query, "response": response_text})
+            async def refresh() -> None:
+                while True:
+                    await asyncio.sleep(0.5)
+                    details = self.tool_executor.progress.describe()
+                    status.update(f"{label} [dim]{details}[/dim]" if details else label)
 
-        return response_text
+            refresh_task = asyncio.create_task(refresh())
+            try:
+                yield status
+            finally:
+                refresh_task.cancel()
+
+    async def _execute_tool_calls(
+        self,
+        tool_calls: List[Dict[str, Any]],
+        messages: List[Dict[str, Any]],
+        started_tool_calls: Optional[Dict[int, asyncio.Task]] = None,
+    ) -> None:
+        """Execute the tool calls of one model turn and append their results.
+
+        In sequential mode each call is confirmed, run and displayed in turn. In
+        parallel mode all HIL confirmations are collected up front, the confirmed
+        calls run concurrently, and the tool messages are still appended in the
+        original call order. Calls already dispatched while the response was
+        streaming are awaited instead of being started again. Identical calls
+        (same tool and arguments) run once, and every repeat gets a copy of
+        the first call's tool message.
+
+        Args:
+            tool_calls: Tool calls from the model response
+            messages: Messages to append the tool messages to
+            started_tool_calls: Tasks of tool calls dispatched during streaming, keyed by id()
+        """
+        started_tool_calls = started_tool_calls or {}
+        all_calls = []  # Every call in order, including repeats
+        calls = []  # Unique calls to execute
+        first_calls: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        for tool in tool_calls:
+            call = self._prepare_tool_call(tool)
+            if call is None:
+                continue
+            all_calls.append(call)
+            key = self._tool_call_key(call)
+            if key in first_calls:
+                call["duplicate_of"] = first_calls[key]
+                self.tool_calls_collapsed += 1
+                continue
+            first_calls[key] = call
+            call["task"] = started_tool_calls.get(id(tool))
+            calls.append(call)
+
+        def append_result(call: Dict[str, Any], result: Any) -> None:
+            self._append_tool_result(call, result, messages)
+            call["message"] = messages[-1]
+
+        def append_skipped(call: Dict[str, Any]) -> None:
+            self._append_skipped_tool_call(call, messages)
+            call["message"] = messages[-1]
+
+        if started_tool_calls:
+            # These calls are already running; just collect their results in order
+            async with self._tool_status(
+                f"[cyan]⏳ Waiting for {len(calls)} tool(s)...[/cyan]"
+            ):
+                for call in calls:
+                    self.tool_display_manager.display_tool_execution(
+                        call["tool_name"], call["tool_args"], show=self.show_tool_execution
+                    )
+                    if call["task"] is None:
+                        call["task"] = self.tool_executor.start(call)
+                # Gathering cancels every call in flight if the query is cancelled
+                results = await asyncio.gather(*(call["task"] for call in calls))
+            results = {id(call): result for call, result in zip(calls, results)}
+            for call in all_calls:
+                if "duplicate_of" in call:
+                    self._append_duplicate_tool_call(call, messages)
+                else:
+                    append_result(call, results[id(call)])
+            return
+
+        if not self.tool_executor.is_parallel() or len(calls) < 2:
+            for call in all_calls:
+                if "duplicate_of" in call:
+                    self._append_duplicate_tool_call(call, messages)
+                    continue
+
+                if not await self._confirm_tool_call(call):
+                    append_skipped(call)
+                    continue
+
+                # Call the tool on the specified server
+                async with self._tool_status(
+                    f"[cyan]⏳ Running {call['tool_name']}...[/cyan]"
+                ):
+                    result = (await self.tool_executor.execute([call]))[0]
+                append_result(call, result)
+            return
+
+        # Collect HIL confirmations before dispatching anything
+        for call in calls:
+            call["confirmed"] = await self._confirm_tool_call(call)
+        calls_to_run = [call for call in calls if call["confirmed"]]
+
+        results = []
+        if calls_to_run:
+            async with self._tool_status(
+                f"[cyan]⏳ Running {len(calls_to_run)} tools concurrently...[/cyan]"
+            ):
+                results = await self.tool_executor.execute(calls_to_run)
+
+        results_by_call = {id(call): result for call, result in zip(calls_to_run, results)}
+        for call in all_calls:
+            if "duplicate_of" in call:
+                self._append_duplicate_tool_call(call, messages)
+            elif call["confirmed"]:
+                append_result(call, results_by_call[id(call)])
+            else:
+                append_skipped(call)
 
     async def get_user_input(self, prompt_text: str = None) -> str:
         """Get user input with full keyboard navigation support"""
@@ -588,6 +1134,20 @@ class MCPClient:
                     self.hil_manager.toggle()
                     continue
 
+                if query.lower() in ["tool-cache", "tc"]:
+                    self.tool_executor.display_result_cache()
+                    continue
+
+                if query.lower() in ["clear-tool-cache", "ctc"]:
+                    self.tool_executor.clear_result_cache()
+                    continue
+
+                if query.lower() in ["parallel-tools", "pt"]:
+                    self.tool_executor.toggle_parallel()
+                    # Auto-save current settings
+                    self.save_configuration(self.current_config_name)
+                    continue
+
                 if query.lower() in ["mcphub", "hub", "mcp-hub"]:
                     mcphub_manager = MCPHubManager(
                         self.console,
@@ -612,7 +1172,17 @@ class MCPClient:
                     continue
 
                 try:
-                    await self.process_query(query)
+                    await self._run_cancellable_query(query)
+                except StreamInactivityError as e:
+                    self.console.print(
+                        Panel(
+                            f"[bold red]Stream Timeout:[/bold red] {e}\n\n"
+                            "The response was aborted. Increase [bold]streamInactivitySeconds[/bold] "
+                            "in agentLoopSettings if the model needs longer to respond.",
+                            border_style="red",
+                            expand=False,
+                        )
+                    )
                 except ollama.ResponseError as e:
                     # Extract error message without the traceback
                     error_msg = str(e)
@@ -682,6 +1252,9 @@ class MCPClient:
                 "• Type [bold]tools[/bold] or [bold]t[/bold] to configure tools\n"
                 "• Type [bold]show-tool-execution[/bold] or [bold]ste[/bold] to toggle tool execution display\n"
                 "• Type [bold]human-in-the-loop[/bold] or [bold]hil[/bold] to toggle Human-in-the-Loop confirmations\n"
+                "• Type [bold]parallel-tools[/bold] or [bold]pt[/bold] to toggle concurrent tool execution\n"
+                "• Type [bold]tool-cache[/bold] or [bold]tc[/bold] to inspect the tool result cache\n"
+                "• Type [bold]clear-tool-cache[/bold] or [bold]ctc[/bold] to flush the tool result cache\n"
                 "• Type [bold]reload-servers[/bold] or [bold]rs[/bold] to reload MCP servers\n\n"
                 "[bold cyan]Context:[/bold cyan]\n"
                 "• Type [bold]context[/bold] or [bold]c[/bold] to toggle context retention\n"
@@ -832,6 +1405,15 @@ class MCPClient:
         """Display information about the current context window usage"""
         history_count = len(self.chat_history)
 
+        # Only show the context length if it is already cached, to avoid an Ollama round-trip
+        model_info = self.model_manager.get_cached_model_info()
+        context_length = model_info["context_length"] if model_info else None
+        context_length_status = (
+            f"Model context length: {context_length:,} tokens\n"
+            if context_length
+            else ""
+        )
+
         # For thinking status, show a simplified message. The user can check model capabilities by trying to enable thinking mode
         thinking_status = ""
         if self.thinking_mode:
@@ -840,6 +1422,19 @@ class MCPClient:
         else:
             thinking_status = f"Thinking mode: [red]Disabled[/red]\n"
 
+        # Ping results of connected servers, from the background health monitor
+        server_health_status = ""
+        for server_name, health in self.server_connector.get_server_health().items():
+            color = {"healthy": "green", "degraded": "yellow"}.get(health["state"], "red")
+            latency = (
+                f" (p50 {health['p50_ms']:.0f}ms, p95 {health['p95_ms']:.0f}ms)"
+                if health["p50_ms"] is not None
+                else ""
+            )
+            server_health_status += (
+                f"Server {server_name}: [{color}]{health['state'].capitalize()}[/{color}]{latency}\n"
+            )
+
         self.console.print(
             Panel(
                 f"Context retention: [{'green' if self.retain_context else 'red'}]{'Enabled' if self.retain_context else 'Disabled'}[/{'green' if self.retain_context else 'red'}]\n"
@@ -847,7 +1442,10 @@ class MCPClient:
                 f"Tool execution display: [{'green' if self.show_tool_execution else 'red'}]{'Enabled' if self.show_tool_execution else 'Disabled'}[/{'green' if self.show_tool_execution else 'red'}]\n"
                 f"Performance metrics: [{'green' if self.show_metrics else 'red'}]{'Enabled' if self.show_metrics else 'Disabled'}[/{'green' if self.show_metrics else 'red'}]\n"
                 f"Human-in-the-Loop confirmations: [{'green' if self.hil_manager.is_enabled() else 'red'}]{'Enabled' if self.hil_manager.is_enabled() else 'Disabled'}[/{'green' if self.hil_manager.is_enabled() else 'red'}]\n"
+                f"Parallel tool execution: [{'green' if self.tool_executor.is_parallel() else 'red'}]{'Enabled' if self.tool_executor.is_parallel() else 'Disabled'}[/{'green' if self.tool_executor.is_parallel() else 'red'}]\n"
+                f"{server_health_status}"
                 f"Conversation entries: {history_count}\n"
+                f"{context_length_status}"
                 f"Total tokens generated: {self.actual_token_count:,}",
                 title="Context Info",
                 border_style="cyan",
@@ -889,6 +1487,16 @@ class MCPClient:
                 "showMetrics": self.show_metrics,
             },
             "hilSettings": {"enabled": self.hil_manager.is_enabled()},
+            "toolExecutionSettings": self.tool_executor.get_settings(),
+            "agentLoopSettings": dict(self.agent_loop_settings),
+            "toolCacheSettings": self.tool_executor.result_cache.get_settings(),
+            "toolOutputSettings": self.output_governor.get_settings(),
+            "toolResultEncodingSettings": self.result_encoder.get_settings(),
+            "circuitBreakerSettings": self.server_connector.get_circuit_breaker_settings(),
+            "serverStartupSettings": self.server_connector.get_startup_settings(),
+            "serverRestartSettings": self.server_connector.get_restart_settings(),
+            "httpClientSettings": self.server_connector.http_pool.get_settings(),
+            "serverHealthSettings": self.server_connector.get_health_settings(),
         }
 
         # Use the ConfigManager to save the configuration
@@ -970,6 +1578,58 @@ class MCPClient:
             if "enabled" in config_data["hilSettings"]:
                 self.hil_manager.set_enabled(config_data["hilSettings"]["enabled"])
 
+        # Load tool execution settings if specified
+        if "toolExecutionSettings" in config_data:
+            self.tool_executor.set_settings(config_data["toolExecutionSettings"])
+
+        # Load agent loop budgets if specified
+        if "agentLoopSettings" in config_data:
+            self.agent_loop_settings.update(config_data["agentLoopSettings"])
+
+        # Load tool result cache settings if specified
+        if "toolCacheSettings" in config_data:
+            self.tool_executor.result_cache.set_settings(
+                config_data["toolCacheSettings"]
+            )
+
+        # Load tool output size limits if specified
+        if "toolOutputSettings" in config_data:
+            self.output_governor.set_settings(config_data["toolOutputSettings"])
+
+        # Load tool result encoding settings if specified
+        if "toolResultEncodingSettings" in config_data:
+            self.result_encoder.set_settings(config_data["toolResultEncodingSettings"])
+
+        # Load circuit breaker settings if specified
+        if "circuitBreakerSettings" in config_data:
+            self.server_connector.set_circuit_breaker_settings(
+                config_data["circuitBreakerSettings"]
+            )
+
+        # Load server startup settings if specified
+        if "serverStartupSettings" in config_data:
+            self.server_connector.set_startup_settings(
+                config_data["serverStartupSettings"]
+            )
+
+        # Load server restart settings if specified
+        if "serverRestartSettings" in config_data:
+            self.server_connector.set_restart_settings(
+                config_data["serverRestartSettings"]
+            )
+
+        # Load HTTP client settings if specified
+        if "httpClientSettings" in config_data:
+            self.server_connector.http_pool.set_settings(
+                config_data["httpClientSettings"]
+            )
+
+        # Load server health settings if specified
+        if "serverHealthSettings" in config_data:
+            self.server_connector.set_health_settings(
+                config_data["serverHealthSettings"]
+            )
+
         self.current_config_name = config_name
         self.console.print(f"[green]Configuration '{config_name}' loaded.[/green]")
         return True
@@ -1026,14 +1686,72 @@ class MCPClient:
                 # Default HIL to True if not specified
                 self.hil_manager.set_enabled(True)
 
+        # Reset tool execution settings from the default configuration
+        if "toolExecutionSettings" in config_data:
+            self.tool_executor.set_settings(config_data["toolExecutionSettings"])
+
+        # Reset agent loop budgets from the default configuration
+        if "agentLoopSettings" in config_data:
+            self.agent_loop_settings.update(config_data["agentLoopSettings"])
+
+        # Reset tool result cache settings from the default configuration
+        if "toolCacheSettings" in config_data:
+            self.tool_executor.result_cache.set_settings(
+                config_data["toolCacheSettings"]
+            )
+
+        # Reset tool output size limits from the default configuration
+        if "toolOutputSettings" in config_data:
+            self.output_governor.set_settings(config_data["toolOutputSettings"])
+
+        # Reset tool result encoding settings from the default configuration
+        if "toolResultEncodingSettings" in config_data:
+            self.result_encoder.set_settings(config_data["toolResultEncodingSettings"])
+
+        # Reset circuit breaker settings from the default configuration
+        if "circuitBreakerSettings" in config_data:
+            self.server_connector.set_circuit_breaker_settings(
+                config_data["circuitBreakerSettings"]
+            )
+
+        # Reset server startup settings from the default configuration
+        if "serverStartupSettings" in config_data:
+            self.server_connector.set_startup_settings(
+                config_data["serverStartupSettings"]
+            )
+
+        # Reset server restart settings from the default configuration
+        if "serverRestartSettings" in config_data:
+            self.server_connector.set_restart_settings(
+                config_data["serverRestartSettings"]
+            )
+
+        # Reset HTTP client settings from the default configuration
+        if "httpClientSettings" in config_data:
+            self.server_connector.http_pool.set_settings(
+                config_data["httpClientSettings"]
+            )
+
+        # Reset server health settings from the default configuration
+        if "serverHealthSettings" in config_data:
+            self.server_connector.set_health_settings(
+                config_data["serverHealthSettings"]
+            )
+
         return True
 
     async def cleanup(self):
         """Clean up resources"""
         await self.exit_stack.aclose()
+        await self.server_connector.http_pool.aclose()
+        self.result_converter.cleanup()
 
     async def reload_servers(self):
-        """Reload all MCP servers with the same connection parameters"""
+        """Reload MCP servers with the same connection parameters
+
+        Only servers that were added, removed or whose configuration changed
+        are stopped or started; the others stay connected.
+        """
         if not any(self.server_connection_params.values()):
             self.console.print(
                 "[yellow]No server connection parameters stored. Cannot reload.[/yellow]"
@@ -1046,19 +1764,19 @@ class MCPClient:
             # Store current tool enabled states
             current_enabled_tools = self.tool_manager.get_enabled_tools().copy()
 
-            # Disconnect from all current servers
-            await self.server_connector.disconnect_all_servers()
-
-            # Update our exit_stack reference to the new one created by ServerConnector
-            self.exit_stack = self.server_connector.exit_stack
-
-            # Reconnect using stored parameters
-            await self.connect_to_servers(
-                server_paths=self.server_connection_params["server_paths"],
-                server_urls=self.server_connection_params["server_urls"],
-                config_path=self.server_connection_params["config_path"],
-                auto_discovery=self.server_connection_params["auto_discovery"],
+            # Only servers that were added, removed or changed are restarted
+            sessions, available_tools, enabled_tools = (
+                await self.server_connector.reload_servers(
+                    server_paths=self.server_connection_params["server_paths"],
+                    server_urls=self.server_connection_params["server_urls"],
+                    config_path=self.server_connection_params["config_path"],
+                    auto_discovery=self.server_connection_params["auto_discovery"],
+                )
             )
+            self.sessions = sessions
+            self.tool_executor.reset_server_limiters()
+            self.tool_manager.set_available_tools(available_tools)
+            self.tool_manager.set_enabled_tools(enabled_tools)
 
             # Restore enabled tool states for tools that still exist
             available_tool_names = {
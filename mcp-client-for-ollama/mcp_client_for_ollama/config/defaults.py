@@ -6,7 +6,40 @@ tool enabling, context retention, and Ollama model options.
 """
 
 import os
-from ..utils.constants import DEFAULT_MODEL, DEFAULT_CONFIG_FILE, DEFAULT_CONFIG_DIR
+from ..utils.constants import (
+    DEFAULT_MODEL,
+    DEFAULT_CONFIG_FILE,
+    DEFAULT_CONFIG_DIR,
+    DEFAULT_TOOL_MAX_CONCURRENCY,
+    DEFAULT_TOOL_MAX_CONCURRENCY_PER_SERVER,
+    DEFAULT_AGENT_LOOP_MAX_ROUNDS,
+    DEFAULT_AGENT_LOOP_MAX_DURATION,
+    DEFAULT_STREAM_INACTIVITY_TIMEOUT,
+    DEFAULT_TOOL_TIMEOUT,
+    DEFAULT_TOOL_OUTPUT_MAX_CHARS,
+    DEFAULT_RESULT_PREVIEW_CHARS,
+    DEFAULT_TOOL_CACHE_MAX_ENTRIES,
+    DEFAULT_TOOL_CACHE_TTL,
+    DEFAULT_CIRCUIT_BREAKER_WINDOW,
+    DEFAULT_CIRCUIT_BREAKER_FAILURE_RATE,
+    DEFAULT_CIRCUIT_BREAKER_MIN_CALLS,
+    DEFAULT_CIRCUIT_BREAKER_SLOW_CALL_SECONDS,
+    DEFAULT_CIRCUIT_BREAKER_OPEN_SECONDS,
+    DEFAULT_SERVER_CONNECT_CONCURRENCY,
+    DEFAULT_SERVER_CONNECT_TIMEOUT,
+    DEFAULT_CONNECTIVITY_TIMEOUT,
+    DEFAULT_LAZY_SERVER_IDLE_TIMEOUT,
+    DEFAULT_SERVER_RESTART_INITIAL_DELAY,
+    DEFAULT_SERVER_RESTART_MAX_DELAY,
+    DEFAULT_SERVER_RESTART_MAX_ATTEMPTS,
+    DEFAULT_HTTP_MAX_CONNECTIONS,
+    DEFAULT_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+    DEFAULT_HTTP_KEEPALIVE_EXPIRY,
+    DEFAULT_HEALTH_CHECK_INTERVAL,
+    DEFAULT_HEALTH_CHECK_TIMEOUT,
+    DEFAULT_HEALTH_DEGRADED_LATENCY_MS,
+    DEFAULT_HEALTH_DOWN_AFTER_FAILURES,
+)
 
 
 def default_config() -> dict:
@@ -21,6 +54,13 @@ def default_config() -> dict:
     - Detailed Ollama model configuration parameters (system prompt, sampling options, etc.)
     - Display preferences for tool execution and metrics
     - Human-in-the-loop confirmation settings
+    - Tool execution settings (sequential or concurrent, with concurrency limits)
+    - Budgets for the multi-round tool loop (rounds, tokens, wall-clock time)
+    - Tool result cache settings for read-only tools
+    - Circuit breaker settings for failing or slow MCP servers
+    - Server startup settings (concurrent connections, connect timeout)
+    - Size limits for tool output sent back to the model
+    - Compact encoding of JSON tool results sent back to the model
 
     Returns:
         dict: Default configuration dictionary with all initial settings.
@@ -56,6 +96,79 @@ def default_config() -> dict:
             "showMetrics": False,  # Show performance metrics (tokens, time) after each query
         },
         "hilSettings": {"enabled": True},  # Enable human-in-the-loop confirmations for tool calls
+        "toolExecutionSettings": {
+            "parallel": False,  # Run independent tool calls from one model turn concurrently
+            "dispatchWhileStreaming": False,  # Start tool calls as they arrive in the stream (only without HIL)
+            "maxConcurrency": DEFAULT_TOOL_MAX_CONCURRENCY,  # Maximum tool calls in flight overall
+            "maxConcurrencyPerServer": DEFAULT_TOOL_MAX_CONCURRENCY_PER_SERVER,  # Maximum tool calls in flight per MCP server
+            "toolTimeout": DEFAULT_TOOL_TIMEOUT,  # Seconds a tool call may run before it is cancelled (None for no limit)
+            "toolTimeouts": {},  # Per-tool timeout overrides keyed by qualified tool name
+            "validateArguments": True,  # Check arguments against each tool's inputSchema before calling it
+        },
+        "agentLoopSettings": {
+            "maxRounds": DEFAULT_AGENT_LOOP_MAX_ROUNDS,  # Maximum tool rounds per query before tools are withheld
+            "maxTotalTokens": None,  # Maximum prompt + generated tokens per query (None for no limit)
+            "maxDurationSeconds": DEFAULT_AGENT_LOOP_MAX_DURATION,  # Maximum wall-clock time per query (None for no limit)
+            "streamInactivitySeconds": DEFAULT_STREAM_INACTIVITY_TIMEOUT,  # Abort a model response that stalls this long (None for no limit)
+        },
+        "toolCacheSettings": {
+            "enabled": True,  # Memoize results of read-only tools
+            "maxEntries": DEFAULT_TOOL_CACHE_MAX_ENTRIES,  # LRU size bound
+            "defaultTtl": DEFAULT_TOOL_CACHE_TTL,  # Seconds a cached result stays valid (None for no expiry)
+            "toolTtls": {},  # Per-tool TTL overrides keyed by qualified tool name
+            "cacheTools": [],  # Qualified tool names to cache regardless of annotations
+            "useAnnotations": True,  # Cache tools annotated with readOnlyHint
+        },
+        "toolOutputSettings": {
+            "enabled": True,  # Cap tool output before it is sent back to the model
+            "maxChars": DEFAULT_TOOL_OUTPUT_MAX_CHARS,  # Maximum characters per tool result (None for no limit)
+            "maxTokens": None,  # Maximum estimated tokens per tool result (None for no limit)
+            "headRatio": 0.7,  # Share of the budget kept from the start of truncated text (the rest from the end)
+            "toolLimits": {},  # Per-tool {"maxChars": ..., "maxTokens": ...} overrides keyed by qualified tool name
+            "storeLargeResults": True,  # Store over-limit results on disk and send a preview the model can page through
+            "previewChars": DEFAULT_RESULT_PREVIEW_CHARS,  # Characters of a stored result included in the preview
+        },
+        "toolResultEncodingSettings": {
+            "enabled": False,  # Rewrite JSON tool results compactly before sending them to the model
+            "tabular": True,  # Write arrays of records as a header line plus one row per record
+            "dropNulls": True,  # Leave out null fields
+            "minRows": 2,  # Smallest array of records written as a table
+        },
+        "circuitBreakerSettings": {
+            "enabled": True,  # Reject calls to servers that keep failing instead of waiting on them
+            "windowSize": DEFAULT_CIRCUIT_BREAKER_WINDOW,  # Number of recent calls per server to evaluate
+            "failureRateThreshold": DEFAULT_CIRCUIT_BREAKER_FAILURE_RATE,  # Failure rate (0-1) that opens the breaker
+            "minimumCalls": DEFAULT_CIRCUIT_BREAKER_MIN_CALLS,  # Calls required before the failure rate is evaluated
+            "slowCallSeconds": DEFAULT_CIRCUIT_BREAKER_SLOW_CALL_SECONDS,  # Calls slower than this count as failures (None to ignore latency)
+            "openSeconds": DEFAULT_CIRCUIT_BREAKER_OPEN_SECONDS,  # Seconds before a probe call is let through
+        },
+        "serverStartupSettings": {
+            "connectConcurrency": DEFAULT_SERVER_CONNECT_CONCURRENCY,  # Servers connected at the same time
+            "connectTimeout": DEFAULT_SERVER_CONNECT_TIMEOUT,  # Seconds a server may take to connect (None for no limit)
+            "checkConnectivity": True,  # Probe remote server URLs before connecting and skip unreachable ones
+            "connectivityTimeout": DEFAULT_CONNECTIVITY_TIMEOUT,  # Seconds to wait for a probe response
+            "cacheToolCatalog": True,  # Offer cached tool lists at startup and connect those servers in the background
+            "idleTimeout": DEFAULT_LAZY_SERVER_IDLE_TIMEOUT,  # Seconds before an unused lazy server is stopped (None to keep it running)
+        },
+        "serverRestartSettings": {
+            "enabled": True,  # Restart servers whose process exits or whose connection closes
+            "initialDelay": DEFAULT_SERVER_RESTART_INITIAL_DELAY,  # Seconds before the first attempt, doubled after each failure
+            "maxDelay": DEFAULT_SERVER_RESTART_MAX_DELAY,  # Longest wait between attempts
+            "maxAttempts": DEFAULT_SERVER_RESTART_MAX_ATTEMPTS,  # Failed attempts in a row before giving up (None for no limit)
+        },
+        "httpClientSettings": {
+            "http2": True,  # Use HTTP/2 where the server supports it (needs the 'h2' package)
+            "maxConnections": DEFAULT_HTTP_MAX_CONNECTIONS,  # Connections open at once across all remote servers
+            "maxKeepaliveConnections": DEFAULT_HTTP_MAX_KEEPALIVE_CONNECTIONS,  # Idle connections kept for reuse
+            "keepaliveExpiry": DEFAULT_HTTP_KEEPALIVE_EXPIRY,  # Seconds an idle connection stays open
+        },
+        "serverHealthSettings": {
+            "enabled": True,  # Ping connected servers in the background to track their health
+            "interval": DEFAULT_HEALTH_CHECK_INTERVAL,  # Seconds between pings, also keeps idle HTTP sessions open
+            "timeout": DEFAULT_HEALTH_CHECK_TIMEOUT,  # Seconds to wait for a ping response
+            "degradedLatencyMs": DEFAULT_HEALTH_DEGRADED_LATENCY_MS,  # p95 ping latency above which a server is degraded
+            "downAfterFailures": DEFAULT_HEALTH_DOWN_AFTER_FAILURES,  # Failed pings in a row before a server is down
+        },
     }
 
 
@@ -364,6 +364,82 @@ class ConfigManager:
                     config_data["hilSettings"]["enabled"]
                 )
 
+        if "toolExecutionSettings" in config_data and isinstance(
+            config_data["toolExecutionSettings"], dict
+        ):
+            self._validate_settings_section(
+                validated["toolExecutionSettings"], config_data["toolExecutionSettings"]
+            )
+
+        if "agentLoopSettings" in config_data and isinstance(
+            config_data["agentLoopSettings"], dict
+        ):
+            self._validate_settings_section(
+                validated["agentLoopSettings"], config_data["agentLoopSettings"]
+            )
+
+        if "toolCacheSettings" in config_data and isinstance(
+            config_data["toolCacheSettings"], dict
+        ):
+            self._validate_settings_section(
+                validated["toolCacheSettings"], config_data["toolCacheSettings"]
+            )
+
+        if "toolOutputSettings" in config_data and isinstance(
+            config_data["toolOutputSettings"], dict
+        ):
+            self._validate_settings_section(
+                validated["toolOutputSettings"], config_data["toolOutputSettings"]
+            )
+
+        if "toolResultEncodingSettings" in config_data and isinstance(
+            config_data["toolResultEncodingSettings"], dict
+        ):
+            self._validate_settings_section(
+                validated["toolResultEncodingSettings"],
+                config_data["toolResultEncodingSettings"],
+            )
+
+        if "circuitBreakerSettings" in config_data and isinstance(
+            config_data["circuitBreakerSettings"], dict
+        ):
+            self._validate_settings_section(
+                validated["circuitBreakerSettings"],
+                config_data["circuitBreakerSettings"],
+            )
+
+        if "serverStartupSettings" in config_data and isinstance(
+            config_data["serverStartupSettings"], dict
+        ):
+            self._validate_settings_section(
+                validated["serverStartupSettings"],
+                config_data["serverStartupSettings"],
+            )
+
+        if "serverRestartSettings" in config_data and isinstance(
+            config_data["serverRestartSettings"], dict
+        ):
+            self._validate_settings_section(
+                validated["serverRestartSettings"],
+                config_data["serverRestartSettings"],
+            )
+
+        if "httpClientSettings" in config_data and isinstance(
+            config_data["httpClientSettings"], dict
+        ):
+            self._validate_settings_section(
+                validated["httpClientSettings"],
+                config_data["httpClientSettings"],
+            )
+
+        if "serverHealthSettings" in config_data and isinstance(
+            config_data["serverHealthSettings"], dict
+        ):
+            self._validate_settings_section(
+                validated["serverHealthSettings"],
+                config_data["serverHealthSettings"],
+            )
+
         if "installed_servers" in config_data and isinstance(
             config_data["installed_servers"], list
         ):
@@ -388,6 +464,32 @@ class ConfigManager:
 
         return validated
 
+    def _validate_settings_section(
+        self, defaults: Dict[str, Any], loaded: Dict[str, Any]
+    ) -> None:
+        """Copy valid values from a loaded settings section onto its defaults.
+
+        A loaded value is kept when it has the same kind as the default value
+        (bool, number, string, dict or list). Defaults of None accept any value.
+
+        Args:
+            defaults: Default settings section, updated in place.
+            loaded: Settings section read from the configuration file.
+        """
+        for key, default_value in defaults.items():
+            if key not in loaded:
+                continue
+            value = loaded[key]
+            if default_value is None or value is None:
+                defaults[key] = value
+            elif isinstance(default_value, bool):
+                defaults[key] = bool(value)
+            elif isinstance(default_value, (int, float)):
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    defaults[key] = value
+            elif isinstance(value, type(default_value)):
+                defaults[key] = value
+
     def get_installed_servers(self, config_name: Optional[str] = None) -> List[Dict[str, Any]]:
         """Get the list of installed servers.
 
@@ -0,0 +1,137 @@
+"""Model capability caching for MCP Client for Ollama.
+
+This module caches the metadata returned by ``ollama.show()`` so that
+capability checks (thinking, tools, vision, context length) do not cost a
+round-trip to Ollama on every prompt and query.
+"""
+
+import time
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from ..utils.constants import MODEL_INFO_CACHE_TTL, MODEL_INFO_FAILURE_TTL
+
+
+class ModelCapabilityCache:
+    """Caches model metadata and capabilities keyed by model name and digest.
+
+    Entries expire after a TTL; failed lookups are remembered for a shorter
+    one, so a model that cannot be shown is not retried on every check. When a digest is known for a model (recorded
+    from ``ollama.list()``), it is part of the cache key, so a re-pulled model
+    with a new digest never reuses stale metadata.
+    """
+
+    def __init__(
+        self,
+        ollama: Any,
+        ttl: float = MODEL_INFO_CACHE_TTL,
+        failure_ttl: float = MODEL_INFO_FAILURE_TTL,
+    ):
+        """Initialize the ModelCapabilityCache.
+
+        Args:
+            ollama: Ollama async client used to fetch model metadata
+            ttl: Number of seconds a cached entry stays valid
+            failure_ttl: Number of seconds a failed lookup is remembered
+        """
+        self.ollama = ollama
+        self.ttl = ttl
+        self.failure_ttl = failure_ttl
+        self._entries: Dict[Tuple[str, Optional[str]], Dict[str, Any]] = {}
+        self._digests: Dict[str, str] = {}
+
+    def record_digests(self, models: Iterable[Dict[str, Any]]) -> None:
+        """Record model digests from an ``ollama.list()`` response.
+
+        Args:
+            models: Model metadata entries, each with a name and a digest
+        """
+        for model in models or []:
+            name = model.get("model") or model.get("name")
+            digest = model.get("digest")
+            if name and digest:
+                self._digests[name] = digest
+
+    def _key(self, model: str) -> Tuple[str, Optional[str]]:
+        """Build the cache key for a model."""
+        return (model, self._digests.get(model))
+
+    def peek(self, model: str) -> Optional[Dict[str, Any]]:
+        """Return the cached entry for a model without fetching it.
+
+        Args:
+            model: Model name
+
+        Returns:
+            The cached model info, or None if missing or expired
+        """
+        entry = self._entries.get(self._key(model))
+        if entry is None:
+            return None
+        ttl = self.failure_ttl if entry.get("failed") else self.ttl
+        if time.monotonic() - entry["fetched_at"] > ttl:
+            return None
+        return entry
+
+    async def get(self, model: str) -> Dict[str, Any]:
+        """Get the model info for a model, fetching it from Ollama on a cache miss.
+
+        Args:
+            model: Model name
+
+        Returns:
+            Dict with 'capabilities' (list of str) and 'context_length' (int or None).
+            Failed lookups return empty info, cached for the failure TTL.
+        """
+        entry = self.peek(model)
+        if entry is not None:
+            return entry
+
+        try:
+            model_info = await self.ollama.show(model)
+        except Exception:
+            # If we can't determine capabilities, report none until the failure expires
+            entry = {
+                "capabilities": [],
+                "context_length": None,
+                "fetched_at": time.monotonic(),
+                "failed": True,
+            }
+        else:
+            entry = {
+                "capabilities": list(model_info.get("capabilities") or []),
+                "context_length": self._extract_context_length(model_info),
+                "fetched_at": time.monotonic(),
+            }
+        self._entries[self._key(model)] = entry
+        return entry
+
+    def invalidate(self, model: Optional[str] = None) -> None:
+        """Drop cached entries.
+
+        Args:
+            model: Model name to invalidate, or None to clear the whole cache
+        """
+        if model is None:
+            self._entries.clear()
+            return
+        for key in [key for key in self._entries if key[0] == model]:
+            del self._entries[key]
+
+    @staticmethod
+    def _extract_context_length(model_info: Any) -> Optional[int]:
+        """Extract the model's context length from ``ollama.show()`` output.
+
+        Args:
+            model_info: Response from ``ollama.show()``
+
+        Returns:
+            The context length in tokens, or None if not reported
+        """
+        modelinfo = model_info.get("modelinfo") or {}
+        architecture = modelinfo.get("general.architecture")
+        if architecture and f"{architecture}.context_length" in modelinfo:
+            return modelinfo[f"{architecture}.context_length"]
+        for key, value in modelinfo.items():
+            if key.endswith(".context_length"):
+                return value
+        return None
@@ -9,6 +9,7 @@ from rich.panel import Panel
 from rich.text import Text
 from rich.prompt import Prompt
 from ..utils.constants import DEFAULT_MODEL
+from .capabilities import ModelCapabilityCache
 
 
 class ModelManager:
@@ -29,10 +30,12 @@ class ModelManager:
         Args:
             console: Rich console for output (optional)
             default_model: Default model to use if none is specified
+            ollama: Ollama async client (optional)
         """
         self.console = console or Console()
         self.model = default_model
         self.ollama = ollama
+        self.capability_cache = ModelCapabilityCache(ollama)
 
     async def check_ollama_running(self) -> bool:
         """Check if Ollama is running by making a request to its API.
@@ -57,6 +60,8 @@ class ModelManager:
             result = await self.ollama.list()
             if result:
                 models = result.get("models", [])
+                # Remember digests so re-pulled models don't reuse stale metadata
+                self.capability_cache.record_digests(models)
                 return models
         except Exception as e:
             self.console.print(f"[red]Error getting models from Ollama: {str(e)}[/red]")
@@ -77,6 +82,46 @@ class ModelManager:
             model_name: Name of the model to set as current
         """
         self.model = model_name
+        self.capability_cache.invalidate()
+
+    async def get_model_info(self, model_name: Optional[str] = None) -> Dict[str, Any]:
+        """Get cached metadata for a model, fetching it from Ollama if needed.
+
+        Args:
+            model_name: Model to look up (defaults to the current model)
+
+        Returns:
+            Dict[str, Any]: Model info with 'capabilities' and 'context_length'
+        """
+        return await self.capability_cache.get(model_name or self.model)
+
+    def get_cached_model_info(
+        self, model_name: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Get cached metadata for a model without contacting Ollama.
+
+        Args:
+            model_name: Model to look up (defaults to the current model)
+
+        Returns:
+            Optional[Dict[str, Any]]: Model info, or None if not cached
+        """
+        return self.capability_cache.peek(model_name or self.model)
+
+    async def supports_capability(
+        self, capability: str, model_name: Optional[str] = None
+    ) -> bool:
+        """Check whether a model reports a capability such as 'thinking', 'tools' or 'vision'.
+
+        Args:
+            capability: Capability name as reported by ollama.show()
+            model_name: Model to check (defaults to the current model)
+
+        Returns:
+            bool: True if the model reports the capability, False otherwise
+        """
+        model_info = await self.get_model_info(model_name)
+        return capability in model_info["capabilities"]
 
     def display_current_model(self) -> None:
         """Display the currently selected model in the console."""
@@ -238,7 +283,7 @@ class ModelManager:
 
             if selection in ["s", "save"]:
                 # Save the selected model as current model
-                self.model = selected_model
+                self.set_model(selected_model)
 
                 # Auto-save the configuration after model change
                 # We'll need access to the client to do this...
@@ -0,0 +1,122 @@
+"""Persistent tool catalog cache for MCP Client for Ollama.
+
+This module stores the tool list of each MCP server on disk, so the next
+launch can offer the tools immediately while the live connection is still
+being set up.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from typing import Any, Dict, List, Optional
+
+from ..utils.constants import DEFAULT_CATALOG_CACHE_DIR
+
+# Server settings that do not affect which tools a server provides
+_NON_CATALOG_KEYS = {
+    "api_key",
+    "maxInFlight",
+    "requestsPerSecond",
+    "toolTimeout",
+    "lazy",
+    "idleTimeout",
+}
+
+
+class ToolCatalogCache:
+    """Tool lists of MCP servers, stored per server configuration.
+
+    Entries are keyed by a hash of the server's connection settings (command,
+    arguments, environment, URL, ...), so changing how a server is launched
+    starts from a fresh catalog. Each entry also records the version the
+    server reported, for comparison when the live session comes up.
+    """
+
+    def __init__(self, directory: str = DEFAULT_CATALOG_CACHE_DIR):
+        """Initialize the ToolCatalogCache.
+
+        Args:
+            directory: Directory holding the cached catalogs
+        """
+        self.directory = directory
+
+    @staticmethod
+    def make_key(server: Dict[str, Any]) -> str:
+        """Build the cache key for a server configuration.
+
+        Args:
+            server: Server configuration dictionary
+
+        Returns:
+            str: Hex digest identifying the server's connection settings
+        """
+        connection = {
+            key: value for key, value in server.items() if key not in _NON_CATALOG_KEYS
+        }
+        if isinstance(connection.get("config"), dict):
+            # Raw mcpServers entries carry the same settings
+            connection["config"] = {
+                key: value
+                for key, value in connection["config"].items()
+                if key not in _NON_CATALOG_KEYS
+            }
+        canonical = json.dumps(connection, sort_keys=True, default=str)
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:32]
+
+    def _path(self, server: Dict[str, Any]) -> str:
+        """Get the file path of a server's cached catalog."""
+        return os.path.join(self.directory, f"{self.make_key(server)}.json")
+
+    def load(self, server: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Load the cached catalog of a server.
+
+        Args:
+            server: Server configuration dictionary
+
+        Returns:
+            Dict with 'server_version' and 'tools' (raw tool dicts as listed by
+            the server), or None if nothing usable is cached
+        """
+        try:
+            with open(self._path(server), "r") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(entry, dict) or not isinstance(entry.get("tools"), list):
+            return None
+        return entry
+
+    def save(
+        self,
+        server: Dict[str, Any],
+        server_version: Optional[str],
+        tools: List[Dict[str, Any]],
+    ) -> None:
+        """Store the catalog of a server, skipping the write if it is unchanged.
+
+        Args:
+            server: Server configuration dictionary
+            server_version: Version reported by the server, if any
+            tools: Raw tool dicts as listed by the server
+        """
+        entry = {"name": server.get("name"), "server_version": server_version, "tools": tools}
+        data = json.dumps(entry, sort_keys=True)
+        path = self._path(server)
+        try:
+            with open(path, "r") as f:
+                if f.read() == data:
+                    return
+        except OSError:
+            pass
+
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            # Write atomically so a concurrent launch never reads a partial file
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError:
+            # The cache is only an optimization; startup just stays slower
+            pass
@@ -0,0 +1,191 @@
+"""Circuit breakers for MCP servers in MCP Client for Ollama.
+
+This module tracks the recent health of each MCP server so that calls to a
+server that keeps failing or timing out are rejected immediately instead of
+waiting for it again.
+"""
+
+import time
+from collections import deque
+from typing import Any, Dict, Optional
+
+from ..utils.constants import (
+    DEFAULT_CIRCUIT_BREAKER_WINDOW,
+    DEFAULT_CIRCUIT_BREAKER_FAILURE_RATE,
+    DEFAULT_CIRCUIT_BREAKER_MIN_CALLS,
+    DEFAULT_CIRCUIT_BREAKER_SLOW_CALL_SECONDS,
+    DEFAULT_CIRCUIT_BREAKER_OPEN_SECONDS,
+)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half-open"
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is rejected because the server's breaker is open."""
+
+    def __init__(self, server_name: str, retry_in: float):
+        self.server_name = server_name
+        self.retry_in = retry_in
+        super().__init__(
+            f"Server '{server_name}' is temporarily unavailable after repeated failures "
+            f"or timeouts. The call was not sent; it may be retried in about "
+            f"{max(1, round(retry_in))}s. Consider using a different tool meanwhile."
+        )
+
+
+class CircuitBreaker:
+    """Circuit breaker driven by the error rate and latency of recent calls.
+
+    The breaker records the outcome of the last 'window_size' calls. A call
+    fails if it raises, and it also counts as a failure if it takes longer
+    than 'slow_call_seconds'. Once at least 'minimum_calls' outcomes are
+    recorded and the failure rate reaches 'failure_rate_threshold', the
+    breaker opens. It stays open for 'open_seconds' and then goes half-open,
+    which lets a single probe call through: success closes the breaker and
+    failure opens it again.
+    """
+
+    def __init__(
+        self,
+        window_size: int = DEFAULT_CIRCUIT_BREAKER_WINDOW,
+        failure_rate_threshold: float = DEFAULT_CIRCUIT_BREAKER_FAILURE_RATE,
+        minimum_calls: int = DEFAULT_CIRCUIT_BREAKER_MIN_CALLS,
+        slow_call_seconds: Optional[float] = DEFAULT_CIRCUIT_BREAKER_SLOW_CALL_SECONDS,
+        open_seconds: float = DEFAULT_CIRCUIT_BREAKER_OPEN_SECONDS,
+    ):
+        """Initialize the CircuitBreaker.
+
+        Args:
+            window_size: Number of recent call outcomes to consider
+            failure_rate_threshold: Failure rate (0-1) at which the breaker opens
+            minimum_calls: Outcomes required before the failure rate is evaluated
+            slow_call_seconds: Latency above which a call counts as failed (None to ignore latency)
+            open_seconds: Seconds to stay open before allowing a probe call
+        """
+        self.window_size = window_size
+        self.failure_rate_threshold = failure_rate_threshold
+        self.minimum_calls = minimum_calls
+        self.slow_call_seconds = slow_call_seconds
+        self.open_seconds = open_seconds
+        self.state = CLOSED
+        self._outcomes = deque(maxlen=window_size)  # True for failed calls
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+
+    def _retry_in(self) -> float:
+        """Seconds until an open breaker allows a probe call."""
+        return max(0.0, self._opened_at + self.open_seconds - time.monotonic())
+
+    def allow_request(self) -> bool:
+        """Check whether a call may be sent now.
+
+        Returns:
+            bool: False if the call should be rejected without contacting the server
+        """
+        if self.state == OPEN and self._retry_in() <= 0:
+            self.state = HALF_OPEN
+            self._probe_in_flight = False
+        if self.state == CLOSED:
+            return True
+        if self.state == HALF_OPEN and not self._probe_in_flight:
+            self._probe_in_flight = True
+            return True
+        return False
+
+    def check(self, server_name: str) -> None:
+        """Raise CircuitOpenError if a call to the server must be rejected.
+
+        Args:
+            server_name: Name of the MCP server, used in the error message
+        """
+        if not self.allow_request():
+            raise CircuitOpenError(server_name, self._retry_in())
+
+    def record_success(self, latency: float) -> None:
+        """Record a completed call.
+
+        Args:
+            latency: Call duration in seconds
+        """
+        slow = self.slow_call_seconds is not None and latency > self.slow_call_seconds
+        self._record(failed=slow)
+
+    def record_failure(self) -> None:
+        """Record a call that raised an error or timed out."""
+        self._record(failed=True)
+
+    def record_cancelled(self) -> None:
+        """Record a call that was cancelled or never reached the server.
+
+        The outcome says nothing about server health, so it is not counted,
+        but such a probe frees the half-open slot for the next call.
+        """
+        self._probe_in_flight = False
+
+    def _record(self, failed: bool) -> None:
+        """Record a call outcome and update the breaker state."""
+        if self.state == HALF_OPEN:
+            self._probe_in_flight = False
+            if failed:
+                self._open()
+            else:
+                self.state = CLOSED
+                self._outcomes.clear()
+            return
+
+        self._outcomes.append(failed)
+        if self.state == CLOSED and len(self._outcomes) >= self.minimum_calls:
+            failure_rate = sum(self._outcomes) / len(self._outcomes)
+            if failure_rate >= self.failure_rate_threshold:
+                self._open()
+
+    def _open(self) -> None:
+        """Move to the open state."""
+        self.state = OPEN
+        self._opened_at = time.monotonic()
+        self._outcomes.clear()
+
+    def get_status(self) -> Dict[str, Any]:
+        """Get the breaker state for display.
+
+        Returns:
+            Dict with 'state', 'failure_rate' (None with no outcomes) and
+            'retry_in' (seconds, only while open)
+        """
+        if self.state == OPEN and self._retry_in() <= 0:
+            self.state = HALF_OPEN
+            self._probe_in_flight = False
+        failure_rate = (
+            sum(self._outcomes) / len(self._outcomes) if self._outcomes else None
+        )
+        return {
+            "state": self.state,
+            "failure_rate": failure_rate,
+            "retry_in": self._retry_in() if self.state == OPEN else None,
+        }
+
+    @classmethod
+    def from_settings(cls, settings: Dict[str, Any]) -> "CircuitBreaker":
+        """Create a breaker from a circuitBreakerSettings configuration section.
+
+        Args:
+            settings: Dict with circuit breaker settings
+
+        Returns:
+            A new CircuitBreaker
+        """
+        return cls(
+            window_size=max(1, settings.get("windowSize") or DEFAULT_CIRCUIT_BREAKER_WINDOW),
+            failure_rate_threshold=settings.get(
+                "failureRateThreshold", DEFAULT_CIRCUIT_BREAKER_FAILURE_RATE
+            ),
+            minimum_calls=max(
+                1, settings.get("minimumCalls") or DEFAULT_CIRCUIT_BREAKER_MIN_CALLS
+            ),
+            slow_call_seconds=settings.get(
+                "slowCallSeconds", DEFAULT_CIRCUIT_BREAKER_SLOW_CALL_SECONDS
+            ),
+            open_seconds=settings.get("openSeconds", DEFAULT_CIRCUIT_BREAKER_OPEN_SECONDS),
+        )
@@ -4,10 +4,12 @@ This module handles connections to one or more MCP servers, including setup,
 initialization, and communication.
 """
 
+import asyncio
 import os
 import shutil
-from contextlib import AsyncExitStack
-from typing import Dict, List, Any, Optional, Tuple
+import time
+from contextlib import AsyncExitStack, contextmanager, nullcontext
+from typing import Callable, Dict, List, Any, Optional, Tuple
 from rich.console import Console
 from rich.panel import Panel
 from mcp import ClientSession, Tool
@@ -22,9 +24,26 @@ from .discovery import (
     auto_discover_servers,
 )
 from .auth import AuthProviderFactory
-from ..utils.constants import MCP_PROTOCOL_VERSION
-from ..utils.connection import check_url_connectivity
+from .limits import parse_server_limits
+from .circuit_breaker import CircuitBreaker
+from .schema_validation import compile_validator, validate_arguments
+from .catalog_cache import ToolCatalogCache
+from .supervisor import MonitoredStream, restart_delay
+from .http_pool import HttpClientPool
+from .health import ServerHealth, DOWN
+from ..utils.constants import (
+    MCP_PROTOCOL_VERSION,
+    DEFAULT_SERVER_CONNECT_CONCURRENCY,
+    DEFAULT_CONNECTIVITY_TIMEOUT,
+    DEFAULT_LAZY_SERVER_IDLE_TIMEOUT,
+    DEFAULT_SERVER_RESTART_MAX_DELAY,
+    DEFAULT_HEALTH_CHECK_INTERVAL,
+    DEFAULT_HEALTH_CHECK_TIMEOUT,
+    DEFAULT_HEALTH_DOWN_AFTER_FAILURES,
+)
+from ..utils.connection import check_urls_connectivity
 from ..config.manager import ConfigManager
+from ..config.defaults import default_config
 
 
 class ServerConnector:
@@ -55,6 +74,33 @@ class ServerConnector:
         self.available_tools = []  # List to store all available tools
         self.enabled_tools = {}  # Dict to store tool enabled status
         self.session_ids = {}  # Dict to store session IDs for HTTP connections
+        self.server_limits = {}  # Dict to store per-server request limits
+        self.circuit_breakers = {}  # Dict to store per-server circuit breakers
+        self.tool_validators = {}  # Dict to store compiled argument validators by tool name
+        self.server_runners = {}  # Dict to store the task and stop event owning each connection
+        self.cached_catalogs = {}  # Dict to store cached tools of servers still connecting
+        self.pending_connections = {}  # Dict to store background connection tasks by server name
+        self.catalog_cache = ToolCatalogCache()
+        self.on_tools_changed = None  # Called when background connections change the tools
+        self.on_server_reset = None  # Called with a server name when its session is replaced or removed
+        self.lazy_servers = {}  # Dict to store configurations of servers started on first use
+        self.idle_monitors = {}  # Dict to store the tasks stopping idle lazy servers
+        self.server_configs = {}  # Dict to store the configuration each server was started with
+        self.calls_in_flight = {}  # Dict to store the number of running calls per server
+        self.last_used = {}  # Dict to store when each server last finished a call
+        self.server_health = {}  # Dict to store ping latency and failures per server
+        self.health_monitor = None  # Task pinging the connected servers
+        self.startup_settings = default_config()["serverStartupSettings"]
+        self._startup_settings_overridden = False  # Set once a loaded configuration applies its own
+        self.circuit_breaker_settings = default_config()["circuitBreakerSettings"]
+        self.restart_settings = default_config()["serverRestartSettings"]
+        self.health_settings = default_config()["serverHealthSettings"]
+        self.http_pool = HttpClientPool()  # Shared by all remote servers, kept across reloads
+        # Background connections, idle monitors and the health monitor end with the
+        # connections; the exit stack runs callbacks in reverse, so they are cancelled
+        # first and no connection finishing meanwhile can leave a runner behind
+        self.exit_stack.push_async_callback(self._stop_all_servers)
+        self.exit_stack.push_async_callback(self._cancel_background_tasks)
 
     async def connect_to_servers(
         self,
@@ -74,11 +120,150 @@ class ServerConnector:
         Returns:
             Tuple of (sessions, available_tools, enabled_tools)
         """
+        all_servers = self._collect_servers(
+            server_paths, server_urls, config_path, auto_discovery
+        )
+        if not all_servers:
+            return self.sessions, self.available_tools, self.enabled_tools
+
+        await self._connect_servers(all_servers)
+
+        if not self.sessions and not self.cached_catalogs:
+            self.console.print(
+                Panel(
+                    "[bold red]Could not connect to any MCP servers![/bold red]\n"
+                    "Check that server paths exist and are accessible.",
+                    title="Error",
+                    border_style="red",
+                    expand=False,
+                )
+            )
+
+        return self.sessions, self.available_tools, self.enabled_tools
+
+    async def reload_servers(
+        self,
+        server_paths=None,
+        server_urls=None,
+        config_path=None,
+        auto_discovery=False,
+    ) -> Tuple[dict, list, dict]:
+        """Apply a changed server set, reconnecting only what changed
+
+        Servers whose configuration is unchanged keep their sessions and the
+        enabled state of their tools. Removed servers are stopped, and changed
+        servers are stopped and started again with their new configuration.
+
+        Args:
+            server_paths: List of paths to server scripts (.py or .js)
+            server_urls: List of URLs for SSE or Streamable HTTP servers
+            config_path: Path to JSON config file with server configurations
+            auto_discovery: Whether to automatically discover servers
+
+        Returns:
+            Tuple of (sessions, available_tools, enabled_tools)
+        """
+        all_servers = self._collect_servers(
+            server_paths, server_urls, config_path, auto_discovery
+        )
+        new_configs = {server["name"]: server for server in all_servers}
+
+        for server_name, config in list(self.server_configs.items()):
+            if server_name not in new_configs:
+                self.console.print(f"[cyan]Stopping removed server: {server_name}[/cyan]")
+                await self._remove_server(server_name)
+            elif new_configs[server_name] != config:
+                self.console.print(
+                    f"[cyan]Restarting server with changed configuration: {server_name}[/cyan]"
+                )
+                await self._remove_server(server_name)
+
+        # Servers that failed to connect last time are retried as well
+        changed_servers = [
+            server for server in all_servers if not self.has_server(server["name"])
+        ]
+        unchanged = len(all_servers) - len(changed_servers)
+        if unchanged:
+            self.console.print(
+                f"[cyan]Keeping {unchanged} unchanged server{'s' if unchanged != 1 else ''} connected[/cyan]"
+            )
+        await self._connect_servers(changed_servers)
+
+        # Keep tools and sessions in the configured server order
+        order = {server["name"]: index for index, server in enumerate(all_servers)}
+        self.available_tools.sort(
+            key=lambda tool: order.get(tool.name.split(".", 1)[0], len(order))
+        )
+        for server_name in sorted(self.sessions, key=lambda name: order.get(name, len(order))):
+            self.sessions[server_name] = self.sessions.pop(server_name)
+
+        return self.sessions, self.available_tools, self.enabled_tools
+
+    async def _remove_server(self, server_name: str) -> None:
+        """Stop a server and forget its tools and state
+
+        Args:
+            server_name: Name of the MCP server
+        """
+        task = self.pending_connections.pop(server_name, None)
+        if task is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+        await self._stop_server(server_name)
+
+        for state in (
+            self.server_configs,
+            self.sessions,
+            self.session_ids,
+            self.server_limits,
+            self.circuit_breakers,
+            self.server_health,
+            self.cached_catalogs,
+            self.lazy_servers,
+            self.calls_in_flight,
+            self.last_used,
+        ):
+            state.pop(server_name, None)
+        if self.on_server_reset:
+            self.on_server_reset(server_name)
+
+        prefix = f"{server_name}."
+        self.available_tools[:] = [
+            tool for tool in self.available_tools if not tool.name.startswith(prefix)
+        ]
+        for tool_name in [name for name in self.enabled_tools if name.startswith(prefix)]:
+            del self.enabled_tools[tool_name]
+        for tool_name in [name for name in self.tool_validators if name.startswith(prefix)]:
+            del self.tool_validators[tool_name]
+
+    def _collect_servers(
+        self,
+        server_paths=None,
+        server_urls=None,
+        config_path=None,
+        auto_discovery=False,
+    ) -> List[Dict[str, Any]]:
+        """Gather the configurations of all servers to connect to
+
+        Args:
+            server_paths: List of paths to server scripts (.py or .js)
+            server_urls: List of URLs for SSE or Streamable HTTP servers
+            config_path: Path to JSON config file with server configurations
+            auto_discovery: Whether to automatically discover servers
+
+        Returns:
+            List of server configurations, one per server name
+        """
         all_servers = []
 
-        # Load installed servers from config
+        # Load installed servers and startup settings from config
         if self.config_manager:
-            installed_servers = self.config_manager.get_installed_servers()
+            config_data = self.config_manager.load_configuration()
+            if not self._startup_settings_overridden:
+                self.startup_settings = config_data.get(
+                    "serverStartupSettings", self.startup_settings
+                )
+            installed_servers = config_data.get("installed_servers", [])
             for server in installed_servers:
                 if not server.get("enabled", True):
                     self.console.print(
@@ -104,11 +289,16 @@ class ServerConnector:
                 # The server object passed to _connect_to_server needs a 'name' and 'type'.
                 # The rest of the info can be in a 'config' sub-dictionary or at the top level.
                 # Let's match the structure that _connect_to_server expects.
-                api_key = self.config_manager.load_configuration().get("smithery_api_key") if self.config_manager else None
+                api_key = config_data.get("smithery_api_key")
                 server_obj = {
                     "name": server.get("qualifiedName"),
                     "config": server.get("config", {}),  # User-provided config
-                    "api_key": api_key  # Global Smithery API key for authentication
+                    "api_key": api_key,  # Global Smithery API key for authentication
+                    "maxInFlight": server.get("maxInFlight"),  # Optional request limits
+                    "requestsPerSecond": server.get("requestsPerSecond"),
+                    "toolTimeout": server.get("toolTimeout"),
+                    "lazy": server.get("lazy"),  # Start the server on first use
+                    "idleTimeout": server.get("idleTimeout"),
                 }
 
                 # For Smithery servers, default to streamable_http if no connection type is specified
@@ -197,6 +387,16 @@ class ServerConnector:
                 )
             all_servers.extend(discovered_servers)
 
+        # A later definition of a server name replaces an earlier one
+        servers_by_name = {}
+        for server in all_servers:
+            if server["name"] in servers_by_name:
+                self.console.print(
+                    f"[yellow]Warning: Server '{server['name']}' is defined more than once; using the last definition[/yellow]"
+                )
+            servers_by_name[server["name"]] = server
+        all_servers = list(servers_by_name.values())
+
         if not all_servers:
             self.console.print(
                 Panel(
@@ -207,9 +407,17 @@ class ServerConnector:
                     expand=False,
                 )
             )
-            return self.sessions, self.available_tools, self.enabled_tools
 
+        return all_servers
+
+    async def _connect_servers(self, all_servers: List[Dict[str, Any]]) -> None:
+        """Connect to servers and add their tools in the given server order
+
+        Args:
+            all_servers: Server configuration dictionaries
+        """
         # Check all servers url connectivity (skip connectivity check for Smithery servers)
+        reachable = await self._check_connectivity(all_servers)
         servers_to_connect = []
         skipped_servers = []
         for server in all_servers:
@@ -231,7 +439,7 @@ class ServerConnector:
                     )
                     skipped_servers.append(server_name)
                     continue
-                elif not check_url_connectivity(server_url):
+                elif not reachable.get(server_url, True):
                     self.console.print(
                         f"[yellow]Warning: Server '{server_name}' failed connectivity check[/yellow]"
                     )
@@ -261,38 +469,76 @@ class ServerConnector:
                 "[yellow]Check server URLs and ensure servers are accessible.[/yellow]"
             )
 
-        # Connect to each server
+        # Servers with a cached tool catalog are offered right away and
+        # connected in the background, or on first use if they are lazy. The
+        # others are waited for.
+        semaphore = self._connect_semaphore()
+        registered = asyncio.Event()
+        live_servers = []
         for server in all_servers:
-            await self._connect_to_server(server)
-
-        if not self.sessions:
-            self.console.print(
-                Panel(
-                    "[bold red]Could not connect to any MCP servers![/bold red]\n"
-                    "Check that server paths exist and are accessible.",
-                    title="Error",
-                    border_style="red",
-                    expand=False,
+            server_name = server["name"]
+            self.server_configs[server_name] = server
+            if self._is_lazy(server):
+                self.lazy_servers[server_name] = server
+            if not self._load_cached_catalog(server):
+                live_servers.append(server)
+                continue
+            tool_count = len(self.cached_catalogs[server_name]["tools"])
+            if server_name in self.lazy_servers:
+                self.console.print(
+                    f"[cyan]Using cached tools for {server_name} ({tool_count} tools), starting it on first use[/cyan]"
                 )
+                continue
+            self.console.print(
+                f"[cyan]Using cached tools for {server_name} ({tool_count} tools), connecting in the background[/cyan]"
+            )
+            self.pending_connections[server_name] = asyncio.create_task(
+                self._connect_in_background(server, semaphore, registered)
             )
 
-        return self.sessions, self.available_tools, self.enabled_tools
-
-    async def _connect_to_server(self, server: Dict[str, Any]) -> bool:
+        # Connect to the other servers concurrently, then add all tools in the
+        # original server order so tool ordering does not depend on timing
+        await self._connect_concurrently(live_servers, semaphore)
+        for server in all_servers:
+            self._register_server_tools(server["name"])
+            if server["name"] in self.sessions:
+                # Move the session to the end to keep sessions in server order too
+                self.sessions[server["name"]] = self.sessions.pop(server["name"])
+                if server["name"] in self.lazy_servers:
+                    # Started at once to list its tools, so stop it when unused
+                    self._watch_idle(server["name"])
+        registered.set()
+        self._start_health_monitor()
+
+    async def _connect_to_server(
+        self,
+        server: Dict[str, Any],
+        exit_stack: Optional[AsyncExitStack] = None,
+        quiet: bool = False,
+    ) -> bool:
         """Connect to a single MCP server
 
+        The server's session and tools are registered in self.sessions only once
+        the connection is complete. Its tools are added to available_tools by
+        _register_server_tools().
+
         Args:
             server: Server configuration dictionary
+            exit_stack: Exit stack owning the connection (defaults to self.exit_stack)
+            quiet: Only report errors, for connections made in the background
 
         Returns:
             bool: True if connection was successful, False otherwise
         """
         server_name = server["name"]
-        self.console.print(f"[cyan]Connecting to server: {server_name}[/cyan]")
+        stack = exit_stack or self.exit_stack
+        if not quiet:
+            self.console.print(f"[cyan]Connecting to server: {server_name}[/cyan]")
 
         try:
             server_type = server.get("type", "script")
             session = None
+            session_id = None
 
             # Connect based on server type
             if server_type == "sse":
@@ -307,11 +553,16 @@ class ServerConnector:
                 headers = self._get_headers_from_server(server)
 
                 # Connect using SSE transport
-                sse_transport = await self.exit_stack.enter_async_context(
-                    sse_client(url, headers=headers)
+                sse_transport = await stack.enter_async_context(
+                    sse_client(
+                        url,
+                        headers=headers,
+                        httpx_client_factory=self.http_pool.create_client,
+                    )
                 )
                 read_stream, write_stream = sse_transport
-                session = await self.exit_stack.enter_async_context(
+                read_stream = MonitoredStream(read_stream)
+                session = await stack.enter_async_context(
                     ClientSession(read_stream, write_stream)
                 )
 
@@ -358,18 +609,24 @@ class ServerConnector:
 
                 # Use the streamablehttp_client for Streamable HTTP connections
                 # Authentication is handled through headers only
-                transport = await self.exit_stack.enter_async_context(
-                    streamablehttp_client(url, headers=headers, auth=auth_provider)
+                transport = await stack.enter_async_context(
+                    streamablehttp_client(
+                        url,
+                        headers=headers,
+                        auth=auth_provider,
+                        httpx_client_factory=self.http_pool.create_client,
+                    )
                 )
 
                 read_stream, write_stream, session_info = transport
-                session = await self.exit_stack.enter_async_context(
+                read_stream = MonitoredStream(read_stream)
+                session = await stack.enter_async_context(
                     ClientSession(read_stream, write_stream)
                 )
 
-                # Store session ID if provided
+                # Keep the session ID if provided
                 if hasattr(session_info, "session_id") and session_info.session_id:
-                    self.session_ids[server_name] = session_info.session_id
+                    session_id = session_info.session_id
 
             elif server_type == "script":
                 # Connect to script-based server using STDIO
@@ -377,11 +634,12 @@ class ServerConnector:
                 if server_params is None:
                     return False
 
-                stdio_transport = await self.exit_stack.enter_async_context(
+                stdio_transport = await stack.enter_async_context(
                     stdio_client(server_params)
                 )
                 read_stream, write_stream = stdio_transport
-                session = await self.exit_stack.enter_async_context(
+                read_stream = MonitoredStream(read_stream)
+                session = await stack.enter_async_context(
                     ClientSession(read_stream, write_stream)
                 )
 
@@ -391,50 +649,58 @@ class ServerConnector:
                 if server_params is None:
                     return False
 
-                stdio_transport = await self.exit_stack.enter_async_context(
+                stdio_transport = await stack.enter_async_context(
                     stdio_client(server_params)
                 )
                 read_stream, write_stream = stdio_transport
-                session = await self.exit_stack.enter_async_context(
+                read_stream = MonitoredStream(read_stream)
+                session = await stack.enter_async_context(
                     ClientSession(read_stream, write_stream)
                 )
 
             # Initialize the session
-            await session.initialize()
-
-            # Store the session
-            self.sessions[server_name] = {"session": session, "tools": []}
+            init_result = await session.initialize()
+            server_version = init_result.serverInfo.version
 
             # Get tools from this server
             response = await session.list_tools()
-
-            # Store and merge tools, prepending server name to avoid conflicts
-            server_tools = []
-            for tool in response.tools:
-                # Create a qualified name for the tool that includes the server
-                qualified_name = f"{server_name}.{tool.name}"
-                # Clone the tool but update the name
-                tool_copy = Tool(
-                    name=qualified_name,
-                    description=(
-                        f"[{server_name}] {tool.description}"
-                        if hasattr(tool, "description")
-                        else f"Tool from {server_name}"
-                    ),
-                    inputSchema=tool.inputSchema,
-                    outputSchema=(
-                        tool.outputSchema if hasattr(tool, "outputSchema") else None
-                    ),
+            server_tools, validators = self._qualify_tools(server_name, response.tools)
+
+            # Remember the catalog so the next launch can offer it right away
+            if self.startup_settings.get("cacheToolCatalog", True):
+                self.catalog_cache.save(
+                    server,
+                    server_version,
+                    [
+                        tool.model_dump(mode="json", by_alias=True, exclude_none=True)
+                        for tool in response.tools
+                    ],
                 )
-                server_tools.append(tool_copy)
-                self.enabled_tools[qualified_name] = True
-
-            self.sessions[server_name]["tools"] = server_tools
-            self.available_tools.extend(server_tools)
 
-            self.console.print(
-                f"[green]Successfully connected to {server_name} with {len(server_tools)} tools[/green]"
-            )
+            # Register the server only now, so a connection cancelled midway
+            # leaves no partial state behind
+            self.sessions[server_name] = {
+                "session": session,
+                "tools": server_tools,
+                "server_version": server_version,
+                # Set when the server process exits or the transport closes
+                "connection_closed": read_stream.closed,
+            }
+            self.server_limits[server_name] = parse_server_limits(server)
+            self.circuit_breakers.pop(server_name, None)  # Start with a closed breaker
+            self.server_health.pop(server_name, None)  # A new session starts healthy
+            if self.on_server_reset:
+                self.on_server_reset(server_name)
+            if session_id:
+                self.session_ids[server_name] = session_id
+            for tool in server_tools:
+                self.tool_validators.pop(tool.name, None)
+            self.tool_validators.update(validators)
+
+            if not quiet:
+                self.console.print(
+                    f"[green]Successfully connected to {server_name} with {len(server_tools)} tools[/green]"
+                )
             return True
 
         except FileNotFoundError as e:
@@ -473,6 +739,684 @@ class ServerConnector:
                 )
             return False
 
+    async def _check_connectivity(self, servers: List[Dict[str, Any]]) -> Dict[str, bool]:
+        """Probe the URLs of remote servers concurrently before connecting
+
+        Smithery servers are not probed. The check is skipped entirely when
+        'checkConnectivity' is disabled, leaving failures to the connection
+        attempt itself.
+
+        Args:
+            servers: Server configuration dictionaries
+
+        Returns:
+            Dict mapping each probed URL to whether it is reachable
+        """
+        if not self.startup_settings.get("checkConnectivity", True):
+            return {}
+        urls = []
+        for server in servers:
+            server_name = server.get("name", "")
+            is_smithery_server = server_name.startswith("@") and "/" in server_name
+            if (
+                server.get("type") in ["sse", "streamable_http"]
+                and server.get("url")
+                and not is_smithery_server
+            ):
+                urls.append(server["url"])
+        return await check_urls_connectivity(
+            urls,
+            timeout=self.startup_settings.get("connectivityTimeout")
+            or DEFAULT_CONNECTIVITY_TIMEOUT,
+            transport=self.http_pool.shared_transport,
+        )
+
+    def _connect_semaphore(self) -> asyncio.Semaphore:
+        """Create the semaphore limiting servers connected at the same time"""
+        return asyncio.Semaphore(
+            max(
+                1,
+                self.startup_settings.get("connectConcurrency")
+                or DEFAULT_SERVER_CONNECT_CONCURRENCY,
+            )
+        )
+
+    async def _connect_concurrently(
+        self,
+        servers: List[Dict[str, Any]],
+        semaphore: Optional[asyncio.Semaphore] = None,
+    ) -> None:
+        """Connect to servers concurrently within the startup limits
+
+        At most 'connectConcurrency' servers are connected at once, and a
+        server that takes longer than 'connectTimeout' seconds is abandoned
+        so it cannot hold up the others.
+
+        Args:
+            servers: Server configuration dictionaries
+            semaphore: Semaphore shared with other connections (optional)
+        """
+        timeout = self.startup_settings.get("connectTimeout") or None
+        semaphore = semaphore or self._connect_semaphore()
+
+        async def connect(server: Dict[str, Any]) -> bool:
+            async with semaphore:
+                return await self._start_server(server, timeout)
+
+        await asyncio.gather(*(connect(server) for server in servers))
+
+    def _load_cached_catalog(self, server: Dict[str, Any]) -> bool:
+        """Offer a server's tools from the catalog cache
+
+        Args:
+            server: Server configuration dictionary
+
+        Returns:
+            bool: True if a cached catalog was found and loaded
+        """
+        if not self.startup_settings.get("cacheToolCatalog", True):
+            return False
+        entry = self.catalog_cache.load(server)
+        if entry is None:
+            return False
+        try:
+            raw_tools = [Tool.model_validate(tool) for tool in entry["tools"]]
+        except ValueError:
+            # Written by an incompatible version, so connect normally
+            return False
+
+        server_name = server["name"]
+        server_tools, validators = self._qualify_tools(server_name, raw_tools)
+        self.cached_catalogs[server_name] = {
+            "tools": server_tools,
+            "server_version": entry.get("server_version"),
+        }
+        self.tool_validators.update(validators)
+        return True
+
+    async def _connect_in_background(
+        self,
+        server: Dict[str, Any],
+        semaphore: Optional[asyncio.Semaphore] = None,
+        registered: Optional[asyncio.Event] = None,
+    ) -> None:
+        """Connect to a server whose cached tools are already offered
+
+        Args:
+            server: Server configuration dictionary
+            semaphore: Semaphore shared with the other startup connections (optional)
+            registered: Event set once the startup tools have been registered (optional)
+        """
+        server_name = server["name"]
+        timeout = self.startup_settings.get("connectTimeout") or None
+        try:
+            async with semaphore or nullcontext():
+                await self._start_server(server, timeout, quiet=True)
+            if registered is not None:
+                await registered.wait()
+            self._reconcile_cached_catalog(server_name)
+            if server_name in self.lazy_servers and server_name in self.sessions:
+                self._watch_idle(server_name)
+        finally:
+            self.pending_connections.pop(server_name, None)
+
+    def _reconcile_cached_catalog(self, server_name: str) -> None:
+        """Replace a server's cached tools with the ones it lists live
+
+        Args:
+            server_name: Name of the MCP server
+        """
+        cached = self.cached_catalogs.pop(server_name, None)
+        if cached is None:
+            return
+        cached_tools = cached["tools"]
+        session_info = self.sessions.get(server_name)
+
+        if session_info is None:
+            live_tools = []
+            self.console.print(
+                f"[yellow]Warning: {server_name} is unavailable; its tools were removed[/yellow]"
+            )
+        else:
+            live_tools = session_info["tools"]
+            if session_info.get("server_version") != cached["server_version"]:
+                self.console.print(
+                    f"[cyan]{server_name} was updated to version {session_info.get('server_version')}[/cyan]"
+                )
+
+        if [tool.model_dump() for tool in live_tools] == [
+            tool.model_dump() for tool in cached_tools
+        ]:
+            return
+
+        # Swap the server's tools in place, keeping their position in the list
+        cached_names = {tool.name for tool in cached_tools}
+        live_names = {tool.name for tool in live_tools}
+        position = next(
+            (
+                index
+                for index, tool in enumerate(self.available_tools)
+                if tool.name in cached_names
+            ),
+            len(self.available_tools),
+        )
+        remaining = [
+            tool for tool in self.available_tools if tool.name not in cached_names
+        ]
+        self.available_tools[:] = remaining[:position] + live_tools + remaining[position:]
+
+        for name in cached_names - live_names:
+            self.enabled_tools.pop(name, None)
+            self.tool_validators.pop(name, None)
+        for name in live_names:
+            # Keep the choices made while the cached tools were offered
+            self.enabled_tools.setdefault(name, True)
+
+        if session_info is not None:
+            self.console.print(
+                f"[cyan]Tools of {server_name} changed since they were cached ({len(live_tools)} tools)[/cyan]"
+            )
+        if self.on_tools_changed:
+            self.on_tools_changed()
+
+    async def _cancel_background_tasks(self) -> None:
+        """Cancel background connections, idle monitors and the health monitor"""
+        tasks = list(self.pending_connections.values()) + list(
+            self.idle_monitors.values()
+        )
+        if self.health_monitor is not None:
+            tasks.append(self.health_monitor)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self.pending_connections.clear()
+        self.idle_monitors.clear()
+        self.health_monitor = None
+
+    def _start_health_monitor(self) -> None:
+        """Start pinging the connected servers in the background, once"""
+        if self.health_monitor is None or self.health_monitor.done():
+            self.health_monitor = asyncio.create_task(self._monitor_health())
+
+    async def _monitor_health(self) -> None:
+        """Ping every connected server at the configured interval
+
+        The regular traffic also keeps idle SSE and Streamable HTTP sessions
+        and their pooled connections from being closed for inactivity.
+        """
+        while True:
+            if self.health_settings.get("enabled", True):
+                await self.check_server_health()
+            interval = self.health_settings.get("interval") or DEFAULT_HEALTH_CHECK_INTERVAL
+            await asyncio.sleep(interval)
+
+    async def check_server_health(self) -> None:
+        """Ping every connected server once and record the results"""
+        sessions = [
+            (server_name, session_info["session"])
+            for server_name, session_info in self.sessions.items()
+        ]
+        await asyncio.gather(
+            *(self._ping_server(server_name, session) for server_name, session in sessions)
+        )
+
+    async def _ping_server(self, server_name: str, session: ClientSession) -> None:
+        """Send an MCP ping to a server and record its latency or failure
+
+        Args:
+            server_name: Name of the MCP server
+            session: Session of the server
+        """
+        timeout = self.health_settings.get("timeout") or DEFAULT_HEALTH_CHECK_TIMEOUT
+        started = time.monotonic()
+        try:
+            await asyncio.wait_for(session.send_ping(), timeout)
+            succeeded = True
+        except Exception:
+            succeeded = False
+        latency = time.monotonic() - started
+
+        # The server may have been stopped or restarted while the ping ran,
+        # and a closed connection is left to the supervisor
+        session_info = self.sessions.get(server_name)
+        if session_info is None or session_info["session"] is not session:
+            return
+        closed = session_info.get("connection_closed")
+        if not succeeded and closed is not None and closed.is_set():
+            return
+        health = self.server_health.get(server_name)
+        if health is None:
+            health = self.server_health[server_name] = ServerHealth(
+                degraded_latency_ms=self.health_settings.get("degradedLatencyMs"),
+                down_after_failures=self.health_settings.get("downAfterFailures")
+                or DEFAULT_HEALTH_DOWN_AFTER_FAILURES,
+            )
+        previous_state = health.state
+        if succeeded:
+            health.record_success(latency)
+        else:
+            health.record_failure()
+
+        if health.state == previous_state:
+            return
+        if health.state == DOWN:
+            self.console.print(
+                f"[red]Server {server_name} is not responding to pings[/red]"
+            )
+        elif previous_state == DOWN:
+            self.console.print(f"[green]Server {server_name} is responding again[/green]")
+
+    @staticmethod
+    def _get_server_option(server: Dict[str, Any], key: str) -> Any:
+        """Read a per-server option from the server dict or its raw config entry"""
+        value = server.get(key)
+        if value is None:
+            value = (server.get("config") or {}).get(key)
+        return value
+
+    def _is_lazy(self, server: Dict[str, Any]) -> bool:
+        """Check whether a server is started only when one of its tools is called
+
+        Only STDIO servers are started lazily, since remote servers cost
+        nothing to keep connected.
+
+        Args:
+            server: Server configuration dictionary
+
+        Returns:
+            bool: True if the server is configured as lazy
+        """
+        return server.get("type", "script") in ("script", "config") and bool(
+            self._get_server_option(server, "lazy")
+        )
+
+    def _watch_idle(self, server_name: str) -> None:
+        """Start stopping a lazy server once it has been unused for its idle timeout
+
+        Args:
+            server_name: Name of the MCP server
+        """
+        idle_timeout = self._get_server_option(
+            self.lazy_servers[server_name], "idleTimeout"
+        )
+        if idle_timeout is None:
+            idle_timeout = self.startup_settings.get(
+                "idleTimeout", DEFAULT_LAZY_SERVER_IDLE_TIMEOUT
+            )
+        if not idle_timeout or server_name in self.idle_monitors:
+            return
+        self.last_used[server_name] = time.monotonic()
+        self.idle_monitors[server_name] = asyncio.create_task(
+            self._stop_when_idle(server_name, idle_timeout)
+        )
+
+    async def _stop_when_idle(self, server_name: str, idle_timeout: float) -> None:
+        """Wait until a lazy server is idle, then stop it and keep its tools offered
+
+        Args:
+            server_name: Name of the MCP server
+            idle_timeout: Seconds without calls before the server is stopped
+        """
+        while True:
+            idle_for = time.monotonic() - self.last_used.get(server_name, 0)
+            if not self.calls_in_flight.get(server_name) and idle_for >= idle_timeout:
+                break
+            await asyncio.sleep(max(idle_timeout - idle_for, min(idle_timeout, 1.0)))
+        self.idle_monitors.pop(server_name, None)
+
+        if server_name not in self.sessions:
+            return
+        # Offer the tools from the catalog again until the next call restarts it
+        self._detach_session(server_name)
+        await self._stop_server(server_name)
+
+    @contextmanager
+    def server_in_use(self, server_name: str):
+        """Mark a server as busy, so it is not stopped for being idle
+
+        Args:
+            server_name: Name of the MCP server
+        """
+        self.calls_in_flight[server_name] = self.calls_in_flight.get(server_name, 0) + 1
+        try:
+            yield
+        finally:
+            self.calls_in_flight[server_name] -= 1
+            self.last_used[server_name] = time.monotonic()
+
+    async def _start_server(
+        self, server: Dict[str, Any], timeout: Optional[float], quiet: bool = False
+    ) -> bool:
+        """Connect to a server in its own long-lived task
+
+        The transport and session contexts of an MCP connection must be
+        entered and exited by the same task, so each server gets a runner task
+        that connects, then holds the connection open until the connector's
+        exit stack is closed.
+
+        Args:
+            server: Server configuration dictionary
+            timeout: Seconds to wait for the connection (None for no limit)
+            quiet: Only report errors, for connections made in the background
+
+        Returns:
+            bool: True if the server connected
+        """
+        server_name = server["name"]
+        connected = asyncio.get_running_loop().create_future()
+        stop = asyncio.Event()
+        runner = asyncio.create_task(self._run_server(server, connected, stop, quiet))
+
+        try:
+            await asyncio.wait(
+                {connected, runner}, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+            )
+        except BaseException:
+            runner.cancel()
+            raise
+
+        if not connected.done():
+            runner.cancel()
+            await asyncio.gather(runner, return_exceptions=True)
+            self.console.print(
+                f"[red]Error connecting to {server_name}: Timed out after {timeout:g} seconds[/red]"
+            )
+            return False
+        if not connected.result():
+            await asyncio.gather(runner, return_exceptions=True)
+            return False
+
+        self.server_runners[server_name] = (runner, stop)
+        return True
+
+    async def _run_server(
+        self,
+        server: Dict[str, Any],
+        connected: asyncio.Future,
+        stop: asyncio.Event,
+        quiet: bool = False,
+    ) -> None:
+        """Own a server connection from connecting until it is stopped
+
+        This task supervises the server: if its process exits or its
+        connection closes, the server is restarted with exponential backoff.
+        Calls made meanwhile wait for the restart, and the server's tools are
+        swapped for the restarted server's in one step.
+
+        Args:
+            server: Server configuration dictionary
+            connected: Future resolved with whether the connection succeeded
+            stop: Event that closes the connection when set
+            quiet: Only report errors, for connections made in the background
+        """
+        server_name = server["name"]
+
+        def on_restarted(ok: bool) -> None:
+            if ok:
+                self._finish_restart(server_name, True)
+
+        try:
+            outcome = await self._hold_connection(server, stop, quiet, connected.set_result)
+            attempt = 0
+            while outcome == "lost" and not stop.is_set():
+                if not self._begin_restart(server_name):
+                    return
+                while True:
+                    attempt += 1
+                    max_attempts = self.restart_settings.get("maxAttempts")
+                    if max_attempts and attempt > max_attempts:
+                        self.console.print(
+                            f"[red]Giving up on {server_name} after {max_attempts} failed restart attempts[/red]"
+                        )
+                        self._finish_restart(server_name, False)
+                        return
+                    delay = restart_delay(attempt, self.restart_settings)
+                    self.console.print(
+                        f"[yellow]Restarting {server_name} in {delay:g}s (attempt {attempt})[/yellow]"
+                    )
+                    try:
+                        await asyncio.wait_for(stop.wait(), delay)
+                        # Stopped while waiting, so there is nothing to restart
+                        self._resolve_restart(server_name, False)
+                        return
+                    except asyncio.TimeoutError:
+                        pass
+                    started_at = time.monotonic()
+                    outcome = await self._hold_connection(server, stop, True, on_restarted)
+                    if outcome != "failed":
+                        break
+                max_delay = (
+                    self.restart_settings.get("maxDelay") or DEFAULT_SERVER_RESTART_MAX_DELAY
+                )
+                if time.monotonic() - started_at >= max_delay:
+                    # The server stayed up for a while, so start over with a short delay
+                    attempt = 0
+        finally:
+            if not connected.done():
+                connected.set_result(False)
+
+    async def _hold_connection(
+        self,
+        server: Dict[str, Any],
+        stop: asyncio.Event,
+        quiet: bool,
+        on_connected: Callable[[bool], Any],
+    ) -> str:
+        """Connect to a server in its own exit stack and hold the connection
+
+        Args:
+            server: Server configuration dictionary
+            stop: Event that closes the connection when set
+            quiet: Only report errors, for connections made in the background
+            on_connected: Called with whether the connection succeeded
+
+        Returns:
+            str: 'failed' if the server did not connect, 'stopped' if the
+            connection was closed through 'stop', or 'lost' if it ended on its own
+        """
+        outcome = "failed"
+        try:
+            async with AsyncExitStack() as stack:
+                ok = await self._connect_to_server(server, stack, quiet=quiet)
+                on_connected(ok)
+                if ok:
+                    outcome = await self._wait_for_stop_or_loss(server["name"], stop)
+        except Exception:
+            # Errors while closing the transport are of no use at this point
+            pass
+        return outcome
+
+    async def _wait_for_stop_or_loss(self, server_name: str, stop: asyncio.Event) -> str:
+        """Wait until a connection is stopped or ends on its own
+
+        Args:
+            server_name: Name of the MCP server
+            stop: Event that closes the connection when set
+
+        Returns:
+            str: 'stopped' or 'lost'
+        """
+        waiters = [asyncio.ensure_future(stop.wait())]
+        closed = (self.sessions.get(server_name) or {}).get("connection_closed")
+        if closed is not None:
+            waiters.append(asyncio.ensure_future(closed.wait()))
+        try:
+            await asyncio.wait(waiters, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for waiter in waiters:
+                waiter.cancel()
+        return "stopped" if stop.is_set() else "lost"
+
+    def _begin_restart(self, server_name: str) -> bool:
+        """Take a server whose connection was lost out of service
+
+        Its tools stay offered while it restarts, and tool calls to it wait
+        for the restart. Lazy servers are not restarted, as the next call
+        starts them again anyway.
+
+        Args:
+            server_name: Name of the MCP server
+
+        Returns:
+            bool: True if the server should be restarted
+        """
+        self.console.print(f"[yellow]Warning: Connection to {server_name} was lost[/yellow]")
+        self._detach_session(server_name)
+        if server_name in self.lazy_servers:
+            return False
+        if not self.restart_settings.get("enabled", True):
+            self._reconcile_cached_catalog(server_name)
+            return False
+        self.pending_connections[server_name] = (
+            asyncio.get_running_loop().create_future()
+        )
+        return True
+
+    def _finish_restart(self, server_name: str, ok: bool) -> None:
+        """Bring a restarted server back into service, or drop its tools
+
+        Args:
+            server_name: Name of the MCP server
+            ok: Whether the server was restarted
+        """
+        self._reconcile_cached_catalog(server_name)
+        if ok:
+            self.console.print(f"[green]Restarted {server_name}[/green]")
+        self._resolve_restart(server_name, ok)
+
+    def _resolve_restart(self, server_name: str, ok: bool) -> None:
+        """Wake the tool calls waiting for a server to restart
+
+        Args:
+            server_name: Name of the MCP server
+            ok: Whether the server was restarted
+        """
+        restarted = self.pending_connections.pop(server_name, None)
+        if restarted is not None and not restarted.done():
+            restarted.set_result(ok)
+
+    def _detach_session(self, server_name: str) -> None:
+        """Remove a server's session, keeping its tools offered from the catalog
+
+        Args:
+            server_name: Name of the MCP server
+        """
+        session_info = self.sessions.pop(server_name, None)
+        if session_info is None:
+            return
+        self.cached_catalogs[server_name] = {
+            "tools": session_info["tools"],
+            "server_version": session_info.get("server_version"),
+        }
+        self.session_ids.pop(server_name, None)
+
+    async def _stop_server(self, server_name: str) -> None:
+        """Close a server connection and wait for its runner task to finish
+
+        Args:
+            server_name: Name of the MCP server
+        """
+        monitor = self.idle_monitors.pop(server_name, None)
+        if monitor is not None:
+            monitor.cancel()
+        runner_info = self.server_runners.pop(server_name, None)
+        if runner_info is None:
+            return
+        runner, stop = runner_info
+        stop.set()
+        await asyncio.gather(runner, return_exceptions=True)
+
+    async def _stop_all_servers(self) -> None:
+        """Close every server connection, as the exit stack is closed"""
+        await asyncio.gather(
+            *(self._stop_server(server_name) for server_name in list(self.server_runners))
+        )
+
+    def _register_server_tools(self, server_name: str) -> None:
+        """Add the tools of a connected server to the available tools
+
+        Servers still connecting in the background contribute their cached
+        tools, which are reconciled once the connection is up.
+
+        Args:
+            server_name: Name of the MCP server
+        """
+        if server_name in self.cached_catalogs:
+            tools = self.cached_catalogs[server_name]["tools"]
+        elif server_name in self.sessions:
+            tools = self.sessions[server_name]["tools"]
+        else:
+            return
+        known = {tool.name for tool in self.available_tools}
+        for tool in tools:
+            if tool.name not in known:
+                self.available_tools.append(tool)
+            self.enabled_tools[tool.name] = True
+
+    def _qualify_tools(
+        self, server_name: str, tools: List[Tool]
+    ) -> Tuple[List[Tool], Dict[str, Any]]:
+        """Qualify tool names with the server name to avoid conflicts
+
+        Args:
+            server_name: Name of the MCP server
+            tools: Tools as listed by the server
+
+        Returns:
+            Tuple of (qualified tools, argument validators by qualified name)
+        """
+        server_tools = []
+        validators = {}
+        for tool in tools:
+            # Create a qualified name for the tool that includes the server
+            qualified_name = f"{server_name}.{tool.name}"
+            # Clone the tool but update the name
+            tool_copy = Tool(
+                name=qualified_name,
+                description=(
+                    f"[{server_name}] {tool.description}"
+                    if hasattr(tool, "description")
+                    else f"Tool from {server_name}"
+                ),
+                inputSchema=self._normalize_input_schema(tool.inputSchema),
+                outputSchema=(
+                    tool.outputSchema if hasattr(tool, "outputSchema") else None
+                ),
+                annotations=(
+                    tool.annotations if hasattr(tool, "annotations") else None
+                ),
+            )
+            server_tools.append(tool_copy)
+
+            # Compile the argument validator once per tool listing
+            validator = compile_validator(tool.inputSchema)
+            if validator is not None:
+                validators[qualified_name] = validator
+        return server_tools, validators
+
+    @staticmethod
+    def _normalize_input_schema(schema: Any) -> Dict[str, Any]:
+        """Normalize a tool's input schema into the shape Ollama accepts.
+
+        This runs once per tool when a server is connected, so the tool spec
+        payload built for every query needs no further conversion.
+
+        Args:
+            schema: The inputSchema reported by the MCP server
+
+        Returns:
+            A JSON schema object with 'type' set to 'object' and a 'properties' dict
+        """
+        normalized = dict(schema) if isinstance(schema, dict) else {}
+        # Ollama only needs the schema itself, not its meta-schema reference
+        normalized.pop("$schema", None)
+        normalized["type"] = "object"
+        if not isinstance(normalized.get("properties"), dict):
+            normalized["properties"] = {}
+        if "required" in normalized and not isinstance(normalized["required"], list):
+            del normalized["required"]
+        return normalized
+
     def _create_script_params(
         self, server: Dict[str, Any]
     ) -> Optional[StdioServerParameters]:
@@ -605,6 +1549,209 @@ class ServerConnector:
         """
         return self.available_tools
 
+    def get_tool(self, tool_name: str) -> Optional[Tool]:
+        """Get a tool by its qualified name
+
+        Args:
+            tool_name: Qualified tool name (server.tool)
+
+        Returns:
+            The Tool object, or None if no connected server provides it
+        """
+        server_name = tool_name.split(".", 1)[0]
+        session_info = self.cached_catalogs.get(server_name) or self.sessions.get(
+            server_name
+        )
+        if not session_info:
+            return None
+        for tool in session_info["tools"]:
+            if tool.name == tool_name:
+                return tool
+        return None
+
+    def has_server(self, server_name: str) -> bool:
+        """Check whether a server is connected or still connecting
+
+        Args:
+            server_name: Name of the MCP server
+
+        Returns:
+            bool: True if tool calls to the server can be made
+        """
+        return (
+            server_name in self.sessions
+            or server_name in self.pending_connections
+            or server_name in self.lazy_servers
+        )
+
+    async def wait_for_server(self, server_name: str) -> bool:
+        """Wait for a server connecting in the background
+
+        A lazy server that is not running is started first.
+
+        Args:
+            server_name: Name of the MCP server
+
+        Returns:
+            bool: True if the server is connected
+        """
+        task = self.pending_connections.get(server_name)
+        if (
+            task is None
+            and server_name in self.lazy_servers
+            and server_name not in self.sessions
+        ):
+            self.console.print(f"[dim]Starting {server_name} on first use[/dim]")
+            task = asyncio.create_task(
+                self._connect_in_background(self.lazy_servers[server_name])
+            )
+            self.pending_connections[server_name] = task
+        if task is not None:
+            # Waiting must not cancel the connection if the caller is cancelled
+            await asyncio.wait({task})
+        return server_name in self.sessions
+
+    def validate_tool_arguments(self, tool_name: str, arguments: Any) -> List[str]:
+        """Validate tool call arguments against the tool's inputSchema
+
+        Args:
+            tool_name: Qualified tool name (server.tool)
+            arguments: Arguments from the model's tool call
+
+        Returns:
+            List of validation error messages, empty if the arguments are valid
+            or the tool has no usable schema
+        """
+        validator = self.tool_validators.get(tool_name)
+        if validator is None:
+            return []
+        return validate_arguments(validator, arguments)
+
+    def get_server_limits(self, server_name: str) -> Dict[str, Any]:
+        """Get the request limits configured for a server
+
+        A lazy server or one offered from its cached catalog has no limits
+        recorded until it connects, so they are read from its configuration.
+
+        Args:
+            server_name: Name of the MCP server
+
+        Returns:
+            Dict with 'maxInFlight', 'requestsPerSecond' and 'toolTimeout'
+            (None when unset)
+        """
+        if server_name in self.server_limits:
+            return self.server_limits[server_name]
+        return parse_server_limits(self.server_configs.get(server_name) or {})
+
+    def get_circuit_breaker(self, server_name: str) -> Optional[CircuitBreaker]:
+        """Get the circuit breaker of a server
+
+        Args:
+            server_name: Name of the MCP server
+
+        Returns:
+            The server's CircuitBreaker, or None if circuit breakers are disabled
+        """
+        if not self.circuit_breaker_settings.get("enabled", True):
+            return None
+        if server_name not in self.circuit_breakers:
+            self.circuit_breakers[server_name] = CircuitBreaker.from_settings(
+                self.circuit_breaker_settings
+            )
+        return self.circuit_breakers[server_name]
+
+    def get_circuit_breaker_settings(self) -> Dict[str, Any]:
+        """Get the circuit breaker settings for saving to a configuration"""
+        return dict(self.circuit_breaker_settings)
+
+    def set_circuit_breaker_settings(self, settings: Dict[str, Any]) -> None:
+        """Apply circuit breaker settings and reset all breakers
+
+        Args:
+            settings: Dict with circuit breaker settings
+        """
+        self.circuit_breaker_settings = {
+            **default_config()["circuitBreakerSettings"],
+            **settings,
+        }
+        self.circuit_breakers.clear()
+
+    def get_restart_settings(self) -> Dict[str, Any]:
+        """Get the server restart settings for saving to a configuration"""
+        return dict(self.restart_settings)
+
+    def set_restart_settings(self, settings: Dict[str, Any]) -> None:
+        """Apply server restart settings
+
+        Args:
+            settings: Dict with server restart settings
+        """
+        self.restart_settings = {
+            **default_config()["serverRestartSettings"],
+            **settings,
+        }
+
+    def get_startup_settings(self) -> Dict[str, Any]:
+        """Get the server startup settings for saving to a configuration"""
+        return dict(self.startup_settings)
+
+    def set_startup_settings(self, settings: Dict[str, Any]) -> None:
+        """Apply server startup settings from a loaded configuration
+
+        These settings take precedence over the default configuration file
+        the next time servers are connected (e.g. on reload).
+
+        Args:
+            settings: Dict with server startup settings
+        """
+        self.startup_settings = {
+            **default_config()["serverStartupSettings"],
+            **settings,
+        }
+        self._startup_settings_overridden = True
+
+    def get_circuit_breaker_states(self) -> Dict[str, Dict[str, Any]]:
+        """Get the status of every circuit breaker that has seen calls
+
+        Returns:
+            Dict mapping server names to breaker status dicts
+        """
+        return {
+            server_name: breaker.get_status()
+            for server_name, breaker in self.circuit_breakers.items()
+        }
+
+    def get_health_settings(self) -> Dict[str, Any]:
+        """Get the server health settings for saving to a configuration"""
+        return dict(self.health_settings)
+
+    def set_health_settings(self, settings: Dict[str, Any]) -> None:
+        """Apply server health settings
+
+        Latency and failure thresholds apply to the servers' next pings.
+
+        Args:
+            settings: Dict with server health settings
+        """
+        self.health_settings = {
+            **default_config()["serverHealthSettings"],
+            **settings,
+        }
+        self.server_health.clear()
+
+    def get_server_health(self) -> Dict[str, Dict[str, Any]]:
+        """Get the health of every connected server that has been pinged
+
+        Returns:
+            Dict mapping server names to health status dicts, in server order
+        """
+        return {
+            server_name: self.server_health[server_name].get_status()
+            for server_name in self.sessions
+            if server_name in self.server_health
+        }
+
     def get_enabled_tools(self) -> Dict[str, bool]:
         """Get the current enabled status of all tools
 
@@ -712,15 +1859,28 @@ class ServerConnector:
         return headers
 
     async def disconnect_all_servers(self):
-        """Disconnect from all servers and reset state"""
-        # Close all existing connections via exit stack
-        await self.exit_stack.aclose()
+        """Disconnect from all servers and reset state
 
-        # Create a new exit stack for future connections
-        self.exit_stack = AsyncExitStack()
+        Uses the same teardown as closing the exit stack, which stays in place
+        for servers connected later.
+        """
+        await self._cancel_background_tasks()
+        await self._stop_all_servers()
 
         # Clear all state
         self.sessions.clear()
         self.available_tools.clear()
         self.enabled_tools.clear()
         self.session_ids.clear()
+        self.server_limits.clear()
+        self.circuit_breakers.clear()
+        self.server_health.clear()
+        self.tool_validators.clear()
+        self.server_runners.clear()
+        self.cached_catalogs.clear()
+        self.pending_connections.clear()
+        self.lazy_servers.clear()
+        self.server_configs.clear()
+        self.idle_monitors.clear()
+        self.calls_in_flight.clear()
+        self.last_used.clear()
@@ -0,0 +1,109 @@
+"""Server health tracking for MCP Client for Ollama.
+
+This module keeps the results of the periodic MCP pings sent to each
+connected server, so a server that has become slow or stopped answering is
+noticed before a user query has to wait on it.
+"""
+
+import math
+import time
+from collections import deque
+from typing import Any, Dict, Optional
+
+from ..utils.constants import (
+    DEFAULT_HEALTH_WINDOW,
+    DEFAULT_HEALTH_DEGRADED_LATENCY_MS,
+    DEFAULT_HEALTH_DOWN_AFTER_FAILURES,
+)
+
+HEALTHY = "healthy"
+DEGRADED = "degraded"
+DOWN = "down"
+
+
+class ServerHealth:
+    """Rolling ping latency and failure count of one MCP server.
+
+    A server is down after 'down_after_failures' pings in a row failed or
+    timed out. It is degraded while its latest ping failed or while the 95th
+    percentile of its recent ping latencies exceeds 'degraded_latency_ms'.
+    """
+
+    def __init__(
+        self,
+        window_size: int = DEFAULT_HEALTH_WINDOW,
+        degraded_latency_ms: Optional[float] = DEFAULT_HEALTH_DEGRADED_LATENCY_MS,
+        down_after_failures: int = DEFAULT_HEALTH_DOWN_AFTER_FAILURES,
+    ):
+        """Initialize the ServerHealth.
+
+        Args:
+            window_size: Number of recent ping latencies kept
+            degraded_latency_ms: p95 latency above which the server is degraded
+                (None to ignore latency)
+            down_after_failures: Failed pings in a row before the server is down
+        """
+        self.degraded_latency_ms = degraded_latency_ms
+        self.down_after_failures = max(1, down_after_failures)
+        self._latencies = deque(maxlen=max(1, window_size))
+        self.consecutive_failures = 0
+        self.checked_at: Optional[float] = None
+
+    def record_success(self, latency: float) -> None:
+        """Record a ping that was answered.
+
+        Args:
+            latency: Round-trip time in seconds
+        """
+        self._latencies.append(latency * 1000)
+        self.consecutive_failures = 0
+        self.checked_at = time.monotonic()
+
+    def record_failure(self) -> None:
+        """Record a ping that failed or timed out."""
+        self.consecutive_failures += 1
+        self.checked_at = time.monotonic()
+
+    def percentile(self, percent: float) -> Optional[float]:
+        """Get a percentile of the recent ping latencies.
+
+        Args:
+            percent: Percentile to compute (0-100)
+
+        Returns:
+            Latency in milliseconds (nearest rank), or None without answered pings
+        """
+        if not self._latencies:
+            return None
+        ordered = sorted(self._latencies)
+        rank = max(1, math.ceil(percent / 100 * len(ordered)))
+        return ordered[rank - 1]
+
+    @property
+    def state(self) -> str:
+        """Current health state: healthy, degraded or down"""
+        if self.consecutive_failures >= self.down_after_failures:
+            return DOWN
+        if self.consecutive_failures:
+            return DEGRADED
+        p95 = self.percentile(95)
+        if self.degraded_latency_ms and p95 is not None and p95 > self.degraded_latency_ms:
+            return DEGRADED
+        return HEALTHY
+
+    def get_status(self) -> Dict[str, Any]:
+        """Get a snapshot of the server's health for display.
+
+        Returns:
+            Dict with 'state', 'p50_ms', 'p95_ms', 'consecutive_failures' and
+            'checked_ago' (seconds since the last ping, None if never checked)
+        """
+        return {
+            "state": self.state,
+            "p50_ms": self.percentile(50),
+            "p95_ms": self.percentile(95),
+            "consecutive_failures": self.consecutive_failures,
+            "checked_ago": (
+                time.monotonic() - self.checked_at if self.checked_at is not None else None
+            ),
+        }
@@ -0,0 +1,127 @@
+"""Shared HTTP connection pool for MCP Client for Ollama.
+
+This module provides one pooled HTTP transport for all SSE and Streamable
+HTTP server connections, so sessions to the same host reuse keep-alive
+connections and TLS sessions instead of each opening their own.
+"""
+
+import importlib.util
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+from ..config.defaults import default_config
+
+
+class _SharedTransport(httpx.AsyncBaseTransport):
+    """Transport that forwards to the shared pool and is never closed by a client.
+
+    Every MCP session closes its own httpx client when it ends; closing this
+    wrapper leaves the pool and its connections open for the other sessions.
+    """
+
+    def __init__(self, pool: "HttpClientPool"):
+        self._pool = pool
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self._pool.get_transport().handle_async_request(request)
+
+    async def aclose(self) -> None:
+        pass
+
+
+class HttpClientPool:
+    """Creates httpx clients that share one connection pool.
+
+    Each client keeps its own headers, timeout and authentication, while the
+    connections underneath are pooled for the whole process. HTTP/2 is used
+    when enabled and the 'h2' package is installed, and the pool outlives
+    server reloads until aclose() is called.
+    """
+
+    def __init__(self, settings: Optional[Dict[str, Any]] = None):
+        """Initialize the HttpClientPool.
+
+        Args:
+            settings: Dict with HTTP client settings (optional)
+        """
+        self.settings = {**default_config()["httpClientSettings"], **(settings or {})}
+        self._transport: Optional[httpx.AsyncHTTPTransport] = None
+        self._retired: List[httpx.AsyncHTTPTransport] = []
+        # Transport for clients created elsewhere; closing them keeps the pool open
+        self.shared_transport = _SharedTransport(self)
+
+    def get_settings(self) -> Dict[str, Any]:
+        """Get the HTTP client settings for saving to a configuration"""
+        return dict(self.settings)
+
+    def set_settings(self, settings: Dict[str, Any]) -> None:
+        """Apply HTTP client settings
+
+        Connections already open keep using the old pool until it is closed;
+        new requests use a pool built from the new settings.
+
+        Args:
+            settings: Dict with HTTP client settings
+        """
+        self.settings = {**default_config()["httpClientSettings"], **settings}
+        if self._transport is not None:
+            self._retired.append(self._transport)
+            self._transport = None
+
+    @staticmethod
+    def http2_available() -> bool:
+        """Check whether the optional 'h2' package needed for HTTP/2 is installed"""
+        return importlib.util.find_spec("h2") is not None
+
+    def get_transport(self) -> httpx.AsyncHTTPTransport:
+        """Get the pooled transport, creating it on first use
+
+        Returns:
+            The transport shared by all clients of this pool
+        """
+        if self._transport is None:
+            self._transport = httpx.AsyncHTTPTransport(
+                http2=bool(self.settings.get("http2")) and self.http2_available(),
+                limits=httpx.Limits(
+                    max_connections=self.settings.get("maxConnections"),
+                    max_keepalive_connections=self.settings.get("maxKeepaliveConnections"),
+                    keepalive_expiry=self.settings.get("keepaliveExpiry"),
+                ),
+            )
+        return self._transport
+
+    def create_client(
+        self,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[httpx.Timeout] = None,
+        auth: Optional[httpx.Auth] = None,
+    ) -> httpx.AsyncClient:
+        """Create an httpx client on the shared pool
+
+        Matches the httpx_client_factory signature of the MCP SSE and
+        Streamable HTTP transports, with the same defaults as the MCP SDK.
+
+        Args:
+            headers: Headers sent with every request (optional)
+            timeout: Request timeout (defaults to 30 seconds)
+            auth: Authentication handler (optional)
+
+        Returns:
+            httpx.AsyncClient using the shared connection pool
+        """
+        return httpx.AsyncClient(
+            transport=self.shared_transport,
+            follow_redirects=True,
+            headers=headers,
+            timeout=timeout if timeout is not None else httpx.Timeout(30.0),
+            auth=auth,
+        )
+
+    async def aclose(self) -> None:
+        """Close all pooled connections"""
+        transports = self._retired + ([self._transport] if self._transport else [])
+        self._retired = []
+        self._transport = None
+        for transport in transports:
+            await transport.aclose()
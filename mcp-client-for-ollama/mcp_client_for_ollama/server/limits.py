@@ -0,0 +1,121 @@
+"""Per-server request limits for MCP Client for Ollama.
+
+This module throttles tool calls sent to a single MCP server, capping both
+the number of calls in flight and the rate at which new calls start.
+"""
+
+import asyncio
+import time
+from typing import Any, Dict, Optional
+
+
+class TokenBucket:
+    """Token bucket rate limiter.
+
+    Tokens refill continuously at 'rate' per second up to 'capacity'. Waiters
+    are served in arrival order, so a burst of calls queues fairly instead of
+    racing for the next token.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """Initialize the TokenBucket.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum number of stored tokens (defaults to max(1, rate))
+        """
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        """Add the tokens accumulated since the last update."""
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated_at) * self.rate
+        )
+        self._updated_at = now
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        # asyncio.Lock wakes waiters in FIFO order, which keeps the queue fair
+        async with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= 1
+
+
+class ServerLimiter:
+    """Limits the calls in flight and the request rate for one MCP server.
+
+    Used as an async context manager around each tool call.
+    """
+
+    def __init__(
+        self,
+        max_in_flight: Optional[int] = None,
+        requests_per_second: Optional[float] = None,
+    ):
+        """Initialize the ServerLimiter.
+
+        Args:
+            max_in_flight: Maximum concurrent calls (None for no limit)
+            requests_per_second: Maximum rate of new calls (None for no limit)
+        """
+        self.max_in_flight = max_in_flight
+        self.requests_per_second = requests_per_second
+        self._semaphore = (
+            asyncio.Semaphore(max_in_flight) if max_in_flight else None
+        )
+        self._bucket = (
+            TokenBucket(requests_per_second) if requests_per_second else None
+        )
+
+    async def __aenter__(self) -> "ServerLimiter":
+        if self._semaphore is not None:
+            await self._semaphore.acquire()
+        if self._bucket is not None:
+            try:
+                await self._bucket.acquire()
+            except BaseException:
+                if self._semaphore is not None:
+                    self._semaphore.release()
+                raise
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        if self._semaphore is not None:
+            self._semaphore.release()
+
+
+def parse_server_limits(server: Dict[str, Any]) -> Dict[str, Any]:
+    """Extract request limits from a server configuration.
+
+    Limits are read from the server dict itself, falling back to its 'config'
+    subdict (the raw entry from an mcpServers JSON file).
+
+    Args:
+        server: Server configuration dictionary
+
+    Returns:
+        Dict with 'maxInFlight', 'requestsPerSecond' and 'toolTimeout'
+        (None when unset)
+    """
+    config = server.get("config") or {}
+    limits = {}
+    for key in ("maxInFlight", "requestsPerSecond", "toolTimeout"):
+        value = server.get(key)
+        if value is None:
+            value = config.get(key)
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            value = None
+        elif value <= 0:
+            value = None
+        limits[key] = value
+    if limits["maxInFlight"] is not None:
+        limits["maxInFlight"] = int(limits["maxInFlight"])
+    return limits
@@ -0,0 +1,68 @@
+"""Tool argument validation for MCP Client for Ollama.
+
+This module compiles the inputSchema of each MCP tool into a JSON Schema
+validator, so malformed arguments from the model can be rejected locally
+instead of costing a round trip to the server.
+"""
+
+from typing import Any, List, Optional
+
+from jsonschema import Draft202012Validator
+from jsonschema.exceptions import SchemaError
+from jsonschema.validators import validator_for
+
+# Enough to tell the model what to fix without flooding the tool message
+MAX_REPORTED_ERRORS = 5
+
+
+def compile_validator(schema: Any) -> Optional[Any]:
+    """Compile a tool's inputSchema into a validator.
+
+    The validator class follows the schema's '$schema' keyword and defaults
+    to JSON Schema 2020-12.
+
+    Args:
+        schema: The inputSchema reported by the MCP server
+
+    Returns:
+        A jsonschema validator, or None if the schema is missing or invalid
+        (such tools are not validated locally)
+    """
+    if not isinstance(schema, dict) or not schema:
+        return None
+    try:
+        validator_class = validator_for(schema, default=Draft202012Validator)
+        validator_class.check_schema(schema)
+        return validator_class(schema)
+    except (SchemaError, TypeError, ValueError):
+        return None
+
+
+def validate_arguments(validator: Any, arguments: Any) -> List[str]:
+    """Validate tool arguments against a compiled schema.
+
+    Args:
+        validator: Validator returned by compile_validator()
+        arguments: Arguments from the model's tool call
+
+    Returns:
+        List of error messages, empty if the arguments are valid
+    """
+    if arguments is None:
+        arguments = {}
+    try:
+        errors = sorted(
+            validator.iter_errors(arguments), key=lambda error: list(error.path)
+        )
+    except Exception:
+        # Schemas the validator cannot evaluate (e.g. remote $refs) are left to the server
+        return []
+
+    messages = []
+    for error in errors[:MAX_REPORTED_ERRORS]:
+        location = ".".join(str(part) for part in error.absolute_path)
+        messages.append(f"{location}: {error.message}" if location else error.message)
+    if len(errors) > MAX_REPORTED_ERRORS:
+        messages.append(f"... and {len(errors) - MAX_REPORTED_ERRORS} more error(s)")
+    return messages
+
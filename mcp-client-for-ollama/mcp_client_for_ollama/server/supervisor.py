@@ -0,0 +1,72 @@
+"""Connection supervision helpers for MCP Client for Ollama.
+
+This module notices when an MCP server's connection ends on its own, such
+as a STDIO server process exiting or a remote server closing its stream, and
+computes the delays between restart attempts.
+"""
+
+import asyncio
+from typing import Any, Dict, Optional
+
+from ..utils.constants import (
+    DEFAULT_SERVER_RESTART_INITIAL_DELAY,
+    DEFAULT_SERVER_RESTART_MAX_DELAY,
+)
+
+
+class MonitoredStream:
+    """Read stream wrapper that records when the stream is closed.
+
+    ClientSession reads every message from the server through this stream,
+    and closes it once the transport reports the end of the connection, so
+    'closed' is set as soon as a server process exits or its stream ends.
+    """
+
+    def __init__(self, stream: Any):
+        """Initialize the MonitoredStream.
+
+        Args:
+            stream: Receive stream returned by the MCP transport
+        """
+        self._stream = stream
+        self.closed = asyncio.Event()
+
+    async def __aenter__(self) -> "MonitoredStream":
+        await self._stream.__aenter__()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> Optional[bool]:
+        self.closed.set()
+        return await self._stream.__aexit__(exc_type, exc, tb)
+
+    def __aiter__(self) -> "MonitoredStream":
+        return self
+
+    async def __anext__(self) -> Any:
+        return await self._stream.__anext__()
+
+    async def receive(self) -> Any:
+        """Receive the next message from the server."""
+        return await self._stream.receive()
+
+    async def aclose(self) -> None:
+        """Close the stream."""
+        self.closed.set()
+        await self._stream.aclose()
+
+
+def restart_delay(attempt: int, settings: Dict[str, Any]) -> float:
+    """Get the delay before a restart attempt, doubling after each failure.
+
+    Args:
+        attempt: Number of the attempt, starting at 1
+        settings: Server restart settings
+
+    Returns:
+        float: Seconds to wait before the attempt
+    """
+    initial = settings.get("initialDelay")
+    if initial is None:
+        initial = DEFAULT_SERVER_RESTART_INITIAL_DELAY
+    max_delay = settings.get("maxDelay") or DEFAULT_SERVER_RESTART_MAX_DELAY
+    return min(initial * 2 ** (attempt - 1), max_delay)
@@ -0,0 +1,112 @@
+"""Low-level reads of stored tool result blobs for MCP Client for Ollama.
+
+This module pages through and searches blobs written by the ResultStore.
+It has no heavy imports, so it starts quickly when run as a separate process
+for grep reads:
+
+    python -m mcp_client_for_ollama.tools.blob_reader PATH ID OFFSET LENGTH PATTERN
+"""
+
+import mmap
+import os
+import re
+import sys
+from typing import Optional
+
+from ..utils.constants import DEFAULT_RESULT_READ_LENGTH
+
+
+def read_blob(
+    path: str,
+    result_id: str,
+    offset: int = 0,
+    length: int = DEFAULT_RESULT_READ_LENGTH,
+    grep: Optional[str] = None,
+) -> str:
+    """Read part of a stored result blob.
+
+    Args:
+        path: Path of the blob file
+        result_id: Result id, used in the header line
+        offset: Byte offset to start reading from
+        length: Maximum number of bytes to return
+        grep: Optional regular expression; only matching lines are returned
+
+    Returns:
+        str: The requested part, prefixed with a line describing its position
+
+    Raises:
+        ValueError: If the grep pattern is invalid
+    """
+    size = os.path.getsize(path)
+    offset = min(max(0, int(offset or 0)), size)
+    length = max(1, int(length or DEFAULT_RESULT_READ_LENGTH))
+    if size == 0:
+        return f"[result {result_id}: empty]"
+
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if grep:
+            return _grep(mm, result_id, offset, length, grep)
+
+        end = min(size, offset + length)
+        chunk = mm[offset:end].decode("utf-8", errors="ignore")
+        more = f"; continue with offset={end}" if end < size else "; end of result"
+        return f"[result {result_id}: bytes {offset}-{end} of {size}{more}]\n{chunk}"
+
+
+def _grep(mm: mmap.mmap, result_id: str, offset: int, length: int, pattern: str) -> str:
+    """Return the lines of a mapped blob that match a pattern.
+
+    Args:
+        mm: Memory-mapped blob
+        result_id: Result id, used in the header line
+        offset: Byte offset to start searching from
+        length: Maximum number of bytes of matching lines to return
+        pattern: Regular expression to search for
+
+    Returns:
+        str: Matching lines prefixed with their byte offsets
+    """
+    try:
+        regex = re.compile(pattern.encode("utf-8"), re.MULTILINE)
+    except re.error as e:
+        raise ValueError(f"Invalid grep pattern: {e}") from None
+
+    lines = []
+    used = 0
+    position = offset
+    size = len(mm)
+    truncated_at = None
+    while position < size:
+        match = regex.search(mm, position)
+        if match is None:
+            break
+        line_start = mm.rfind(b"\n", 0, match.start()) + 1
+        line_end = mm.find(b"\n", match.end())
+        if line_end == -1:
+            line_end = size
+        line = mm[line_start:line_end].decode("utf-8", errors="ignore")
+        entry = f"@{line_start}: {line}"
+        if used + len(entry) > length:
+            if lines:
+                truncated_at = line_start
+                break
+            entry = entry[:length]  # A single very long line
+        lines.append(entry)
+        used += len(entry) + 1
+        position = line_end + 1
+
+    header = f"[result {result_id}: {len(lines)} matching line(s) for /{pattern}/"
+    if truncated_at is not None:
+        header += f"; more matches, continue with offset={truncated_at}"
+    header += "]"
+    return "\n".join([header] + lines)
+
+
+if __name__ == "__main__":
+    try:
+        path, result_id, offset, length, pattern = sys.argv[1:6]
+        sys.stdout.write(read_blob(path, result_id, int(offset), int(length), pattern))
+    except ValueError as e:
+        sys.stderr.write(str(e))
+        sys.exit(1)
@@ -0,0 +1,412 @@
+"""Tool execution for MCP Client for Ollama.
+
+This module dispatches tool calls to MCP server sessions, either one after
+another or concurrently with an overall and a per-server concurrency limit.
+Servers may further restrict calls in flight and the request rate in their
+own configuration.
+"""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+from rich.console import Console
+from rich.panel import Panel
+from rich.table import Table
+
+from .progress import ToolProgressTracker
+from .result_cache import ToolResultCache
+from ..server.circuit_breaker import CircuitBreaker
+from ..server.limits import ServerLimiter
+from ..utils.constants import (
+    DEFAULT_TOOL_MAX_CONCURRENCY,
+    DEFAULT_TOOL_MAX_CONCURRENCY_PER_SERVER,
+    DEFAULT_TOOL_TIMEOUT,
+)
+
+
+class ToolTimeoutError(Exception):
+    """Raised when a tool call exceeds its timeout and is cancelled."""
+
+    def __init__(self, tool_name: str, timeout: float):
+        self.tool_name = tool_name
+        self.timeout = timeout
+        super().__init__(
+            f"Tool '{tool_name}' timed out after {timeout:g} seconds and was cancelled. "
+            f"Its result is unavailable."
+        )
+
+
+class ToolArgumentError(Exception):
+    """Raised when tool call arguments do not match the tool's inputSchema."""
+
+    def __init__(self, tool_name: str, errors: List[str]):
+        self.tool_name = tool_name
+        self.errors = errors
+        details = "\n".join(f"- {error}" for error in errors)
+        super().__init__(
+            f"Invalid arguments for tool '{tool_name}'; the call was not sent to the "
+            f"server.\n{details}\nFix the arguments to match the tool's input schema "
+            f"and call it again."
+        )
+
+
+class ToolExecutor:
+    """Executes tool calls against connected MCP servers.
+
+    Calls are described by dicts with 'server_name', 'tool_name' (the
+    qualified name), 'actual_tool_name' and 'tool_args' keys.
+    """
+
+    def __init__(self, console: Optional[Console] = None, server_connector=None):
+        """Initialize the ToolExecutor.
+
+        Args:
+            console: Rich console for output (optional)
+            server_connector: Server connector providing the MCP sessions
+        """
+        self.console = console or Console()
+        self.server_connector = server_connector
+        self.parallel = False  # By default, run tool calls one after another
+        self.dispatch_while_streaming = False  # By default, wait for the full response
+        self.max_concurrency = DEFAULT_TOOL_MAX_CONCURRENCY
+        self.max_concurrency_per_server = DEFAULT_TOOL_MAX_CONCURRENCY_PER_SERVER
+        self.tool_timeout = DEFAULT_TOOL_TIMEOUT
+        self.tool_timeouts: Dict[str, float] = {}
+        self.validate_arguments = True
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._server_limiters: Dict[str, ServerLimiter] = {}
+        self.result_cache = ToolResultCache()
+        self.progress = ToolProgressTracker()
+        # Handlers for tools provided by the client itself, keyed by qualified name
+        self.builtin_handlers: Dict[str, Callable[[Dict[str, Any]], Awaitable[Any]]] = {}
+
+    def get_settings(self) -> Dict[str, Any]:
+        """Get the tool execution settings for saving to a configuration.
+
+        Returns:
+            Dict with the current tool execution settings
+        """
+        return {
+            "parallel": self.parallel,
+            "dispatchWhileStreaming": self.dispatch_while_streaming,
+            "maxConcurrency": self.max_concurrency,
+            "maxConcurrencyPerServer": self.max_concurrency_per_server,
+            "toolTimeout": self.tool_timeout,
+            "toolTimeouts": dict(self.tool_timeouts),
+            "validateArguments": self.validate_arguments,
+        }
+
+    def set_settings(self, settings: Dict[str, Any]) -> None:
+        """Apply tool execution settings loaded from a configuration.
+
+        Args:
+            settings: Dict with tool execution settings
+        """
+        self.parallel = settings.get("parallel", False)
+        self.dispatch_while_streaming = settings.get("dispatchWhileStreaming", False)
+        self.max_concurrency = max(
+            1, settings.get("maxConcurrency") or DEFAULT_TOOL_MAX_CONCURRENCY
+        )
+        self.max_concurrency_per_server = max(
+            1,
+            settings.get("maxConcurrencyPerServer")
+            or DEFAULT_TOOL_MAX_CONCURRENCY_PER_SERVER,
+        )
+        self.tool_timeout = settings.get("toolTimeout", DEFAULT_TOOL_TIMEOUT)
+        self.tool_timeouts = dict(settings.get("toolTimeouts") or {})
+        self.validate_arguments = settings.get("validateArguments", True)
+        # Limits changed, so start from fresh semaphores
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._server_limiters = {}
+
+    def is_parallel(self) -> bool:
+        """Check if concurrent tool execution is enabled"""
+        return self.parallel
+
+    def toggle_parallel(self) -> None:
+        """Toggle concurrent tool execution"""
+        self.parallel = not self.parallel
+        if self.parallel:
+            self.console.print("[green]⚡ Parallel tool execution enabled[/green]")
+            self.console.print(
+                f"[dim]Independent tool calls run concurrently (max {self.max_concurrency} overall, "
+                f"{self.max_concurrency_per_server} per server).[/dim]"
+            )
+        else:
+            self.console.print("[yellow]Parallel tool execution disabled[/yellow]")
+            self.console.print("[dim]Tool calls will run one after another.[/dim]")
+
+    def _get_server_limiter(self, server_name: str) -> ServerLimiter:
+        """Get the limiter throttling calls to a server.
+
+        The server's own 'maxInFlight' and 'requestsPerSecond' settings take
+        precedence; otherwise the per-server concurrency default applies.
+
+        Args:
+            server_name: Name of the MCP server
+
+        Returns:
+            The server's limiter
+        """
+        if server_name not in self._server_limiters:
+            limits = self.server_connector.get_server_limits(server_name)
+            self._server_limiters[server_name] = ServerLimiter(
+                max_in_flight=limits.get("maxInFlight")
+                or self.max_concurrency_per_server,
+                requests_per_second=limits.get("requestsPerSecond"),
+            )
+        return self._server_limiters[server_name]
+
+    def register_builtin_handler(
+        self, tool_name: str, handler: Callable[[Dict[str, Any]], Awaitable[Any]]
+    ) -> None:
+        """Register the handler of a built-in tool.
+
+        Args:
+            tool_name: Qualified tool name
+            handler: Coroutine function taking the tool arguments and returning a CallToolResult
+        """
+        self.builtin_handlers[tool_name] = handler
+
+    def get_tool_timeout(self, call: Dict[str, Any]) -> Optional[float]:
+        """Get the timeout for a tool call.
+
+        A per-tool override wins over the server's 'toolTimeout' setting,
+        which wins over the global default.
+
+        Args:
+            call: Tool call description
+
+        Returns:
+            Timeout in seconds, or None for no timeout
+        """
+        if call["tool_name"] in self.tool_timeouts:
+            timeout = self.tool_timeouts[call["tool_name"]]
+        else:
+            limits = self.server_connector.get_server_limits(call["server_name"])
+            timeout = limits.get("toolTimeout") or self.tool_timeout
+        return timeout if timeout and timeout > 0 else None
+
+    def reset_server_limiters(self) -> None:
+        """Drop cached server limiters so they are rebuilt from the server configs"""
+        self._server_limiters = {}
+
+    async def call_tool(self, call: Dict[str, Any]) -> Any:
+        """Execute a single tool call on its MCP server.
+
+        Args:
+            call: Tool call description
+
+        Returns:
+            The CallToolResult returned by the server
+        """
+        # Built-in tools run in the client without touching any server
+        handler = self.builtin_handlers.get(call["tool_name"])
+        if handler is not None:
+            timeout = self.get_tool_timeout(call)
+            try:
+                return await asyncio.wait_for(handler(call["tool_args"]), timeout)
+            except asyncio.TimeoutError:
+                raise ToolTimeoutError(call["tool_name"], timeout) from None
+
+        # Reject malformed arguments without a round trip to the server
+        if self.validate_arguments:
+            errors = self.server_connector.validate_tool_arguments(
+                call["tool_name"], call["tool_args"]
+            )
+            if errors:
+                raise ToolArgumentError(call["tool_name"], errors)
+
+        # Serve read-only tools from the result cache when possible
+        cache_key = None
+        generation = self.result_cache.generation(call["server_name"])
+        tool = self.server_connector.get_tool(call["tool_name"])
+        if self.result_cache.is_cacheable(tool):
+            cache_key = self.result_cache.make_key(
+                call["server_name"], call["tool_name"], call["tool_args"]
+            )
+            cached_result = self.result_cache.get(cache_key)
+            if cached_result is not None:
+                call["cached"] = True
+                return cached_result
+
+        # Fail fast while the server's circuit breaker is open
+        breaker = self.server_connector.get_circuit_breaker(call["server_name"])
+        if breaker is not None:
+            breaker.check(call["server_name"])
+
+        try:
+            # Keep the server from being stopped as idle while the call is queued or running
+            with self.server_connector.server_in_use(call["server_name"]):
+                result = await self._call_server(call, breaker)
+        finally:
+            # Any other call may have changed what the server's read-only tools return
+            if cache_key is None:
+                self.result_cache.invalidate_server(call["server_name"])
+
+        if cache_key is not None:
+            self.result_cache.put(cache_key, result, generation)
+        return result
+
+    async def _call_server(
+        self, call: Dict[str, Any], breaker: Optional[CircuitBreaker]
+    ) -> Any:
+        """Send a tool call to its MCP server within the configured limits.
+
+        Args:
+            call: Tool call description
+            breaker: The server's circuit breaker, if any
+
+        Returns:
+            The CallToolResult returned by the server
+        """
+        server_name = call["server_name"]
+        timeout = self.get_tool_timeout(call)
+        sent = False
+        try:
+            if server_name not in self.server_connector.get_sessions():
+                # The server may still be connecting in the background, or be
+                # restarting; a start that hangs must not hold the call forever
+                try:
+                    connected = await asyncio.wait_for(
+                        self.server_connector.wait_for_server(server_name), timeout
+                    )
+                except asyncio.TimeoutError:
+                    raise ConnectionError(
+                        f"Server {server_name} did not connect within {timeout:g} seconds"
+                    ) from None
+                if not connected:
+                    raise ConnectionError(f"Server {server_name} is not connected")
+            # Queue on the server's own limits first, so a throttled server does not
+            # hold overall slots that calls to other servers could use
+            async with self._get_server_limiter(server_name):
+                async with self._semaphore:
+                    # The server may have been restarted or removed while queued,
+                    # so its session is looked up only once a slot is held
+                    sessions = self.server_connector.get_sessions()
+                    if server_name not in sessions:
+                        raise ConnectionError(f"Server {server_name} is not connected")
+                    session = sessions[server_name]["session"]
+                    started_at = time.monotonic()
+                    self.progress.start(call)
+                    sent = True
+                    try:
+                        result = await asyncio.wait_for(
+                            session.call_tool(
+                                call["actual_tool_name"],
+                                call["tool_args"],
+                                progress_callback=self.progress.progress_callback(call),
+                            ),
+                            timeout,
+                        )
+                    except asyncio.TimeoutError:
+                        if breaker is not None:
+                            breaker.record_failure()
+                        raise ToolTimeoutError(call["tool_name"], timeout) from None
+                    except asyncio.CancelledError:
+                        if breaker is not None:
+                            breaker.record_cancelled()
+                        raise
+                    except Exception:
+                        if breaker is not None:
+                            breaker.record_failure()
+                        raise
+                    finally:
+                        self.progress.finish(call)
+                    if breaker is not None:
+                        breaker.record_success(time.monotonic() - started_at)
+        finally:
+            # A call that never reached the server must not keep the half-open
+            # probe slot, or the breaker would reject every later call
+            if not sent and breaker is not None:
+                breaker.record_cancelled()
+        return result
+
+    def start(self, call: Dict[str, Any]) -> "asyncio.Task":
+        """Start a tool call in the background.
+
+        Used to dispatch tool calls while the model response is still streaming.
+
+        Args:
+            call: Tool call description
+
+        Returns:
+            Task resolving to the call's result, or to the exception it raised
+        """
+        return asyncio.create_task(self._call_tool_capturing_errors(call))
+
+    async def _call_tool_capturing_errors(self, call: Dict[str, Any]) -> Any:
+        """Execute a tool call, returning any exception instead of raising it.
+
+        Args:
+            call: Tool call description
+
+        Returns:
+            The CallToolResult, or the exception raised by the call
+        """
+        try:
+            return await self.call_tool(call)
+        except Exception as e:
+            return e
+
+    async def execute(self, calls: List[Dict[str, Any]]) -> List[Any]:
+        """Execute several tool calls concurrently within the configured limits.
+
+        Args:
+            calls: Tool call descriptions
+
+        Returns:
+            List of results in the same order as the calls. A call that raised
+            has its exception in place of a result.
+        """
+        return await asyncio.gather(
+            *(self.call_tool(call) for call in calls), return_exceptions=True
+        )
+
+    def display_result_cache(self) -> None:
+        """Display the tool result cache statistics and entries."""
+        cache = self.result_cache
+        entries = cache.get_entries()
+        status = "[green]Enabled[/green]" if cache.enabled else "[red]Disabled[/red]"
+        summary = (
+            f"Tool result cache: {status}\n"
+            f"Entries: {len(entries)}/{cache.max_entries}\n"
+            f"Hits: {cache.hits}  Misses: {cache.misses}\n"
+            f"Default TTL: {cache.default_ttl}s"
+        )
+
+        if entries:
+            table = Table(show_header=True, header_style="bold cyan", expand=False)
+            table.add_column("Tool", style="yellow")
+            table.add_column("Arguments", style="white", overflow="fold")
+            table.add_column("Expires in", justify="right", style="green")
+            for entry in entries:
+                expires_in = (
+                    f"{entry['expires_in']:.0f}s"
+                    if entry["expires_in"] is not None
+                    else "never"
+                )
+                args = entry["args"]
+                if len(args) > 60:
+                    args = args[:57] + "..."
+                table.add_row(entry["tool"], args, expires_in)
+            self.console.print(
+                Panel(summary, title="🗃️ Tool Result Cache", border_style="cyan", expand=False)
+            )
+            self.console.print(table)
+        else:
+            self.console.print(
+                Panel(
+                    summary + "\n\n[dim]No cached results.[/dim]",
+                    title="🗃️ Tool Result Cache",
+                    border_style="cyan",
+                    expand=False,
+                )
+            )
+
+    def clear_result_cache(self) -> None:
+        """Flush the tool result cache."""
+        count = self.result_cache.clear()
+        self.console.print(
+            f"[green]Tool result cache cleared! Removed {count} cached result{'s' if count != 1 else ''}.[/green]"
+        )
@@ -4,7 +4,7 @@ This module handles enabling, disabling, and selecting tools from MCP servers.
 """
 
 import json
-from typing import Dict, List, Optional, Tuple, Callable
+from typing import Any, Dict, List, Optional, Tuple, Callable
 from mcp import Tool
 from rich.console import Console
 from rich.columns import Columns
@@ -32,6 +32,10 @@ class ToolManager:
         self.available_tools = []
         self.enabled_tools = {}
         self.server_connector = server_connector
+        self.builtin_tools: List[Tool] = []  # Tools provided by the client itself
+        # Enabled tools and their Ollama tool specs, rebuilt only when the enabled set changes
+        self._enabled_tool_objects: Optional[List[Tool]] = None
+        self._tool_specs: Optional[List[Dict[str, Any]]] = None
 
     def set_available_tools(self, tools: List[Tool]) -> None:
         """Set the available tools.
@@ -39,7 +43,38 @@ class ToolManager:
         Args:
             tools: List of available tools
         """
-        self.available_tools = tools
+        builtin_names = {tool.name for tool in self.builtin_tools}
+        self.available_tools = [
+            tool for tool in tools if tool.name not in builtin_names
+        ] + self.builtin_tools
+        self.invalidate_tool_cache()
+
+    def register_builtin_tool(self, tool: Tool) -> None:
+        """Register a tool provided by the client rather than an MCP server.
+
+        Built-in tools are listed and toggled like MCP tools, but are only
+        offered to the model while at least one MCP tool is enabled.
+
+        Args:
+            tool: The built-in tool
+        """
+        if any(existing.name == tool.name for existing in self.builtin_tools):
+            return
+        self.builtin_tools.append(tool)
+        self.available_tools = list(self.available_tools) + [tool]
+        self.enabled_tools.setdefault(tool.name, True)
+        self.invalidate_tool_cache()
+
+    def is_builtin_tool(self, tool_name: str) -> bool:
+        """Check whether a tool is provided by the client itself.
+
+        Args:
+            tool_name: Qualified tool name
+
+        Returns:
+            bool: True for built-in tools
+        """
+        return any(tool.name == tool_name for tool in self.builtin_tools)
 
     def set_enabled_tools(self, enabled_tools: Dict[str, bool]) -> None:
         """Set the enabled status of tools.
@@ -47,11 +82,20 @@ class ToolManager:
         Args:
             enabled_tools: Dictionary mapping tool names to enabled status
         """
-        self.enabled_tools = enabled_tools
+        # Copied, so built-in tools do not leak into the caller's (the connector's) state
+        self.enabled_tools = dict(enabled_tools)
+        for tool in self.builtin_tools:
+            self.enabled_tools.setdefault(tool.name, True)
+        self.invalidate_tool_cache()
 
         # Notify server connector of tool status changes
         self._notify_server_connector_batch(enabled_tools)
 
+    def invalidate_tool_cache(self) -> None:
+        """Drop the cached enabled tools and tool specs so they are rebuilt on next use."""
+        self._enabled_tool_objects = None
+        self._tool_specs = None
+
     # Helper methods for common operations
     def _notify_server_connector(self, tool_name: str, enabled: bool) -> None:
         """Notify the server connector of a tool status change.
@@ -114,6 +158,7 @@ class ToolManager:
         """Enable all available tools."""
         for tool in self.available_tools:
             self.enabled_tools[tool.name] = True
+        self.invalidate_tool_cache()
 
         # Also update the server connector if available
         if self.server_connector:
@@ -126,6 +171,7 @@ class ToolManager:
         for tool in self.available_tools:
             self.enabled_tools[tool.name] = False
             tool_status_updates[tool.name] = False
+        self.invalidate_tool_cache()
 
         # Notify server connector of all changes at once
         self._notify_server_connector_batch(tool_status_updates)
@@ -139,6 +185,7 @@ class ToolManager:
         """
         if tool_name in self.enabled_tools:
             self.enabled_tools[tool_name] = enabled
+            self.invalidate_tool_cache()
             self._notify_server_connector(tool_name, enabled)
 
     def display_available_tools(self) -> None:
@@ -157,6 +204,12 @@ class ToolManager:
         if tool_texts:
             columns = Columns(tool_texts, equal=True, expand=True)
             subtitle = f"[bold]{enabled_count}/{len(self.available_tools)} tools enabled[/bold]"
+            breaker_summary = self._get_circuit_breaker_summary()
+            if breaker_summary:
+                subtitle += f" | {breaker_summary}"
+            health_summary = self._get_server_health_summary()
+            if health_summary:
+                subtitle += f" | {health_summary}"
             self.console.print(
                 Panel(
                     columns,
@@ -168,6 +221,50 @@ class ToolManager:
         else:
             self.console.print("[yellow]No tools available from the server[/yellow]")
 
+    def _get_circuit_breaker_summary(self) -> str:
+        """Describe servers whose circuit breaker is not closed.
+
+        Returns:
+            str: Rich markup listing open and half-open breakers, or "" if all are closed
+        """
+        if not self.server_connector or not hasattr(
+            self.server_connector, "get_circuit_breaker_states"
+        ):
+            return ""
+
+        parts = []
+        for server_name, status in self.server_connector.get_circuit_breaker_states().items():
+            if status["state"] == "open":
+                parts.append(
+                    f"[red]⊘ {server_name} unavailable (retry in {status['retry_in']:.0f}s)[/red]"
+                )
+            elif status["state"] == "half-open":
+                parts.append(f"[yellow]◐ {server_name} recovering[/yellow]")
+        return " ".join(parts)
+
+    def _get_server_health_summary(self) -> str:
+        """Describe servers that are degraded or not answering pings.
+
+        Returns:
+            str: Rich markup listing degraded and down servers, or "" if all are healthy
+        """
+        if not self.server_connector or not hasattr(
+            self.server_connector, "get_server_health"
+        ):
+            return ""
+
+        parts = []
+        for server_name, status in self.server_connector.get_server_health().items():
+            if status["state"] == "down":
+                parts.append(f"[red]✖ {server_name} down[/red]")
+            elif status["state"] == "degraded":
+                if status["consecutive_failures"] or status["p95_ms"] is None:
+                    detail = "missed ping"
+                else:
+                    detail = f"p95 {status['p95_ms']:.0f}ms"
+                parts.append(f"[yellow]◔ {server_name} degraded ({detail})[/yellow]")
+        return " ".join(parts)
+
     # These helper methods break down the select_tools method into more manageable pieces
     def _display_tool_selection_header(self) -> None:
         """Display the tool selection header."""
@@ -344,6 +441,7 @@ class ToolManager:
             for tool in server_tools:
                 self.enabled_tools[tool.name] = new_state
                 tool_updates[tool.name] = new_state
+            self.invalidate_tool_cache()
 
             # Notify server connector of all changes
             self._notify_server_connector_batch(tool_updates)
@@ -413,6 +511,9 @@ class ToolManager:
                 else:
                     invalid_indices.append(idx)
 
+            if tool_updates:
+                self.invalidate_tool_cache()
+
             # Notify server connector of all changes
             self._notify_server_connector_batch(tool_updates)
 
@@ -499,7 +600,10 @@ class ToolManager:
 
             if selection in ["q", "quit"]:
                 # Restore original tool states
-                self.enabled_tools = original_states.copy()
+                self.enabled_tools.clear()
+                self.enabled_tools.update(original_states)
+                self.invalidate_tool_cache()
+                self._notify_server_connector_batch(original_states)
                 self._clear_console(clear_console_func)
                 return
 
@@ -558,14 +662,45 @@ class ToolManager:
     def get_enabled_tool_objects(self) -> List[Tool]:
         """Get a list of the Tool objects that are enabled.
 
+        The list is cached and only rebuilt after the enabled set changes.
+
         Returns:
             List[Tool]: List of enabled tool objects
         """
-        return [
-            tool
-            for tool in self.available_tools
-            if self.enabled_tools.get(tool.name, False)
-        ]
+        if self._enabled_tool_objects is None:
+            enabled = [
+                tool
+                for tool in self.available_tools
+                if self.enabled_tools.get(tool.name, False)
+            ]
+            # Built-in tools only make sense alongside MCP tools
+            if all(self.is_builtin_tool(tool.name) for tool in enabled):
+                enabled = []
+            self._enabled_tool_objects = enabled
+        return self._enabled_tool_objects
+
+    def get_tool_specs(self) -> List[Dict[str, Any]]:
+        """Get the enabled tools in the function-spec format sent to Ollama.
+
+        The payload is cached and only rebuilt after the enabled set changes, and
+        it keeps the order of the available tools so requests stay stable.
+
+        Returns:
+            List[Dict[str, Any]]: Tool specs for the 'tools' parameter of ollama.chat()
+        """
+        if self._tool_specs is None:
+            self._tool_specs = [
+                {
+                    "type": "function",
+                    "function": {
+                        "name": tool.name,
+                        "description": tool.description,
+                        "parameters": tool.inputSchema,
+                    },
+                }
+                for tool in self.get_enabled_tool_objects()
+            ]
+        return self._tool_specs
 
     def set_server_connector(self, server_connector):
         """Set the server connector to notify of tool state changes.
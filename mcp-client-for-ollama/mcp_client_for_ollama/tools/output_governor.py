@@ -0,0 +1,277 @@
+"""Tool output size governor for MCP Client for Ollama.
+
+This module caps the size of tool results before they are sent back to the
+model, so a single large result does not dominate prompt evaluation time.
+"""
+
+import json
+from typing import Any, Dict, Optional, Tuple
+
+from ..utils.constants import (
+    CHARS_PER_TOKEN_ESTIMATE,
+    DEFAULT_TOOL_OUTPUT_MAX_CHARS,
+    DEFAULT_RESULT_PREVIEW_CHARS,
+)
+
+
+def _truncate_arrays(value: Any, max_items: int, tail_items: int) -> Any:
+    """Shorten every array in a JSON value, keeping its first and last items.
+
+    Args:
+        value: Parsed JSON value
+        max_items: Maximum items kept per array
+        tail_items: How many of the kept items come from the end of the array
+
+    Returns:
+        A copy of the value with long arrays shortened and a marker string in
+        place of the dropped items
+    """
+    if isinstance(value, dict):
+        return {
+            key: _truncate_arrays(item, max_items, tail_items)
+            for key, item in value.items()
+        }
+    if isinstance(value, list):
+        items = [_truncate_arrays(item, max_items, tail_items) for item in value]
+        if len(items) <= max_items:
+            return items
+        head_items = max_items - tail_items
+        dropped = len(items) - max_items
+        return (
+            items[:head_items]
+            + [f"... {dropped} more items omitted ..."]
+            + (items[-tail_items:] if tail_items else [])
+        )
+    return value
+
+
+def _longest_array(value: Any) -> int:
+    """Get the length of the longest array nested in a JSON value."""
+    if isinstance(value, dict):
+        return max((_longest_array(item) for item in value.values()), default=0)
+    if isinstance(value, list):
+        return max(
+            [len(value)] + [_longest_array(item) for item in value], default=0
+        )
+    return 0
+
+
+class ToolOutputGovernor:
+    """Caps tool output by characters or estimated tokens.
+
+    JSON results with long arrays are shortened item by item so they stay
+    valid JSON. Other results, and JSON that is still too long, keep their
+    head and tail with a marker in between. Every truncation tells the model
+    how much was dropped.
+    """
+
+    def __init__(self):
+        """Initialize the ToolOutputGovernor."""
+        self.enabled = True
+        self.max_chars: Optional[int] = DEFAULT_TOOL_OUTPUT_MAX_CHARS
+        self.max_tokens: Optional[int] = None
+        self.head_ratio = 0.7
+        self.tool_limits: Dict[str, Dict[str, Any]] = {}
+        self.store_large_results = True
+        self.preview_chars = DEFAULT_RESULT_PREVIEW_CHARS
+
+    def get_settings(self) -> Dict[str, Any]:
+        """Get the tool output settings for saving to a configuration.
+
+        Returns:
+            Dict with the current tool output settings
+        """
+        return {
+            "enabled": self.enabled,
+            "maxChars": self.max_chars,
+            "maxTokens": self.max_tokens,
+            "headRatio": self.head_ratio,
+            "toolLimits": {name: dict(limits) for name, limits in self.tool_limits.items()},
+            "storeLargeResults": self.store_large_results,
+            "previewChars": self.preview_chars,
+        }
+
+    def set_settings(self, settings: Dict[str, Any]) -> None:
+        """Apply tool output settings loaded from a configuration.
+
+        Args:
+            settings: Dict with tool output settings
+        """
+        self.enabled = settings.get("enabled", True)
+        self.max_chars = settings.get("maxChars", DEFAULT_TOOL_OUTPUT_MAX_CHARS)
+        self.max_tokens = settings.get("maxTokens")
+        self.head_ratio = min(max(settings.get("headRatio", 0.7), 0.0), 1.0)
+        self.tool_limits = {
+            name: dict(limits)
+            for name, limits in (settings.get("toolLimits") or {}).items()
+            if isinstance(limits, dict)
+        }
+        self.store_large_results = settings.get("storeLargeResults", True)
+        self.preview_chars = max(
+            0, settings.get("previewChars") or DEFAULT_RESULT_PREVIEW_CHARS
+        )
+
+    def get_limit(self, tool_name: str) -> Optional[int]:
+        """Get the character budget for a tool's output.
+
+        Per-tool 'maxChars' / 'maxTokens' override the global values. When both
+        a character and a token limit apply, the stricter one wins.
+
+        Args:
+            tool_name: Qualified tool name
+
+        Returns:
+            Maximum number of characters, or None for no limit
+        """
+        if not self.enabled:
+            return None
+        limits = self.tool_limits.get(tool_name, {})
+        max_chars = limits.get("maxChars", self.max_chars)
+        max_tokens = limits.get("maxTokens", self.max_tokens)
+
+        budgets = []
+        if max_chars:
+            budgets.append(max_chars)
+        if max_tokens:
+            budgets.append(max_tokens * CHARS_PER_TOKEN_ESTIMATE)
+        return min(budgets) if budgets else None
+
+    def exceeds_limit(self, tool_name: str, text: str) -> bool:
+        """Check whether a tool output is over its budget.
+
+        Args:
+            tool_name: Qualified tool name
+            text: Tool output text
+
+        Returns:
+            bool: True if the output would be truncated by apply()
+        """
+        limit = self.get_limit(tool_name)
+        return limit is not None and len(text) > limit
+
+    def apply(
+        self, tool_name: str, text: str, parsed: Optional[Any] = None
+    ) -> Tuple[str, int]:
+        """Cap a tool output to the budget of its tool.
+
+        Args:
+            tool_name: Qualified tool name
+            text: Tool output text
+            parsed: The output already parsed as JSON, if available, to skip re-parsing it
+
+        Returns:
+            Tuple of (text to send to the model, number of characters of content
+            dropped). Whitespace removed by compacting JSON does not count.
+        """
+        limit = self.get_limit(tool_name)
+        if limit is None or len(text) <= limit:
+            return text, 0
+
+        truncated = self._truncate_json(text, limit, parsed)
+        if truncated is None:
+            truncated = self._truncate_text(text, limit)
+        return truncated
+
+    def _marker(self, total: int, dropped: int) -> str:
+        """Build the note that tells the model how much output was dropped.
+
+        Args:
+            total: Characters of output before truncation
+            dropped: Characters of output omitted
+        """
+        dropped_tokens = -(-dropped // CHARS_PER_TOKEN_ESTIMATE)
+        return (
+            f"[tool output truncated: {dropped:,} of {total:,} characters "
+            f"(~{dropped_tokens:,} tokens) omitted]"
+        )
+
+    def _marker_room(self, total: int) -> int:
+        """Get the most characters the marker for an output can take.
+
+        Args:
+            total: Characters of output before truncation
+        """
+        return len(self._marker(total, total))
+
+    def _truncate_json(
+        self, text: str, limit: int, parsed: Optional[Any] = None
+    ) -> Optional[Tuple[str, int]]:
+        """Shorten arrays in a JSON output until it fits the limit.
+
+        Args:
+            text: Tool output text
+            limit: Maximum number of characters
+            parsed: The output already parsed as JSON, if available
+
+        Returns:
+            Tuple of (compacted or shortened JSON with a marker line if items
+            were dropped, characters dropped), or None if the output is not JSON
+            or cannot be made to fit by shortening arrays
+        """
+        if parsed is not None:
+            value = parsed
+        else:
+            stripped = text.strip()
+            if not stripped.startswith(("{", "[")):
+                return None
+            try:
+                value = json.loads(stripped)
+            except ValueError:
+                return None
+
+        def render(max_items: int) -> str:
+            tail_items = max_items // 4
+            return json.dumps(
+                _truncate_arrays(value, max_items, tail_items),
+                ensure_ascii=False,
+                separators=(",", ":"),
+            )
+
+        # Dropping insignificant whitespace may be enough on its own
+        compact = json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+        if len(compact) <= limit:
+            return compact, 0
+
+        longest = _longest_array(value)
+        if longest <= 1:
+            return None
+
+        # Binary search for the most items per array that still fits, leaving
+        # room for the marker line
+        budget = limit - len("\n") - self._marker_room(len(compact))
+        low, high, best = 1, longest - 1, None
+        while low <= high:
+            mid = (low + high) // 2
+            candidate = render(mid)
+            if len(candidate) <= budget:
+                best = candidate
+                low = mid + 1
+            else:
+                high = mid - 1
+
+        if best is None:
+            return None
+        dropped = max(0, len(compact) - len(best))
+        return f"{best}\n{self._marker(len(compact), dropped)}", dropped
+
+    def _truncate_text(self, text: str, limit: int) -> Tuple[str, int]:
+        """Keep the head and tail of a text output with a marker in between.
+
+        Args:
+            text: Tool output text
+            limit: Maximum number of characters
+
+        Returns:
+            Tuple of (shortened text, characters dropped)
+        """
+        separators = 2 * len("\n\n")  # Blank lines around the marker
+        budget = max(0, limit - separators - self._marker_room(len(text)))
+        head_chars = int(budget * self.head_ratio)
+        tail_chars = budget - head_chars
+        head = text[:head_chars]
+        tail = text[len(text) - tail_chars :] if tail_chars else ""
+        dropped = len(text) - len(head) - len(tail)
+        return (
+            f"{head}\n\n{self._marker(len(text), dropped)}\n\n{tail}".rstrip(),
+            dropped,
+        )
@@ -0,0 +1,171 @@
+"""Tool call progress tracking for MCP Client for Ollama.
+
+This module records the progress notifications MCP servers send for running
+tool calls, so the status line can show how far each call has got and the
+metrics panel can tell slow tools from hung ones.
+"""
+
+import time
+from typing import Any, Dict, List, Optional
+
+from rich.markup import escape
+
+# Without an update for this long, a running call is shown as stalled
+PROGRESS_STALL_SECONDS = 5.0
+
+
+class _CallProgress:
+    """Progress of a single running tool call."""
+
+    def __init__(self, tool_name: str):
+        self.tool_name = tool_name
+        self.started_at = time.monotonic()
+        self.progress: Optional[float] = None
+        self.total: Optional[float] = None
+        self.message: Optional[str] = None
+        self.updates = 0
+        self.first_progress: Optional[float] = None
+        self.first_update_at: Optional[float] = None
+        self.last_update_at: Optional[float] = None
+        self.max_gap = 0.0
+
+    def update(self, progress: float, total: Optional[float], message: Optional[str]) -> None:
+        """Record a progress notification."""
+        now = time.monotonic()
+        self.max_gap = max(self.max_gap, now - (self.last_update_at or self.started_at))
+        if self.first_update_at is None:
+            self.first_progress = progress
+            self.first_update_at = now
+        self.progress = progress
+        self.total = total
+        self.message = message
+        self.updates += 1
+        self.last_update_at = now
+
+    def rate(self) -> Optional[float]:
+        """Progress units per second since the first notification."""
+        if self.first_update_at is None or self.last_update_at == self.first_update_at:
+            return None
+        return (self.progress - self.first_progress) / (
+            self.last_update_at - self.first_update_at
+        )
+
+    def describe(self, now: float) -> str:
+        """Describe the call for the status line."""
+        parts = [f"{self.tool_name} {now - self.started_at:.1f}s"]
+        if self.progress is not None:
+            if self.total:
+                parts.append(f"{min(self.progress / self.total, 1.0):.0%}")
+            else:
+                parts.append(f"{self.progress:g}")
+            rate = self.rate()
+            if rate:
+                parts.append(f"{rate:.3g}/s")
+            if self.message:
+                parts.append(escape(self.message[:60]))
+        silent_for = now - (self.last_update_at or self.started_at)
+        if self.updates and silent_for >= PROGRESS_STALL_SECONDS:
+            parts.append(f"no progress for {silent_for:.0f}s")
+        return " · ".join(parts)
+
+
+class ToolProgressTracker:
+    """Tracks progress notifications and timings of running tool calls.
+
+    The executor starts and finishes an entry around each server call and
+    passes the callback from progress_callback() to the MCP session. Timings
+    of finished calls accumulate until take_metrics() collects them.
+    """
+
+    def __init__(self):
+        """Initialize the ToolProgressTracker."""
+        self._running: Dict[int, _CallProgress] = {}
+        self._finished: List[Dict[str, Any]] = []
+
+    def start(self, call: Dict[str, Any]) -> None:
+        """Start tracking a tool call.
+
+        Args:
+            call: Tool call description
+        """
+        self._running[id(call)] = _CallProgress(call["tool_name"])
+
+    def finish(self, call: Dict[str, Any]) -> None:
+        """Stop tracking a tool call and keep its timings for the metrics.
+
+        Args:
+            call: Tool call description
+        """
+        entry = self._running.pop(id(call), None)
+        if entry is None:
+            return
+        now = time.monotonic()
+        max_gap = 0.0
+        if entry.updates:
+            # The silence after the last update counts as a gap too
+            max_gap = max(entry.max_gap, now - entry.last_update_at)
+        self._finished.append(
+            {
+                "tool_name": entry.tool_name,
+                "duration": now - entry.started_at,
+                "updates": entry.updates,
+                "max_gap": max_gap,
+            }
+        )
+
+    def progress_callback(self, call: Dict[str, Any]):
+        """Create the progress callback passed to ClientSession.call_tool().
+
+        Args:
+            call: Tool call description
+
+        Returns:
+            Coroutine function recording the call's progress notifications
+        """
+
+        async def on_progress(
+            progress: float, total: Optional[float], message: Optional[str]
+        ) -> None:
+            entry = self._running.get(id(call))
+            if entry is not None:
+                entry.update(progress, total, message)
+
+        return on_progress
+
+    def describe(self) -> str:
+        """Describe the running calls for the status line.
+
+        Returns:
+            str: Elapsed time and progress of each running call, or "" if none
+        """
+        now = time.monotonic()
+        return ", ".join(entry.describe(now) for entry in self._running.values())
+
+    def take_metrics(self) -> Dict[str, Any]:
+        """Get timings of the calls finished since the last call and reset them.
+
+        Returns:
+            Dict with 'tool_calls' (count), 'slowest_tool' ((name, seconds) or
+            None), 'tool_progress_updates' (count) and 'tool_progress_max_gap'
+            ((name, seconds) of the longest wait between updates, or None)
+        """
+        finished, self._finished = self._finished, []
+        if not finished:
+            return {}
+        slowest = max(finished, key=lambda entry: entry["duration"])
+        with_progress = [entry for entry in finished if entry["updates"]]
+        longest_gap = (
+            max(with_progress, key=lambda entry: entry["max_gap"])
+            if with_progress
+            else None
+        )
+        return {
+            "tool_calls": len(finished),
+            "slowest_tool": (slowest["tool_name"], slowest["duration"]),
+            "tool_progress_updates": sum(entry["updates"] for entry in finished),
+            "tool_progress_max_gap": (
+                (longest_gap["tool_name"], longest_gap["max_gap"])
+                if longest_gap
+                else None
+            ),
+        }
@@ -0,0 +1,231 @@
+"""Tool result caching for MCP Client for Ollama.
+
+This module memoizes results of read-only MCP tools so that repeated
+identical calls do not hit the MCP server again.
+"""
+
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from mcp import Tool
+
+from ..utils.constants import (
+    DEFAULT_TOOL_CACHE_MAX_ENTRIES,
+    DEFAULT_TOOL_CACHE_TTL,
+)
+
+
+def canonicalize_args(tool_args: Any) -> str:
+    """Serialize tool arguments into a canonical string.
+
+    Args:
+        tool_args: Arguments of a tool call
+
+    Returns:
+        str: JSON with sorted keys and no insignificant whitespace
+    """
+    return json.dumps(
+        tool_args or {}, sort_keys=True, separators=(",", ":"), default=str
+    )
+
+
+class ToolResultCache:
+    """LRU cache of tool results keyed by (server, tool, canonicalized args).
+
+    A tool is cached when it is listed in the 'cacheTools' setting, or when
+    its MCP annotations mark it read-only. Entries expire after a per-tool
+    TTL, falling back to the default TTL. A server's entries are dropped
+    whenever a call that may change its state is sent to it, or its session
+    is replaced.
+    """
+
+    def __init__(self):
+        """Initialize the ToolResultCache."""
+        self.enabled = True
+        self.max_entries = DEFAULT_TOOL_CACHE_MAX_ENTRIES
+        self.default_ttl = DEFAULT_TOOL_CACHE_TTL
+        self.tool_ttls: Dict[str, float] = {}
+        self.cache_tools: List[str] = []
+        self.use_annotations = True
+        self._entries: "OrderedDict[Tuple[str, str, str], Tuple[float, Any]]" = (
+            OrderedDict()
+        )
+        self._generations: Dict[str, int] = {}  # Bumped when a server's entries are dropped
+        self.hits = 0
+        self.misses = 0
+
+    def get_settings(self) -> Dict[str, Any]:
+        """Get the tool cache settings for saving to a configuration.
+
+        Returns:
+            Dict with the current tool cache settings
+        """
+        return {
+            "enabled": self.enabled,
+            "maxEntries": self.max_entries,
+            "defaultTtl": self.default_ttl,
+            "toolTtls": dict(self.tool_ttls),
+            "cacheTools": list(self.cache_tools),
+            "useAnnotations": self.use_annotations,
+        }
+
+    def set_settings(self, settings: Dict[str, Any]) -> None:
+        """Apply tool cache settings loaded from a configuration.
+
+        Args:
+            settings: Dict with tool cache settings
+        """
+        self.enabled = settings.get("enabled", True)
+        self.max_entries = max(
+            1, settings.get("maxEntries") or DEFAULT_TOOL_CACHE_MAX_ENTRIES
+        )
+        self.default_ttl = settings.get("defaultTtl", DEFAULT_TOOL_CACHE_TTL)
+        self.tool_ttls = dict(settings.get("toolTtls") or {})
+        self.cache_tools = list(settings.get("cacheTools") or [])
+        self.use_annotations = settings.get("useAnnotations", True)
+        self._evict()
+
+    def is_cacheable(self, tool: Optional[Tool]) -> bool:
+        """Check whether results of a tool may be cached.
+
+        Args:
+            tool: The qualified Tool object, if known
+
+        Returns:
+            bool: True if the tool is opted in by config or annotated read-only
+        """
+        if not self.enabled or tool is None:
+            return False
+        if tool.name in self.cache_tools:
+            return True
+        # idempotentHint only says repeating a write is harmless, not that its
+        # result can stand in for a later call
+        if self.use_annotations and tool.annotations:
+            return bool(tool.annotations.readOnlyHint)
+        return False
+
+    def _ttl_for(self, tool_name: str) -> Optional[float]:
+        """Get the TTL in seconds for a tool, or None for no expiry."""
+        return self.tool_ttls.get(tool_name, self.default_ttl)
+
+    def make_key(
+        self, server_name: str, tool_name: str, tool_args: Any
+    ) -> Tuple[str, str, str]:
+        """Build the cache key for a tool call.
+
+        Args:
+            server_name: Name of the MCP server
+            tool_name: Qualified tool name
+            tool_args: Arguments of the tool call
+
+        Returns:
+            Tuple of (server, tool, canonicalized args)
+        """
+        return (server_name, tool_name, canonicalize_args(tool_args))
+
+    def get(self, key: Tuple[str, str, str]) -> Optional[Any]:
+        """Look up a cached result.
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            The cached result, or None on a miss or an expired entry
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, result = entry
+            if expires_at is None or time.monotonic() < expires_at:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return result
+            del self._entries[key]
+        self.misses += 1
+        return None
+
+    def put(
+        self, key: Tuple[str, str, str], result: Any, generation: Optional[int] = None
+    ) -> None:
+        """Store a result, evicting the least recently used entries if needed.
+
+        Results flagged as errors are not cached, nor are results of calls
+        started before the server's entries were last dropped.
+
+        Args:
+            key: Cache key from make_key()
+            result: CallToolResult to cache
+            generation: Server generation from generation() when the call started
+        """
+        if getattr(result, "isError", False):
+            return
+        if generation is not None and generation != self.generation(key[0]):
+            return
+        ttl = self._ttl_for(key[1])
+        if ttl is not None and ttl <= 0:
+            return
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        self._entries[key] = (expires_at, result)
+        self._entries.move_to_end(key)
+        self._evict()
+
+    def _evict(self) -> None:
+        """Drop least recently used entries beyond the size bound."""
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def generation(self, server_name: str) -> int:
+        """Get the number of times a server's entries have been dropped.
+
+        Args:
+            server_name: Name of the MCP server
+
+        Returns:
+            int: Counter compared by put() to discard results that may be stale
+        """
+        return self._generations.get(server_name, 0)
+
+    def invalidate_server(self, server_name: str) -> int:
+        """Drop all cached results of a server.
+
+        Args:
+            server_name: Name of the MCP server
+
+        Returns:
+            int: Number of entries removed
+        """
+        self._generations[server_name] = self.generation(server_name) + 1
+        keys = [key for key in self._entries if key[0] == server_name]
+        for key in keys:
+            del self._entries[key]
+        return len(keys)
+
+    def clear(self) -> int:
+        """Remove all cached results.
+
+        Returns:
+            int: Number of entries removed
+        """
+        count = len(self._entries)
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+        return count
+
+    def get_entries(self) -> List[Dict[str, Any]]:
+        """List live cache entries, most recently used last.
+
+        Returns:
+            List of dicts with 'tool', 'args' and 'expires_in' (seconds or None)
+        """
+        now = time.monotonic()
+        return [
+            {
+                "tool": tool_name,
+                "args": args,
+                "expires_in": expires_at - now if expires_at is not None else None,
+            }
+            for (_, tool_name, args), (expires_at, _) in self._entries.items()
+            if expires_at is None or expires_at > now
+        ]
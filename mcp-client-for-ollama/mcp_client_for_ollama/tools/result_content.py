@@ -0,0 +1,170 @@
+"""Tool result content conversion for MCP Client for Ollama.
+
+This module turns the content list of an MCP CallToolResult into the text
+and images of an Ollama tool message. It covers text, images, audio,
+embedded resources, resource links and structured content, which is
+preferred over its text serialization when a server provides both.
+"""
+
+import base64
+import binascii
+import hashlib
+import json
+import mimetypes
+import os
+import shutil
+import tempfile
+from typing import Any, List, Optional, Tuple
+
+from mcp.types import (
+    AudioContent,
+    BlobResourceContents,
+    EmbeddedResource,
+    ImageContent,
+    ResourceLink,
+    TextContent,
+    TextResourceContents,
+)
+
+
+def _format_size(num_bytes: int) -> str:
+    """Format a byte count for display."""
+    if num_bytes < 1024:
+        return f"{num_bytes} B"
+    if num_bytes < 1024 * 1024:
+        return f"{num_bytes / 1024:.1f} KB"
+    return f"{num_bytes / (1024 * 1024):.1f} MB"
+
+
+class ResultContentConverter:
+    """Converts MCP tool results into Ollama tool message content.
+
+    Text parts are joined in order. Images are passed through as their
+    original base64 payload when the model supports vision. Binary content
+    the model cannot use is written to temporary files, and the message
+    gets a short note with the file path instead.
+    """
+
+    def __init__(self, spill_dir: Optional[str] = None):
+        """Initialize the ResultContentConverter.
+
+        Args:
+            spill_dir: Directory for binary content (defaults to a new temp directory)
+        """
+        self._spill_dir = spill_dir
+        self._owns_spill_dir = False
+
+    def _get_spill_dir(self) -> str:
+        """Get the directory for binary content, creating it on first use."""
+        if self._spill_dir is None:
+            self._spill_dir = tempfile.mkdtemp(prefix="ollmcp-")
+            self._owns_spill_dir = True
+        os.makedirs(self._spill_dir, exist_ok=True)
+        return self._spill_dir
+
+    def cleanup(self) -> None:
+        """Delete the temporary directory created for binary content.
+
+        A directory passed in by the caller is left in place.
+        """
+        if self._owns_spill_dir:
+            shutil.rmtree(self._spill_dir, ignore_errors=True)
+            self._spill_dir = None
+            self._owns_spill_dir = False
+
+    def _spill(self, data_b64: str, mime_type: Optional[str]) -> Tuple[str, int]:
+        """Write base64 content to a file named after its hash.
+
+        Args:
+            data_b64: Base64-encoded content
+            mime_type: MIME type used to pick the file extension
+
+        Returns:
+            Tuple of (file path, size in bytes)
+        """
+        data = base64.b64decode(data_b64)
+        extension = mimetypes.guess_extension(mime_type or "") or ".bin"
+        name = hashlib.sha256(data).hexdigest()[:16] + extension
+        path = os.path.join(self._get_spill_dir(), name)
+        if not os.path.exists(path):
+            with open(path, "wb") as f:
+                f.write(data)
+        return path, len(data)
+
+    def _spill_note(self, label: str, data_b64: str, mime_type: Optional[str]) -> str:
+        """Spill binary content and describe where it went."""
+        try:
+            path, size = self._spill(data_b64, mime_type)
+        except (binascii.Error, ValueError, OSError) as e:
+            return f"[{label} ({mime_type or 'unknown type'}) could not be saved: {e}]"
+        return f"[{label} ({mime_type or 'unknown type'}, {_format_size(size)}) saved to {path}]"
+
+    def convert(self, result: Any, include_images: bool = False) -> Tuple[str, List[str]]:
+        """Convert a CallToolResult into tool message text and images.
+
+        Args:
+            result: CallToolResult returned by an MCP server
+            include_images: Whether images may be attached for a vision-capable model
+
+        Returns:
+            Tuple of (message text, list of base64 image payloads)
+        """
+        parts: List[str] = []
+        images: List[str] = []
+        content = getattr(result, "content", None) or []
+
+        # Structured content is the source of truth when present; its text
+        # parts only repeat it as serialized JSON, so they are skipped
+        structured = getattr(result, "structuredContent", None)
+        if structured is not None:
+            parts.append(
+                json.dumps(structured, ensure_ascii=False, separators=(",", ":"))
+            )
+
+        for item in content:
+            if isinstance(item, TextContent):
+                if structured is None:
+                    parts.append(item.text)
+            elif isinstance(item, ImageContent):
+                if include_images:
+                    # Ollama accepts the base64 payload as-is, so no re-encoding
+                    images.append(item.data)
+                    parts.append(f"[image {len(images)} ({item.mimeType}) attached]")
+                else:
+                    parts.append(self._spill_note("image", item.data, item.mimeType))
+            elif isinstance(item, AudioContent):
+                parts.append(self._spill_note("audio", item.data, item.mimeType))
+            elif isinstance(item, EmbeddedResource):
+                resource = item.resource
+                if isinstance(resource, TextResourceContents):
+                    parts.append(f"[resource {resource.uri}]\n{resource.text}")
+                elif isinstance(resource, BlobResourceContents):
+                    parts.append(
+                        self._spill_note(
+                            f"resource {resource.uri}", resource.blob, resource.mimeType
+                        )
+                    )
+            elif isinstance(item, ResourceLink):
+                description = f": {item.description}" if item.description else ""
+                parts.append(f"[resource link {item.name} <{item.uri}>{description}]")
+
+        return "\n".join(parts), images
+
+    @staticmethod
+    def get_structured_payload(result: Any) -> Optional[Any]:
+        """Get the structured content a converted message consists of.
+
+        Args:
+            result: CallToolResult returned by an MCP server
+
+        Returns:
+            The structuredContent if the converted text is exactly its JSON
+            serialization (no other content parts), otherwise None
+        """
+        structured = getattr(result, "structuredContent", None)
+        content = getattr(result, "content", None) or []
+        if structured is None or not all(
+            isinstance(item, TextContent) for item in content
+        ):
+            return None
+        return structured
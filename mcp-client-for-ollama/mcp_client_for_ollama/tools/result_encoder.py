@@ -0,0 +1,205 @@
+"""Token-efficient encoding of tool results for MCP Client for Ollama.
+
+This module rewrites JSON tool results into a more compact text form before
+they are sent back to the model. Arrays of records become a table with one
+header line and one row per record, so keys are not repeated for each item.
+"""
+
+import json
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..utils.constants import CHARS_PER_TOKEN_ESTIMATE
+
+# Strings that would read as another type, or break a row, must be quoted
+_NUMBER_PATTERN = re.compile(r"-?\d+(\.\d+)?([eE][+-]?\d+)?")
+_RESERVED_WORDS = {"true", "false", "null"}
+
+
+def _compact_json(value: Any) -> str:
+    """Serialize a value as JSON without insignificant whitespace."""
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+def _drop_nulls(value: Any) -> Any:
+    """Remove null fields from every object in a JSON value."""
+    if isinstance(value, dict):
+        return {
+            key: _drop_nulls(item) for key, item in value.items() if item is not None
+        }
+    if isinstance(value, list):
+        return [_drop_nulls(item) for item in value]
+    return value
+
+
+class ToolResultEncoder:
+    """Encodes JSON tool results into compact text for the model.
+
+    Homogeneous arrays of objects, either at the top level or as direct
+    values of a top-level object, are written as tables:
+
+        users[2]{id,name,email}:
+          1,Alice,alice@example.com
+          2,Bob,
+
+    Null and missing fields become empty cells. Other JSON is re-serialized
+    without whitespace, optionally dropping null fields. Results that are not
+    JSON, or that would not get shorter, are left unchanged.
+    """
+
+    def __init__(self):
+        """Initialize the ToolResultEncoder."""
+        self.enabled = False
+        self.tabular = True
+        self.drop_nulls = True
+        self.min_rows = 2
+        self.chars_saved = 0  # Characters saved since the counter was last taken
+
+    def get_settings(self) -> Dict[str, Any]:
+        """Get the tool result encoding settings for saving to a configuration.
+
+        Returns:
+            Dict with the current encoding settings
+        """
+        return {
+            "enabled": self.enabled,
+            "tabular": self.tabular,
+            "dropNulls": self.drop_nulls,
+            "minRows": self.min_rows,
+        }
+
+    def set_settings(self, settings: Dict[str, Any]) -> None:
+        """Apply tool result encoding settings loaded from a configuration.
+
+        Args:
+            settings: Dict with tool result encoding settings
+        """
+        self.enabled = settings.get("enabled", False)
+        self.tabular = settings.get("tabular", True)
+        self.drop_nulls = settings.get("dropNulls", True)
+        self.min_rows = max(1, settings.get("minRows") or 2)
+
+    def take_savings(self) -> int:
+        """Get the estimated tokens saved since the last call and reset the counter.
+
+        Returns:
+            int: Estimated number of prompt tokens saved
+        """
+        chars, self.chars_saved = self.chars_saved, 0
+        return chars // CHARS_PER_TOKEN_ESTIMATE
+
+    def encode(self, text: str, parsed: Optional[Any] = None) -> Tuple[str, bool]:
+        """Encode a tool result if that makes it shorter.
+
+        Args:
+            text: Tool result text
+            parsed: The result already parsed as JSON, if available
+
+        Returns:
+            Tuple of (text to send to the model, whether it was encoded)
+        """
+        if not self.enabled:
+            return text, False
+
+        value = parsed
+        if value is None:
+            stripped = text.strip()
+            if not stripped.startswith(("{", "[")):
+                return text, False
+            try:
+                value = json.loads(stripped)
+            except ValueError:
+                return text, False
+
+        encoded = self._encode_value(value)
+        if len(encoded) >= len(text):
+            return text, False
+        self.chars_saved += len(text) - len(encoded)
+        return encoded, True
+
+    def _encode_value(self, value: Any) -> str:
+        """Encode a parsed JSON value."""
+        if self.tabular:
+            columns = self._table_columns(value)
+            if columns is not None:
+                return self._render_table("", value, columns)
+
+            if isinstance(value, dict) and any(
+                self._table_columns(item) is not None for item in value.values()
+            ):
+                return self._render_object(value)
+
+        if self.drop_nulls:
+            value = _drop_nulls(value)
+        return _compact_json(value)
+
+    def _table_columns(self, value: Any) -> Optional[List[str]]:
+        """Get the columns of an array that can be written as a table.
+
+        An array qualifies if it has at least 'min_rows' items, all of them
+        objects, and every object has at least half of the columns.
+
+        Args:
+            value: Parsed JSON value
+
+        Returns:
+            The column names in first-seen order, or None if the value does not qualify
+        """
+        if not isinstance(value, list) or len(value) < self.min_rows:
+            return None
+        if not all(isinstance(item, dict) and item for item in value):
+            return None
+
+        columns: Dict[str, None] = {}
+        for item in value:
+            for key in item:
+                columns.setdefault(key, None)
+        if any(len(item) * 2 < len(columns) for item in value):
+            return None
+        return list(columns)
+
+    def _render_object(self, value: Dict[str, Any]) -> str:
+        """Write a top-level object, as tables for its record arrays and one line per other field."""
+        lines = []
+        for key, item in value.items():
+            columns = self._table_columns(item)
+            if columns is not None:
+                lines.append(self._render_table(key, item, columns))
+            elif item is None and self.drop_nulls:
+                continue
+            else:
+                if self.drop_nulls:
+                    item = _drop_nulls(item)
+                lines.append(f"{self._cell(key)}: {_compact_json(item)}")
+        return "\n".join(lines)
+
+    def _render_table(
+        self, name: str, rows: List[Dict[str, Any]], columns: List[str]
+    ) -> str:
+        """Write an array of objects as a header line and one line per row."""
+        header = f"{name}[{len(rows)}]{{{','.join(self._cell(c) for c in columns)}}}:"
+        lines = [header]
+        for row in rows:
+            lines.append("  " + ",".join(self._cell(row.get(c)) for c in columns))
+        return "\n".join(lines)
+
+    def _cell(self, value: Any) -> str:
+        """Write a single table cell or name."""
+        if value is None:
+            return ""
+        if isinstance(value, bool):
+            return "true" if value else "false"
+        if isinstance(value, (int, float)):
+            return _compact_json(value)
+        if isinstance(value, str):
+            needs_quotes = (
+                value == ""
+                or value != value.strip()
+                or value in _RESERVED_WORDS
+                or _NUMBER_PATTERN.fullmatch(value) is not None
+                or any(ch in value for ch in ',"\n\r{}[]:')
+            )
+            return _compact_json(value) if needs_quotes else value
+        if self.drop_nulls:
+            value = _drop_nulls(value)
+        return _compact_json(value)
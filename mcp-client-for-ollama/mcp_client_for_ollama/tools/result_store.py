@@ -0,0 +1,254 @@
+"""Blob store for oversized tool results in MCP Client for Ollama.
+
+This module keeps large tool results on disk instead of inlining them in the
+conversation. The model gets a short preview plus an id, and pages through
+the stored result with the built-in 'ollmcp.read_result' tool.
+"""
+
+import asyncio
+import hashlib
+import os
+import re
+import sys
+import tempfile
+import time
+from typing import Any, Dict, Optional
+
+from mcp import Tool
+from mcp.types import CallToolResult, TextContent
+
+from . import blob_reader
+from .blob_reader import read_blob
+from ..utils.constants import (
+    BUILTIN_SERVER_NAME,
+    DEFAULT_RESULT_STORE_DIR,
+    DEFAULT_RESULT_STORE_MAX_AGE,
+    DEFAULT_RESULT_READ_LENGTH,
+)
+
+READ_RESULT_TOOL_NAME = f"{BUILTIN_SERVER_NAME}.read_result"
+
+READ_RESULT_TOOL = Tool(
+    name=READ_RESULT_TOOL_NAME,
+    description=(
+        f"[{BUILTIN_SERVER_NAME}] Read part of a large tool result that was stored "
+        "instead of being shown in full. Use the result id from the preview. Page "
+        "through it with offset and length, or pass grep to get only the matching lines."
+    ),
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "id": {"type": "string", "description": "Result id from the preview"},
+            "offset": {
+                "type": "integer",
+                "description": "Byte offset to start reading from (default 0)",
+            },
+            "length": {
+                "type": "integer",
+                "description": f"Number of bytes to read (default {DEFAULT_RESULT_READ_LENGTH})",
+            },
+            "grep": {
+                "type": "string",
+                "description": "Regular expression; return only matching lines with their byte offsets",
+            },
+        },
+        "required": ["id"],
+    },
+)
+
+
+class ResultStore:
+    """Content-addressed, memory-mapped store of tool results.
+
+    Each result is written once to a file named after the hash of its
+    content, so storing the same output twice reuses the existing blob.
+    Reads map the file into memory and only copy the requested range.
+    Searches for a pattern given by the model run in a separate process, so
+    a pattern that backtracks catastrophically can be stopped.
+    """
+
+    def __init__(
+        self,
+        directory: str = DEFAULT_RESULT_STORE_DIR,
+        max_age: float = DEFAULT_RESULT_STORE_MAX_AGE,
+    ):
+        """Initialize the ResultStore.
+
+        Args:
+            directory: Directory holding the blobs
+            max_age: Seconds after which stored blobs are pruned
+        """
+        self.directory = directory
+        self.max_age = max_age
+        self._pruned = False
+
+    def _path(self, result_id: str) -> Optional[str]:
+        """Get the file path of a blob, or None for a malformed id."""
+        if not re.fullmatch(r"[0-9a-f]{16,64}", result_id or ""):
+            return None
+        return os.path.join(self.directory, f"{result_id}.txt")
+
+    def _find(self, result_id: str) -> str:
+        """Get the file path of a stored blob, raising KeyError for unknown ids."""
+        path = self._path(result_id)
+        if path is None or not os.path.exists(path):
+            raise KeyError(f"Unknown result id '{result_id}'")
+        return path
+
+    def _prune(self) -> None:
+        """Remove blobs older than max_age, once per session."""
+        self._pruned = True
+        cutoff = time.time() - self.max_age
+        try:
+            for entry in os.scandir(self.directory):
+                if entry.is_file() and entry.stat().st_mtime < cutoff:
+                    os.remove(entry.path)
+        except OSError:
+            pass
+
+    def put(self, text: str) -> str:
+        """Store a tool result.
+
+        Args:
+            text: Tool result text
+
+        Returns:
+            str: Result id for later reads
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        if not self._pruned:
+            self._prune()
+
+        data = text.encode("utf-8")
+        result_id = hashlib.sha256(data).hexdigest()[:24]
+        path = self._path(result_id)
+        if os.path.exists(path):
+            os.utime(path)  # Keep a reused blob from being pruned
+            return result_id
+
+        # Write atomically so a concurrent reader never sees a partial blob
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        return result_id
+
+    def read(
+        self,
+        result_id: str,
+        offset: int = 0,
+        length: int = DEFAULT_RESULT_READ_LENGTH,
+        grep: Optional[str] = None,
+    ) -> str:
+        """Read part of a stored result.
+
+        Args:
+            result_id: Result id from put()
+            offset: Byte offset to start reading from
+            length: Maximum number of bytes to return
+            grep: Optional regular expression; only matching lines are returned
+
+        Returns:
+            str: The requested part, prefixed with a line describing its position
+
+        Raises:
+            KeyError: If the id is unknown
+            ValueError: If the grep pattern is invalid
+        """
+        return read_blob(self._find(result_id), result_id, offset, length, grep)
+
+    def preview(self, text: str, result_id: str, preview_chars: int) -> str:
+        """Build the message sent to the model in place of a stored result.
+
+        Args:
+            text: Full tool result text
+            result_id: Result id from put()
+            preview_chars: Number of leading characters to include
+
+        Returns:
+            str: Preview with instructions for reading the rest
+        """
+        size = len(text.encode("utf-8"))
+        lines = text.count("\n") + (0 if text.endswith("\n") else 1)
+        return (
+            f"{text[:preview_chars]}\n\n"
+            f"[Result too large to show in full: {len(text):,} characters, "
+            f"{lines:,} lines, {size:,} bytes. Stored as id '{result_id}'. "
+            f"Call {READ_RESULT_TOOL_NAME} with this id and an offset/length, or with a "
+            f"grep pattern, to read the parts you need.]"
+        )
+
+    async def _read_isolated(
+        self, result_id: str, offset: int, length: int, grep: str
+    ) -> str:
+        """Run a grep read in a separate process, killing it if cancelled.
+
+        Python regular expressions hold the interpreter lock while matching,
+        so a search in a thread would still block the event loop.
+
+        Args:
+            result_id: Result id from put()
+            offset: Byte offset to start searching from
+            length: Maximum number of bytes of matching lines to return
+            grep: Regular expression to search for
+
+        Returns:
+            str: The matching lines, as returned by read()
+
+        Raises:
+            KeyError: If the id is unknown
+            ValueError: If the grep pattern is invalid
+        """
+        path = self._find(result_id)
+        process = await asyncio.create_subprocess_exec(
+            sys.executable,
+            "-m",
+            blob_reader.__name__,
+            path,
+            result_id,
+            str(offset),
+            str(length),
+            grep,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        try:
+            stdout, stderr = await process.communicate()
+        except asyncio.CancelledError:
+            # Timed out or interrupted; the search may never finish on its own
+            process.kill()
+            await process.wait()
+            raise
+        if process.returncode != 0:
+            raise ValueError(stderr.decode("utf-8", errors="replace").strip())
+        return stdout.decode("utf-8")
+
+    async def handle_read_result(self, arguments: Dict[str, Any]) -> CallToolResult:
+        """Execute the built-in read_result tool.
+
+        Args:
+            arguments: Tool arguments from the model
+
+        Returns:
+            CallToolResult with the requested part, or an error result
+        """
+        try:
+            result_id = arguments.get("id", "")
+            offset = arguments.get("offset") or 0
+            length = arguments.get("length") or DEFAULT_RESULT_READ_LENGTH
+            grep = arguments.get("grep") or None
+            if grep:
+                text = await self._read_isolated(result_id, offset, length, grep)
+            else:
+                text = self.read(result_id, offset=offset, length=length)
+            return CallToolResult(content=[TextContent(type="text", text=text)])
+        except (KeyError, ValueError, TypeError) as e:
+            message = e.args[0] if isinstance(e, KeyError) and e.args else str(e)
+            return CallToolResult(
+                content=[TextContent(type="text", text=message)], isError=True
+            )
@@ -1,27 +1,57 @@
 """Utility to test connectivity"""
 
-import urllib.request
-import urllib.error
+import asyncio
+from typing import Dict, Iterable, Optional
 
+import httpx
 
-def check_url_connectivity(url):
-    """
-    Check the connectivity of a URL by performing GET and POST requests.
+from .constants import DEFAULT_CONNECTIVITY_TIMEOUT
+
+
+async def _probe_url(client: httpx.AsyncClient, url: str) -> bool:
+    """Check whether a single URL answers HTTP requests.
+
+    Only the response headers are awaited, so streaming endpoints such as
+    SSE do not keep the probe open.
+
+    Args:
+        client: Shared HTTP client
+        url: URL to probe
+
+    Returns:
+        bool: True if the server sent any HTTP response
     """
     try:
-        # Test GET
-        urllib.request.urlopen(url, timeout=2)
+        async with client.stream("GET", url):
+            # Any status code (406, 404, 500, ...) means the server is reachable
+            return True
+    except (httpx.HTTPError, httpx.InvalidURL, OSError, ValueError):
+        # Unreachable, timed out, or not a valid URL
+        return False
 
-        # Test POST (empty data)
-        req = urllib.request.Request(url, data=b"", method="POST")
-        urllib.request.urlopen(req, timeout=2)
 
-        return True
+async def check_urls_connectivity(
+    urls: Iterable[str],
+    timeout: float = DEFAULT_CONNECTIVITY_TIMEOUT,
+    transport: Optional[httpx.AsyncBaseTransport] = None,
+) -> Dict[str, bool]:
+    """Check the connectivity of several URLs concurrently.
 
-    except urllib.error.HTTPError:
-        # Server responded with an HTTP error code (like 406, 404, 500, etc.)
-        # This means the server is reachable, so return True
-        return True
-    except (urllib.error.URLError, OSError):
-        # Skip URLs that are unreachable or timeout
-        return False
+    Each distinct URL is probed once with a single GET request over one
+    shared HTTP client.
+
+    Args:
+        urls: URLs to check
+        timeout: Seconds to wait for each server to respond
+        transport: Connection pool to probe through (optional), so the
+            connections it opens can be reused afterwards
+
+    Returns:
+        Dict mapping each URL to whether it is reachable
+    """
+    unique_urls = list(dict.fromkeys(urls))
+    if not unique_urls:
+        return {}
+    async with httpx.AsyncClient(timeout=timeout, transport=transport) as client:
+        results = await asyncio.gather(*(_probe_url(client, url) for url in unique_urls))
+    return dict(zip(unique_urls, results))
@@ -20,6 +20,71 @@ DEFAULT_MODEL = "qwen2.5:7b"
 # Default ollama lcoal url for API requests
 DEFAULT_OLLAMA_HOST = "http://localhost:11434"
 
+# Seconds to keep model metadata from ollama.show() before fetching it again
+MODEL_INFO_CACHE_TTL = 300
+# Seconds to remember that ollama.show() failed, so a broken model is not retried every turn
+MODEL_INFO_FAILURE_TTL = 30
+
+# Limits for concurrent tool execution within a single model turn
+DEFAULT_TOOL_MAX_CONCURRENCY = 8
+DEFAULT_TOOL_MAX_CONCURRENCY_PER_SERVER = 4
+
+# Seconds a single tool call may run before it is cancelled
+DEFAULT_TOOL_TIMEOUT = 120
+
+# Tool output size governor defaults
+DEFAULT_TOOL_OUTPUT_MAX_CHARS = 16000
+CHARS_PER_TOKEN_ESTIMATE = 4  # rough average for English text and JSON
+
+# Name of the pseudo-server that provides the client's built-in tools
+BUILTIN_SERVER_NAME = "ollmcp"
+
+# Storage for tool results too large to send to the model in full
+DEFAULT_RESULT_STORE_DIR = os.path.join(DEFAULT_CONFIG_DIR, "results")
+DEFAULT_RESULT_STORE_MAX_AGE = 7 * 24 * 3600  # seconds
+DEFAULT_RESULT_PREVIEW_CHARS = 2000
+DEFAULT_RESULT_READ_LENGTH = 4000  # bytes returned per read_result call
+
+# Tool result cache defaults
+DEFAULT_TOOL_CACHE_MAX_ENTRIES = 256
+DEFAULT_TOOL_CACHE_TTL = 300  # seconds
+
+# Circuit breaker defaults for unhealthy MCP servers
+DEFAULT_CIRCUIT_BREAKER_WINDOW = 10  # recent calls considered
+DEFAULT_CIRCUIT_BREAKER_FAILURE_RATE = 0.5
+DEFAULT_CIRCUIT_BREAKER_MIN_CALLS = 4
+DEFAULT_CIRCUIT_BREAKER_SLOW_CALL_SECONDS = 30  # calls slower than this count as failures
+DEFAULT_CIRCUIT_BREAKER_OPEN_SECONDS = 30  # time before a probe call is allowed
+
+# Server startup defaults
+DEFAULT_SERVER_CONNECT_CONCURRENCY = 8  # servers connected at the same time
+DEFAULT_SERVER_CONNECT_TIMEOUT = 60  # seconds, allows for first-time npx/uvx downloads
+DEFAULT_CONNECTIVITY_TIMEOUT = 2  # seconds to wait for a remote server to answer the probe
+DEFAULT_CATALOG_CACHE_DIR = os.path.join(DEFAULT_CONFIG_DIR, "catalog")
+DEFAULT_LAZY_SERVER_IDLE_TIMEOUT = 300  # seconds before an unused lazy server is stopped
+
+# Connection pool defaults for SSE and Streamable HTTP servers
+DEFAULT_HTTP_MAX_CONNECTIONS = 100
+DEFAULT_HTTP_MAX_KEEPALIVE_CONNECTIONS = 20
+DEFAULT_HTTP_KEEPALIVE_EXPIRY = 30  # seconds an idle connection is kept open
+
+# Restart defaults for MCP servers whose connection is lost
+DEFAULT_SERVER_RESTART_INITIAL_DELAY = 1  # seconds before the first restart attempt
+DEFAULT_SERVER_RESTART_MAX_DELAY = 60  # cap for the doubling delay between attempts
+DEFAULT_SERVER_RESTART_MAX_ATTEMPTS = 5  # consecutive failed attempts before giving up
+
+# Health check defaults for connected MCP servers
+DEFAULT_HEALTH_CHECK_INTERVAL = 20  # seconds between pings, below the HTTP keep-alive expiry
+DEFAULT_HEALTH_CHECK_TIMEOUT = 5  # seconds to wait for a ping response
+DEFAULT_HEALTH_DEGRADED_LATENCY_MS = 1000  # p95 ping latency above which a server is degraded
+DEFAULT_HEALTH_DOWN_AFTER_FAILURES = 2  # failed pings in a row before a server is down
+DEFAULT_HEALTH_WINDOW = 20  # recent pings used for the latency percentiles
+
+# Budgets for the multi-round tool loop of a single query
+DEFAULT_AGENT_LOOP_MAX_ROUNDS = 5
+DEFAULT_AGENT_LOOP_MAX_DURATION = 300  # seconds
+DEFAULT_STREAM_INACTIVITY_TIMEOUT = 180  # seconds without a chunk from Ollama, including time to first token
+
 
 # URL for checking package updates on PyPI
 PYPI_PACKAGE_URL = "https://pypi.org/pypi/mcp-client-for-ollama/json"
@@ -46,6 +111,9 @@ INTERACTIVE_COMMANDS = {
     "reset-config": "Reset to default config",
     "reload-servers": "Reload MCP servers",
     "human-in-the-loop": "Toggle HIL confirmations",
+    "parallel-tools": "Toggle concurrent tool execution",
+    "tool-cache": "Show the tool result cache",
+    "clear-tool-cache": "Flush the tool result cache",
     "mcphub": "Open the MCP-HUB for server management",
     "hub": "Open the MCP-HUB for server management",
     "quit": "Exit the application",
@@ -91,6 +91,34 @@ def display_metrics(console, metrics):
             f"[green]eval rate:[/green]            {eval_rate:.2f} tokens/s"
         )
 
+    # Prompt tokens avoided by sending tool results in a compact encoding
+    tool_result_tokens_saved = metrics.get("tool_result_tokens_saved")
+    if tool_result_tokens_saved:
+        metrics_lines.append(
+            f"[green]tool result savings:[/green]  ~{tool_result_tokens_saved} token(s)"
+        )
+
+    # Timing of the tool calls whose results this request carries
+    slowest_tool = metrics.get("slowest_tool")
+    if metrics.get("tool_calls") and slowest_tool:
+        metrics_lines.append(
+            f"[cyan]tool calls:[/cyan]           {metrics['tool_calls']} "
+            f"(slowest {slowest_tool[0]} {slowest_tool[1]:.2f}s)"
+        )
+    max_gap = metrics.get("tool_progress_max_gap")
+    if metrics.get("tool_progress_updates") and max_gap:
+        metrics_lines.append(
+            f"[cyan]tool progress:[/cyan]        {metrics['tool_progress_updates']} update(s), "
+            f"longest gap {max_gap[1]:.2f}s ({max_gap[0]})"
+        )
+
+    # Identical tool calls from one model turn that were executed only once
+    tool_calls_collapsed = metrics.get("tool_calls_collapsed")
+    if tool_calls_collapsed:
+        metrics_lines.append(
+            f"[green]duplicate tool calls:[/green] {tool_calls_collapsed} collapsed"
+        )
+
     # Display metrics in a panel
     if metrics_lines:
         console.print()  # Add spacing before panel
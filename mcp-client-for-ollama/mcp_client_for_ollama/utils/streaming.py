@@ -3,8 +3,10 @@ This file implements streaming functionality for the MCP client for Ollama.
 
 Classes:
     StreamingManager: Handles streaming responses from Ollama.
+    StreamInactivityError: Raised when a stream stops producing chunks.
 """
 
+import asyncio
 from rich.markdown import Markdown
 from rich.live import Live
 from rich.spinner import Spinner
@@ -13,6 +15,40 @@ from rich.text import Text
 from .metrics import display_metrics, extract_metrics
 
 
+class StreamInactivityError(Exception):
+    """Raised when a response stream produces no chunk within the inactivity timeout"""
+
+    def __init__(self, timeout):
+        self.timeout = timeout
+        super().__init__(
+            f"The model response stalled: no data received for {timeout:g} seconds"
+        )
+
+
+async def iterate_with_inactivity_timeout(stream, timeout=None):
+    """Iterate over a response stream, failing if it goes quiet for too long
+
+    Args:
+        stream: Async iterator of response chunks
+        timeout: Maximum seconds to wait for each chunk (None for no limit)
+
+    Yields:
+        Chunks from the stream
+
+    Raises:
+        StreamInactivityError: If no chunk arrives within the timeout
+    """
+    iterator = stream.__aiter__()
+    while True:
+        try:
+            chunk = await asyncio.wait_for(iterator.__anext__(), timeout)
+        except StopAsyncIteration:
+            return
+        except asyncio.TimeoutError:
+            raise StreamInactivityError(timeout) from None
+        yield chunk
+
+
 class StreamingManager:
     """Manages streaming responses for Ollama API calls"""
 
@@ -65,6 +101,8 @@ class StreamingManager:
         thinking_mode=False,
         show_thinking=True,
         show_metrics=False,
+        on_tool_call=None,
+        extra_metrics=None,
     ):
         """Process a streaming response from Ollama with status spinner and content updates
 
@@ -74,6 +112,10 @@ class StreamingManager:
             thinking_mode: Whether to handle thinking mode responses
             show_thinking: Whether to keep thinking text visible in final output
             show_metrics: Whether to display performance metrics when streaming completes
+            on_tool_call: Optional callback invoked with each tool call as soon as it arrives,
+                so it can be dispatched while the rest of the response is still streaming
+            extra_metrics: Optional client-side counters (e.g. tool result savings)
+                reported together with the Ollama metrics
 
         Returns:
             str: Accumulated response text
@@ -156,6 +198,8 @@ class StreamingManager:
 
                         for tool in chunk.message.tool_calls:
                             tool_calls.append(tool)
+                            if on_tool_call:
+                                on_tool_call(tool)
 
                         # Show final content display if we have any accumulated text
                         if accumulated_text or thinking_content:
@@ -174,6 +218,9 @@ class StreamingManager:
             if not showing_working and not tool_calls:
                 self.console.print()
 
+            if metrics and extra_metrics:
+                metrics.update(extra_metrics)
+
             # Display metrics if requested and available
             if show_metrics and metrics and print_response:
                 display_metrics(self.console, metrics)
@@ -207,5 +254,7 @@ class StreamingManager:
                 ):
                     for tool in chunk.message.tool_calls:
                         tool_calls.append(tool)
+                        if on_tool_call:
+                            on_tool_call(tool)
 
         return accumulated_text, tool_calls, metrics
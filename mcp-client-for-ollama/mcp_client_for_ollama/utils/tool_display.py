@@ -69,7 +69,12 @@ class ToolDisplayManager:
         )
 
     def display_tool_response(
-        self, tool_name: str, tool_args: Any, tool_response: str, show: bool = True
+        self,
+        tool_name: str,
+        tool_args: Any,
+        tool_response: str,
+        show: bool = True,
+        structured_response: Any = None,
     ) -> None:
         """Display the tool response panel with arguments and response
 
@@ -78,6 +83,8 @@ class ToolDisplayManager:
             tool_args: Arguments that were passed to the tool (always JSON-serializable)
             tool_response: Response from the tool
             show: Whether to display the tool response panel (default: True)
+            structured_response: Structured content of the response, displayed
+                directly instead of parsing tool_response again (optional)
         """
         if not show:
             return
@@ -86,7 +93,11 @@ class ToolDisplayManager:
 
         # Try to format response as JSON if possible, otherwise check for markdown patterns
         try:
-            response_data = json.loads(tool_response)
+            response_data = (
+                structured_response
+                if structured_response is not None
+                else json.loads(tool_response)
+            )
             response_display = self._format_json(response_data)
             header_text = Text.from_markup("[bold]Arguments:[/bold]\n\n")
             response_header_text = Text.from_markup("\n[bold]Response:[/bold]\n\n")
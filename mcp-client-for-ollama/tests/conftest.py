@@ -0,0 +1,105 @@
+"""Shared fixtures for the client and server connector tests."""
+
+import asyncio
+import pytest
+from contextlib import AsyncExitStack
+from unittest.mock import AsyncMock, MagicMock
+
+from mcp import Tool
+
+from mcp_client_for_ollama.client import MCPClient
+from mcp_client_for_ollama.server.connector import ServerConnector
+
+
+@pytest.fixture
+def make_tool_call():
+    """Factory for tool calls as they appear in a model response."""
+
+    def make_tool_call(name, arguments):
+        return {"function": {"name": name, "arguments": arguments}}
+
+    return make_tool_call
+
+
+@pytest.fixture
+def client():
+    """An MCPClient offering one tool of a connected 'srv' server.
+
+    HIL confirmations and tool output are off, and the model has no
+    thinking mode, so tests only set up the parts they exercise.
+    """
+    client = MCPClient(model="test-model")
+    client.show_tool_execution = False
+    client.hil_manager.set_enabled(False)
+    client.sessions["srv"] = {"session": None, "tools": []}
+    client.tool_manager.get_enabled_tool_objects = MagicMock(return_value=[MagicMock()])
+    client.tool_manager.get_tool_specs = MagicMock(return_value=[{"type": "function"}])
+    client.supports_thinking_mode = AsyncMock(return_value=False)
+    return client
+
+
+class FakeConnections:
+    """Fake MCP connections for a ServerConnector.
+
+    Replaces the connector's _connect_to_server. Each attempt waits for its
+    server's delay and for release, then takes the next outcome (the last
+    one repeats): a success registers a session with the given tools.
+    """
+
+    def __init__(self, connector: ServerConnector):
+        self.connector = connector
+        self.delays = {}  # Seconds each server takes to connect
+        self.outcomes = [(True, ["echo"])]  # (connects, tool names) per attempt
+        self.release = asyncio.Event()
+        self.release.set()
+        self.attempts = []  # Whether each attempt connected
+        self.connected = []  # Names of the servers connected, in order
+        self.closed = []  # Names of the servers whose connection was closed
+        self.in_flight = 0
+        self.max_in_flight = 0
+        connector._connect_to_server = self.connect
+
+    async def connect(self, server, exit_stack=None, quiet=False):
+        name = server["name"]
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delays.get(name, 0))
+            await self.release.wait()
+        finally:
+            self.in_flight -= 1
+        ok, tool_names = self.outcomes[min(len(self.attempts), len(self.outcomes) - 1)]
+        self.attempts.append(ok)
+        if not ok:
+            return False
+        self.connected.append(name)
+        if exit_stack is not None:
+            exit_stack.callback(self.closed.append, name)
+        tools, _ = self.connector._qualify_tools(
+            name,
+            [
+                Tool(name=tool, description=tool, inputSchema={"type": "object"})
+                for tool in tool_names
+            ],
+        )
+        self.connector.sessions[name] = {
+            "session": MagicMock(),
+            "tools": tools,
+            "server_version": "2.0",
+            "connection_closed": asyncio.Event(),
+        }
+        return True
+
+
+@pytest.fixture
+def connector():
+    """A ServerConnector with a fresh exit stack and a mocked console."""
+    connector = ServerConnector(AsyncExitStack(), console=MagicMock())
+    connector.on_tools_changed = MagicMock()
+    return connector
+
+
+@pytest.fixture
+def connections(connector):
+    """Fake connections for the connector fixture."""
+    return FakeConnections(connector)
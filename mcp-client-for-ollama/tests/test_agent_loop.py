@@ -0,0 +1,95 @@
+"""Test the bounded multi-round tool loop of a query."""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock
+
+# Mark all tests in this file as asyncio
+pytestmark = pytest.mark.asyncio
+
+
+def script_model(client, make_tool_call, rounds, settings=None, delay=0):
+    """Make the client's model call a tool in each of the given rounds.
+
+    Args:
+        client: Client to script
+        make_tool_call: Tool call factory
+        rounds: Number of responses that call a tool before the model answers
+        settings: agentLoopSettings to apply
+        delay: Seconds each model response takes
+
+    Returns:
+        List that receives the parameters of each chat request
+    """
+    client.agent_loop_settings.update(settings or {})
+    chat_requests = []
+
+    async def stream_chat(chat_params):
+        chat_requests.append(
+            {**chat_params, "messages": list(chat_params["messages"])}
+        )
+        await asyncio.sleep(delay)
+        metrics = {"prompt_eval_count": 100, "eval_count": 10}
+        if len(chat_requests) <= rounds:
+            tool_call = make_tool_call("srv.lookup", {"q": len(chat_requests)})
+            return "", [tool_call], metrics, {}
+        return "done", [], metrics, {}
+
+    async def execute_tool_calls(tool_calls, messages, started_tool_calls=None):
+        for tool in tool_calls:
+            messages.append({"role": "tool", "content": "result"})
+
+    client._stream_chat = stream_chat
+    client._execute_tool_calls = AsyncMock(side_effect=execute_tool_calls)
+    return chat_requests
+
+
+async def test_loop_runs_until_the_model_stops_calling_tools(client, make_tool_call):
+    """Test that tools are offered again after each round."""
+    chat_requests = script_model(client, make_tool_call, rounds=3)
+
+    response = await client.process_query("question")
+
+    assert response == "done"
+    assert client._execute_tool_calls.await_count == 3
+    assert len(chat_requests) == 4
+    assert all("tools" in request for request in chat_requests)
+
+
+@pytest.mark.parametrize(
+    "settings, delay, budget",
+    [
+        ({"maxRounds": 2}, 0, "maxRounds"),
+        ({"maxRounds": None, "maxTotalTokens": 200}, 0, "maxTotalTokens"),
+        ({"maxRounds": None, "maxDurationSeconds": 0.01}, 0.02, "maxDurationSeconds"),
+    ],
+)
+async def test_budget_withholds_tools_for_a_final_answer(
+    client, make_tool_call, settings, delay, budget
+):
+    """Test that an exhausted budget ends the loop with one turn without tools."""
+    chat_requests = script_model(
+        client, make_tool_call, rounds=10, settings=settings, delay=delay
+    )
+
+    await client.process_query("question")
+
+    final_request = chat_requests[-1]
+    assert "tools" not in final_request
+    assert all("tools" in request for request in chat_requests[:-1])
+    note = final_request["messages"][-1]
+    assert note["role"] == "system"
+    assert budget in note["content"]
+    assert client._execute_tool_calls.await_count == len(chat_requests) - 1
+
+
+async def test_max_rounds_limits_tool_rounds(client, make_tool_call):
+    """Test that maxRounds caps the number of tool rounds exactly."""
+    chat_requests = script_model(
+        client, make_tool_call, rounds=10, settings={"maxRounds": 2}
+    )
+
+    await client.process_query("question")
+
+    assert client._execute_tool_calls.await_count == 2
+    assert len(chat_requests) == 3
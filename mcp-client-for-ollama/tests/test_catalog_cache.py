@@ -0,0 +1,156 @@
+"""Test the persistent tool catalog cache and background reconciliation."""
+
+import asyncio
+import json
+import pytest
+from unittest.mock import MagicMock
+
+from mcp_client_for_ollama.server.catalog_cache import ToolCatalogCache
+from mcp_client_for_ollama.server.discovery import parse_server_configs
+from mcp_client_for_ollama.tools.executor import ToolExecutor
+
+# Mark all tests in this file as asyncio
+pytestmark = pytest.mark.asyncio
+
+SERVER = {"name": "srv", "command": "python", "args": ["server.py"]}
+
+
+def raw_tool(name):
+    return {"name": name, "description": name, "inputSchema": {"type": "object"}}
+
+
+async def test_save_and_load_round_trip(tmp_path):
+    """Test that a saved catalog loads back and limits do not change the key."""
+    cache = ToolCatalogCache(str(tmp_path))
+    cache.save(SERVER, "1.0", [raw_tool("echo")])
+
+    entry = cache.load({**SERVER, "toolTimeout": 5, "api_key": "secret"})
+    assert entry["server_version"] == "1.0"
+    assert entry["tools"] == [raw_tool("echo")]
+    assert cache.load({**SERVER, "args": ["other.py"]}) is None
+
+
+async def test_corrupt_entry_is_ignored(tmp_path):
+    """Test that an unreadable cache file counts as a miss."""
+    cache = ToolCatalogCache(str(tmp_path))
+    (tmp_path / f"{cache.make_key(SERVER)}.json").write_text("{not json")
+
+    assert cache.load(SERVER) is None
+
+
+def write_config(
+    connector, connections, tmp_path, live_tools, connect_ok=True, **options
+):
+    """Configure one server with a catalog cache; its connection waits for release.
+
+    Returns:
+        Path of the servers configuration file
+    """
+    config_path = tmp_path / "servers.json"
+    config_path.write_text(
+        json.dumps(
+            {"mcpServers": {"srv": {"command": "python", "args": ["server.py"], **options}}}
+        )
+    )
+    connector.catalog_cache = ToolCatalogCache(str(tmp_path / "catalog"))
+    connections.outcomes = [(connect_ok, live_tools)]
+    connections.release.clear()
+    return str(config_path)
+
+
+async def test_cached_tools_are_offered_before_connecting(
+    connector, connections, tmp_path
+):
+    """Test that startup uses the cached catalog and reconciles it afterwards."""
+    config_path = write_config(connector, connections, tmp_path, ["echo", "add"])
+    server = parse_server_configs(config_path)[0]
+    connector.catalog_cache.save(server, "1.0", [raw_tool("echo"), raw_tool("old")])
+
+    _, tools, enabled = await connector.connect_to_servers(config_path=config_path)
+
+    assert [tool.name for tool in tools] == ["srv.echo", "srv.old"]
+    assert connector.has_server("srv") and "srv" not in connector.sessions
+    connector.set_tool_status("srv.echo", False)
+
+    connections.release.set()
+    assert await connector.wait_for_server("srv")
+
+    assert [tool.name for tool in connector.available_tools] == ["srv.echo", "srv.add"]
+    assert enabled == {"srv.echo": False, "srv.add": True}
+    connector.on_tools_changed.assert_called_once()
+    await connector.exit_stack.aclose()
+
+
+async def test_failed_background_connection_removes_cached_tools(
+    connector, connections, tmp_path
+):
+    """Test that cached tools disappear when the server cannot be reached."""
+    config_path = write_config(connector, connections, tmp_path, [], connect_ok=False)
+    server = parse_server_configs(config_path)[0]
+    connector.catalog_cache.save(server, "1.0", [raw_tool("echo")])
+
+    await connector.connect_to_servers(config_path=config_path)
+    connections.release.set()
+
+    assert not await connector.wait_for_server("srv")
+    assert connector.available_tools == []
+    assert connector.enabled_tools == {}
+    assert not connector.has_server("srv")
+    await connector.exit_stack.aclose()
+
+
+async def test_lazy_server_starts_on_first_use_and_stops_when_idle(
+    connector, connections, tmp_path
+):
+    """Test that a lazy server only runs between its first call and its idle timeout."""
+    config_path = write_config(
+        connector, connections, tmp_path, ["echo"], lazy=True, idleTimeout=0.05
+    )
+    connections.release.set()
+    server = parse_server_configs(config_path)[0]
+    connector.catalog_cache.save(server, "1.0", [raw_tool("echo")])
+
+    _, tools, _ = await connector.connect_to_servers(config_path=config_path)
+    await asyncio.sleep(0)
+
+    assert [tool.name for tool in tools] == ["srv.echo"]
+    assert connector.has_server("srv") and "srv" not in connector.sessions
+    assert not connector.pending_connections
+
+    with connector.server_in_use("srv"):
+        assert await connector.wait_for_server("srv")
+        await asyncio.sleep(0.1)
+        assert "srv" in connector.sessions  # Not stopped while in use
+
+    await asyncio.sleep(0.2)
+    assert "srv" not in connector.sessions
+    assert [tool.name for tool in connector.available_tools] == ["srv.echo"]
+    assert connector.has_server("srv")
+
+    assert await connector.wait_for_server("srv")
+    assert len(connections.connected) == 2
+    await connector.exit_stack.aclose()
+
+
+async def test_lazy_server_uses_its_own_tool_timeout_before_connecting(
+    connector, connections, tmp_path
+):
+    """Test that a server's toolTimeout bounds its first start, not the global one."""
+    config_path = write_config(
+        connector, connections, tmp_path, ["echo"], lazy=True, toolTimeout=0.05
+    )
+    server = parse_server_configs(config_path)[0]
+    connector.catalog_cache.save(server, "1.0", [raw_tool("echo")])
+    await connector.connect_to_servers(config_path=config_path)
+    executor = ToolExecutor(console=MagicMock(), server_connector=connector)
+    call = {
+        "server_name": "srv",
+        "tool_name": "srv.echo",
+        "actual_tool_name": "echo",
+        "tool_args": {},
+    }
+
+    assert executor.get_tool_timeout(call) == 0.05
+    with pytest.raises(ConnectionError, match="did not connect within 0.05 seconds"):
+        await executor.call_tool(call)
+    await connector.exit_stack.aclose()
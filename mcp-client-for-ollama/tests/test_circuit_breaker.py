@@ -0,0 +1,140 @@
+"""Test the per-server circuit breaker."""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from mcp_client_for_ollama.server.circuit_breaker import (
+    CircuitBreaker,
+    CircuitOpenError,
+)
+from mcp_client_for_ollama.tools.executor import ToolExecutor
+
+
+def test_opens_on_failure_rate():
+    """Test that the breaker opens once the failure rate reaches the threshold."""
+    breaker = CircuitBreaker(window_size=4, failure_rate_threshold=0.5, minimum_calls=4)
+
+    breaker.record_success(0.1)
+    breaker.record_failure()
+    breaker.record_success(0.1)
+    assert breaker.state == "closed"
+
+    breaker.record_failure()
+    assert breaker.state == "open"
+    assert not breaker.allow_request()
+    with pytest.raises(CircuitOpenError):
+        breaker.check("srv")
+
+
+def test_slow_calls_count_as_failures():
+    """Test that calls above the latency threshold open the breaker."""
+    breaker = CircuitBreaker(minimum_calls=2, slow_call_seconds=1.0)
+
+    breaker.record_success(5.0)
+    breaker.record_success(5.0)
+
+    assert breaker.state == "open"
+
+
+def test_half_open_allows_single_probe():
+    """Test recovery through a single half-open probe call."""
+    breaker = CircuitBreaker(minimum_calls=1, open_seconds=0)
+    breaker.record_failure()
+
+    assert breaker.allow_request()
+    assert breaker.state == "half-open"
+    assert not breaker.allow_request()
+
+    breaker.record_failure()
+    assert breaker.state == "open"
+
+    assert breaker.allow_request()
+    breaker.record_success(0.1)
+    assert breaker.state == "closed"
+    assert breaker.allow_request()
+
+
+@pytest.mark.asyncio
+async def test_executor_fails_fast_while_open():
+    """Test that the executor rejects calls without contacting an open server."""
+    session = MagicMock()
+    session.call_tool = AsyncMock(side_effect=ConnectionError("connection reset"))
+    breaker = CircuitBreaker(minimum_calls=2, open_seconds=60)
+    connector = MagicMock()
+    connector.get_sessions.return_value = {"srv": {"session": session}}
+    connector.get_tool.return_value = None
+    connector.get_server_limits.return_value = {}
+    connector.get_circuit_breaker.return_value = breaker
+    connector.validate_tool_arguments.return_value = []
+    executor = ToolExecutor(console=MagicMock(), server_connector=connector)
+    call = {
+        "server_name": "srv",
+        "tool_name": "srv.lookup",
+        "actual_tool_name": "lookup",
+        "tool_args": {},
+    }
+
+    results = [await executor.execute([call]) for _ in range(3)]
+    results = [result for batch in results for result in batch]
+
+    assert all(isinstance(result, ConnectionError) for result in results[:2])
+    assert isinstance(results[2], CircuitOpenError)
+    assert session.call_tool.await_count == 2
+
+
+def make_half_open_executor(sessions):
+    """Create an executor whose server breaker is waiting for a probe call."""
+    breaker = CircuitBreaker(minimum_calls=1, open_seconds=0)
+    breaker.record_failure()
+    connector = MagicMock()
+    connector.get_sessions.return_value = sessions
+    connector.wait_for_server = AsyncMock(return_value=False)
+    connector.get_tool.return_value = None
+    connector.get_server_limits.return_value = {}
+    connector.get_circuit_breaker.return_value = breaker
+    connector.validate_tool_arguments.return_value = []
+    executor = ToolExecutor(console=MagicMock(), server_connector=connector)
+    call = {
+        "server_name": "srv",
+        "tool_name": "srv.lookup",
+        "actual_tool_name": "lookup",
+        "tool_args": {},
+    }
+    return executor, breaker, call
+
+
+@pytest.mark.asyncio
+async def test_probe_to_disconnected_server_frees_the_slot():
+    """Test that a probe failing before it is sent lets the next call probe."""
+    sessions = {}
+    executor, breaker, call = make_half_open_executor(sessions)
+
+    with pytest.raises(ConnectionError):
+        await executor.call_tool(call)
+
+    session = MagicMock()
+    session.call_tool = AsyncMock(return_value="ok")
+    sessions["srv"] = {"session": session}
+    assert await executor.call_tool(call) == "ok"
+    assert breaker.state == "closed"
+
+
+@pytest.mark.asyncio
+async def test_probe_cancelled_while_queued_frees_the_slot():
+    """Test that cancelling a probe waiting on the server limiter frees the slot."""
+    session = MagicMock()
+    session.call_tool = AsyncMock(return_value="ok")
+    executor, breaker, call = make_half_open_executor({"srv": {"session": session}})
+    executor.max_concurrency_per_server = 1
+
+    async with executor._get_server_limiter("srv"):
+        probe = asyncio.create_task(executor.call_tool(call))
+        await asyncio.sleep(0.01)
+        probe.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await probe
+    session.call_tool.assert_not_awaited()
+
+    assert await executor.call_tool(call) == "ok"
+    assert breaker.state == "closed"
@@ -0,0 +1,57 @@
+"""Test concurrent connectivity probing of remote servers."""
+
+import httpx
+import pytest
+import respx
+
+from mcp_client_for_ollama.utils.connection import check_urls_connectivity
+
+# Mark all tests in this file as asyncio
+pytestmark = pytest.mark.asyncio
+
+
+@respx.mock
+async def test_any_http_response_counts_as_reachable():
+    """Test that error statuses still mean the server is reachable."""
+    respx.get("http://ok.test/mcp").respond(200)
+    respx.get("http://strict.test/mcp").respond(406)
+    respx.get("http://down.test/mcp").mock(side_effect=httpx.ConnectError("refused"))
+    respx.get("http://slow.test/mcp").mock(side_effect=httpx.ReadTimeout("timeout"))
+
+    results = await check_urls_connectivity(
+        [
+            "http://ok.test/mcp",
+            "http://strict.test/mcp",
+            "http://down.test/mcp",
+            "http://slow.test/mcp",
+        ]
+    )
+
+    assert results == {
+        "http://ok.test/mcp": True,
+        "http://strict.test/mcp": True,
+        "http://down.test/mcp": False,
+        "http://slow.test/mcp": False,
+    }
+
+
+@respx.mock
+async def test_each_url_is_probed_once():
+    """Test that duplicate URLs share a single probe."""
+    route = respx.get("http://ok.test/mcp").respond(200)
+
+    results = await check_urls_connectivity(["http://ok.test/mcp"] * 3)
+
+    assert results == {"http://ok.test/mcp": True}
+    assert route.call_count == 1
+    assert await check_urls_connectivity([]) == {}
+
+
+@respx.mock
+async def test_invalid_url_counts_as_unreachable():
+    """Test that a malformed URL fails its own probe without stopping the others."""
+    respx.get("http://ok.test/mcp").respond(200)
+
+    results = await check_urls_connectivity(["http://[::1", "http://ok.test/mcp"])
+
+    assert results == {"http://[::1": False, "http://ok.test/mcp": True}
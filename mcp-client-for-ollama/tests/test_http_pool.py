@@ -0,0 +1,41 @@
+"""Test the HTTP connection pool shared by remote MCP servers."""
+
+import httpx
+import pytest
+import respx
+
+from mcp_client_for_ollama.server.http_pool import HttpClientPool
+
+# Mark all tests in this file as asyncio
+pytestmark = pytest.mark.asyncio
+
+
+@respx.mock
+async def test_clients_share_the_pool_and_keep_it_open():
+    """Test that closing one client leaves the pool usable for the others."""
+    respx.get("http://mcp.test/a").mock(return_value=httpx.Response(200))
+    pool = HttpClientPool()
+
+    async with pool.create_client(headers={"X-Server": "one"}) as first:
+        response = await first.get("http://mcp.test/a")
+        assert response.request.headers["X-Server"] == "one"
+    transport = pool.get_transport()
+
+    async with pool.create_client() as second:
+        assert (await second.get("http://mcp.test/a")).status_code == 200
+
+    assert pool.get_transport() is transport
+    await pool.aclose()
+
+
+async def test_settings_configure_a_new_pool(monkeypatch):
+    """Test that new settings apply to the next pool and HTTP/2 needs 'h2'."""
+    monkeypatch.setattr(HttpClientPool, "http2_available", staticmethod(lambda: False))
+    pool = HttpClientPool()
+    old_transport = pool.get_transport()
+
+    pool.set_settings({"maxConnections": 4, "http2": True})
+
+    assert pool.get_transport() is not old_transport
+    assert pool.get_settings()["maxConnections"] == 4
+    await pool.aclose()
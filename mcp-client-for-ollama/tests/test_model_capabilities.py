@@ -0,0 +1,90 @@
+"""Test the model capability cache."""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from mcp_client_for_ollama.models.capabilities import ModelCapabilityCache
+from mcp_client_for_ollama.models.manager import ModelManager
+
+# Mark all tests in this file as asyncio
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.fixture
+def mock_ollama():
+    """Fixture for a mocked Ollama async client."""
+    mock = MagicMock()
+    mock.show = AsyncMock(
+        return_value={
+            "capabilities": ["completion", "tools", "thinking"],
+            "modelinfo": {
+                "general.architecture": "qwen3",
+                "qwen3.context_length": 40960,
+            },
+        }
+    )
+    return mock
+
+
+async def test_get_caches_show_response(mock_ollama):
+    """Test that repeated lookups only call ollama.show() once."""
+    cache = ModelCapabilityCache(mock_ollama)
+
+    first = await cache.get("qwen3:8b")
+    second = await cache.get("qwen3:8b")
+
+    assert first["capabilities"] == ["completion", "tools", "thinking"]
+    assert first["context_length"] == 40960
+    assert second is first
+    mock_ollama.show.assert_awaited_once_with("qwen3:8b")
+
+
+async def test_ttl_expiry_refetches(mock_ollama):
+    """Test that expired entries are fetched again."""
+    cache = ModelCapabilityCache(mock_ollama, ttl=0)
+
+    await cache.get("qwen3:8b")
+    await cache.get("qwen3:8b")
+
+    assert mock_ollama.show.await_count == 2
+
+
+async def test_digest_change_refetches(mock_ollama):
+    """Test that a new digest for the same model name misses the cache."""
+    cache = ModelCapabilityCache(mock_ollama)
+    cache.record_digests([{"model": "qwen3:8b", "digest": "aaa"}])
+    await cache.get("qwen3:8b")
+
+    cache.record_digests([{"model": "qwen3:8b", "digest": "bbb"}])
+    await cache.get("qwen3:8b")
+
+    assert mock_ollama.show.await_count == 2
+
+
+async def test_failed_lookup_is_cached_briefly(mock_ollama):
+    """Test that errors from ollama.show() report no capabilities until the failure TTL expires."""
+    mock_ollama.show.side_effect = Exception("connection refused")
+    cache = ModelCapabilityCache(mock_ollama)
+
+    info = await cache.get("qwen3:8b")
+    await cache.get("qwen3:8b")
+
+    assert info["capabilities"] == []
+    mock_ollama.show.assert_awaited_once()
+
+    cache.failure_ttl = 0
+    await cache.get("qwen3:8b")
+
+    assert mock_ollama.show.await_count == 2
+
+
+async def test_set_model_invalidates_cache(mock_ollama):
+    """Test that ModelManager.set_model() drops cached capabilities."""
+    manager = ModelManager(console=MagicMock(), ollama=mock_ollama)
+
+    assert await manager.supports_capability("thinking", "qwen3:8b")
+    manager.set_model("qwen3:8b")
+    assert manager.get_cached_model_info("qwen3:8b") is None
+
+    assert (await manager.get_model_info("qwen3:8b"))["context_length"] == 40960
+    assert mock_ollama.show.await_count == 2
@@ -0,0 +1,90 @@
+"""Test the tool output size governor."""
+
+import json
+
+from mcp_client_for_ollama.tools.output_governor import ToolOutputGovernor
+
+
+def make_governor(**settings):
+    governor = ToolOutputGovernor()
+    governor.set_settings(settings)
+    return governor
+
+
+def test_short_output_is_unchanged():
+    """Test that output within the budget passes through untouched."""
+    governor = make_governor(maxChars=100)
+
+    assert governor.apply("fs.read", "hello") == ("hello", 0)
+
+
+def test_text_keeps_head_and_tail():
+    """Test that plain text keeps its start and end with a marker in between."""
+    governor = make_governor(maxChars=300, headRatio=0.5)
+    text = "A" * 1000 + "B" * 1000
+
+    governed, dropped = governor.apply("fs.read", text)
+
+    assert len(governed) <= 300
+    assert governed.startswith("A" * 100)
+    assert governed.endswith("B" * 100)
+    assert "[tool output truncated:" in governed
+    assert dropped == len(text) - governed.count("A") - governed.count("B")
+    assert f"{dropped:,} of 2,000 characters" in governed
+
+
+def test_json_arrays_are_shortened_and_stay_valid():
+    """Test that long JSON arrays lose middle items but remain parseable."""
+    governor = make_governor(maxChars=500)
+    payload = {"total": 200, "items": [{"id": i, "name": f"item {i}"} for i in range(200)]}
+
+    governed, dropped = governor.apply("api.list", json.dumps(payload, indent=2))
+    body, marker = governed.rsplit("\n", 1)
+    parsed = json.loads(body)
+
+    assert len(governed) <= 500
+    assert 0 < dropped < len(json.dumps(payload, separators=(",", ":")))
+    assert marker.startswith("[tool output truncated:")
+    assert parsed["total"] == 200
+    assert parsed["items"][0]["id"] == 0
+    assert parsed["items"][-1]["id"] == 199
+    assert any("more items omitted" in str(item) for item in parsed["items"])
+
+
+def test_json_compaction_alone_may_fit():
+    """Test that pretty-printed JSON is compacted before anything is dropped."""
+    governor = make_governor(maxChars=60)
+    text = json.dumps({"a": [1, 2, 3], "b": "x"}, indent=8)
+
+    governed, dropped = governor.apply("api.get", text)
+
+    assert json.loads(governed) == {"a": [1, 2, 3], "b": "x"}
+    assert "truncated" not in governed
+    assert dropped == 0
+
+
+def test_per_tool_limits_and_token_budget():
+    """Test per-tool overrides and that the stricter of chars/tokens applies."""
+    governor = make_governor(
+        maxChars=1000,
+        maxTokens=100,
+        toolLimits={"fs.read": {"maxChars": 5000, "maxTokens": None}},
+    )
+
+    assert governor.get_limit("web.fetch") == 400
+    assert governor.get_limit("fs.read") == 5000
+
+    governor.set_settings({"enabled": False})
+    assert governor.get_limit("web.fetch") is None
+
+
+def test_truncated_output_fits_tight_limits():
+    """Test that the marker is accounted for when the limit is small."""
+    for limit in (120, 200, 500):
+        governor = make_governor(maxChars=limit)
+
+        text_out, _ = governor.apply("fs.read", "x" * 20_000)
+        json_out, _ = governor.apply("api.list", json.dumps(list(range(5_000))))
+
+        assert len(text_out) <= limit
+        assert len(json_out) <= limit
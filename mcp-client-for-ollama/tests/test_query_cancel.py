@@ -0,0 +1,98 @@
+"""Test cancelling a running query with Ctrl-C."""
+
+import asyncio
+import os
+import pytest
+import signal
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+# Mark all tests in this file as asyncio
+pytestmark = pytest.mark.asyncio
+
+
+class FakeStream:
+    """A chat stream that yields the given chunks, then optionally stalls."""
+
+    def __init__(self, chunks, stall=False):
+        self.chunks = list(chunks)
+        self.stall = stall
+        self.closed = False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self.chunks:
+            return self.chunks.pop(0)
+        if self.stall:
+            await asyncio.Event().wait()
+        raise StopAsyncIteration
+
+    async def aclose(self):
+        self.closed = True
+
+
+def make_chunk(tool_calls=None, done=False):
+    return SimpleNamespace(
+        message=SimpleNamespace(content="", thinking=None, tool_calls=tool_calls),
+        done=done,
+    )
+
+
+def stream_response(client, stream):
+    """Make the client's model stream the given response."""
+    client.ollama = MagicMock()
+    client.ollama.chat = AsyncMock(return_value=stream)
+
+
+async def test_ctrl_c_closes_the_stream_and_cancels_tool_calls(client, make_tool_call):
+    """Test that SIGINT cancels the query, its stream and its early tool calls."""
+    tool_call = make_tool_call("srv.lookup", {"q": "x"})
+    stream = FakeStream([make_chunk(tool_calls=[tool_call])], stall=True)
+    stream_response(client, stream)
+    client.tool_executor.set_settings({"dispatchWhileStreaming": True})
+    started = []
+
+    def start(call):
+        task = asyncio.create_task(asyncio.Event().wait())
+        started.append(task)
+        return task
+
+    client.tool_executor.start = start
+
+    query = asyncio.create_task(client._run_cancellable_query("question"))
+    while not started:
+        await asyncio.sleep(0.01)
+    os.kill(os.getpid(), signal.SIGINT)
+
+    assert await query is None
+    await asyncio.sleep(0)
+    assert stream.closed
+    assert started[0].cancelled()
+    assert client._cancel_query is None
+
+
+async def test_ctrl_c_at_a_confirmation_prompt_cancels_the_query(
+    client, make_tool_call
+):
+    """Test that Ctrl-C interrupts a blocking HIL prompt instead of being held back."""
+    tool_call = make_tool_call("srv.lookup", {"q": "x"})
+    stream_response(client, FakeStream([make_chunk(tool_calls=[tool_call], done=True)]))
+    client.hil_manager.set_enabled(True)
+    client.tool_executor.call_tool = AsyncMock()
+    handlers = []
+
+    def interrupted_prompt(*args, **kwargs):
+        handlers.append(signal.getsignal(signal.SIGINT))
+        raise KeyboardInterrupt
+
+    with patch(
+        "mcp_client_for_ollama.utils.hil_manager.Prompt.ask",
+        side_effect=interrupted_prompt,
+    ):
+        assert await client._run_cancellable_query("question") is None
+
+    assert handlers == [signal.default_int_handler]
+    assert signal.getsignal(signal.SIGINT) is signal.default_int_handler
+    client.tool_executor.call_tool.assert_not_awaited()
@@ -0,0 +1,152 @@
+"""Test conversion of MCP tool result content."""
+
+import base64
+import os
+
+from mcp.types import (
+    AudioContent,
+    BlobResourceContents,
+    CallToolResult,
+    EmbeddedResource,
+    ImageContent,
+    ResourceLink,
+    TextContent,
+    TextResourceContents,
+)
+
+from mcp_client_for_ollama.tools.result_content import ResultContentConverter
+
+PNG_B64 = base64.b64encode(b"\x89PNG fake image bytes").decode()
+
+
+def test_text_parts_are_joined():
+    """Test that every text part is kept, not just the first."""
+    result = CallToolResult(
+        content=[
+            TextContent(type="text", text="first"),
+            TextContent(type="text", text="second"),
+        ]
+    )
+
+    text, images = ResultContentConverter().convert(result)
+
+    assert text == "first\nsecond"
+    assert images == []
+
+
+def test_images_pass_through_for_vision_models(tmp_path):
+    """Test that image payloads are attached unchanged when the model has vision."""
+    result = CallToolResult(
+        content=[
+            ImageContent(type="image", data=PNG_B64, mimeType="image/png"),
+            TextContent(type="text", text="a chart"),
+        ]
+    )
+
+    text, images = ResultContentConverter(str(tmp_path)).convert(
+        result, include_images=True
+    )
+
+    assert images == [PNG_B64]
+    assert "[image 1 (image/png) attached]" in text
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_binary_content_is_spilled_to_files(tmp_path):
+    """Test that images without vision, audio and blobs are saved to files."""
+    result = CallToolResult(
+        content=[
+            ImageContent(type="image", data=PNG_B64, mimeType="image/png"),
+            AudioContent(type="audio", data=PNG_B64, mimeType="audio/wav"),
+            EmbeddedResource(
+                type="resource",
+                resource=BlobResourceContents(
+                    uri="file:///report.pdf", blob=PNG_B64, mimeType="application/pdf"
+                ),
+            ),
+        ]
+    )
+
+    text, images = ResultContentConverter(str(tmp_path)).convert(result)
+
+    assert images == []
+    assert text.count(str(tmp_path)) == 3
+    extensions = {os.path.splitext(p.name)[1] for p in tmp_path.iterdir()}
+    assert len(list(tmp_path.iterdir())) == 3
+    assert {".png", ".pdf"} <= extensions
+
+
+def test_resources_and_structured_content():
+    """Test text resources, resource links and structured-only results."""
+    result = CallToolResult(
+        content=[
+            EmbeddedResource(
+                type="resource",
+                resource=TextResourceContents(uri="file:///a.txt", text="hello"),
+            ),
+            ResourceLink(type="resource_link", name="b", uri="file:///b.txt"),
+        ],
+        structuredContent={"count": 2},
+    )
+
+    text, _ = ResultContentConverter().convert(result)
+
+    assert text.splitlines() == [
+        '{"count":2}',
+        "[resource file:///a.txt]",
+        "hello",
+        "[resource link b <file:///b.txt>]",
+    ]
+
+
+def test_empty_result():
+    """Test that a result without content does not crash."""
+    assert ResultContentConverter().convert(CallToolResult(content=[])) == ("", [])
+
+
+def test_structured_content_replaces_text_serialization():
+    """Test that structuredContent is used instead of its duplicate text part."""
+    result = CallToolResult(
+        content=[TextContent(type="text", text='{\n  "count": 2\n}')],
+        structuredContent={"count": 2},
+    )
+    converter = ResultContentConverter()
+
+    text, _ = converter.convert(result)
+
+    assert text == '{"count":2}'
+    assert converter.get_structured_payload(result) == {"count": 2}
+
+
+def test_structured_payload_requires_plain_result():
+    """Test that mixed results are not treated as pure structured content."""
+    result = CallToolResult(
+        content=[ImageContent(type="image", data=PNG_B64, mimeType="image/png")],
+        structuredContent={"count": 2},
+    )
+
+    assert ResultContentConverter.get_structured_payload(result) is None
+    assert ResultContentConverter.get_structured_payload(
+        CallToolResult(content=[TextContent(type="text", text="x")])
+    ) is None
+
+
+def test_cleanup_removes_only_the_temporary_spill_dir(tmp_path):
+    """Test that cleanup deletes the directory it created but not a given one."""
+    result = CallToolResult(
+        content=[AudioContent(type="audio", data=PNG_B64, mimeType="audio/wav")]
+    )
+    converter = ResultContentConverter()
+    converter.convert(result)
+    spill_dir = converter._get_spill_dir()
+    assert os.listdir(spill_dir)
+
+    converter.cleanup()
+
+    assert not os.path.exists(spill_dir)
+
+    given = ResultContentConverter(str(tmp_path))
+    given.convert(result)
+    given.cleanup()
+
+    assert os.listdir(tmp_path)
@@ -0,0 +1,91 @@
+"""Test the token-efficient tool result encoder."""
+
+import json
+
+from mcp_client_for_ollama.tools.result_encoder import ToolResultEncoder
+
+
+def make_encoder(**settings):
+    encoder = ToolResultEncoder()
+    encoder.set_settings({"enabled": True, **settings})
+    return encoder
+
+
+def test_disabled_encoder_leaves_output_unchanged():
+    """Test that encoding is opt-in."""
+    encoder = ToolResultEncoder()
+    text = json.dumps([{"id": 1}, {"id": 2}])
+
+    assert encoder.encode(text) == (text, False)
+
+
+def test_records_become_a_table():
+    """Test that an array of records is written as a header plus rows."""
+    encoder = make_encoder()
+    rows = [
+        {"id": 1, "name": "Alice", "email": "alice@example.com"},
+        {"id": 2, "name": "Bob", "email": None},
+    ]
+
+    encoded, changed = encoder.encode(json.dumps(rows, indent=2))
+
+    assert changed
+    assert encoded == (
+        "[2]{id,name,email}:\n"
+        "  1,Alice,alice@example.com\n"
+        "  2,Bob,"
+    )
+
+
+def test_nested_tables_and_ambiguous_cells():
+    """Test record arrays inside an object and quoting of ambiguous strings."""
+    encoder = make_encoder()
+    value = {
+        "total": 2,
+        "cursor": None,
+        "rows": [
+            {"code": "007", "note": "a, b", "tags": ["x"]},
+            {"code": "", "note": "true", "tags": []},
+        ],
+    }
+
+    encoded, changed = encoder.encode(json.dumps(value, indent=2), parsed=value)
+
+    assert changed
+    assert encoded.splitlines() == [
+        "total: 2",
+        "rows[2]{code,note,tags}:",
+        '  "007","a, b",["x"]',
+        '  "","true",[]',
+    ]
+
+
+def test_non_tabular_json_is_compacted_without_nulls():
+    """Test that other JSON loses whitespace and null fields."""
+    encoder = make_encoder()
+    value = {"name": "report", "owner": None, "items": [1, 2, 3]}
+
+    encoded, changed = encoder.encode(json.dumps(value, indent=2))
+
+    assert changed
+    assert encoded == '{"name":"report","items":[1,2,3]}'
+
+
+def test_plain_text_and_longer_encodings_are_kept():
+    """Test that non-JSON and already compact results pass through."""
+    encoder = make_encoder()
+
+    assert encoder.encode("plain text") == ("plain text", False)
+    assert encoder.encode('{"a":1}') == ('{"a":1}', False)
+
+
+def test_take_savings_reports_and_resets():
+    """Test that saved characters are reported as estimated tokens once."""
+    encoder = make_encoder()
+    rows = [{"identifier": i, "description": "item"} for i in range(20)]
+    text = json.dumps(rows, indent=2)
+
+    encoded, _ = encoder.encode(text)
+
+    assert encoder.take_savings() == (len(text) - len(encoded)) // 4
+    assert encoder.take_savings() == 0
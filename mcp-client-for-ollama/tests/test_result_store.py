@@ -0,0 +1,131 @@
+"""Test the on-disk store for oversized tool results."""
+
+import asyncio
+import pytest
+from unittest.mock import MagicMock
+
+from mcp import Tool
+
+from mcp_client_for_ollama.tools.manager import ToolManager
+from mcp_client_for_ollama.tools.executor import ToolExecutor, ToolTimeoutError
+from mcp_client_for_ollama.tools.result_store import (
+    READ_RESULT_TOOL,
+    READ_RESULT_TOOL_NAME,
+    ResultStore,
+)
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ResultStore(directory=str(tmp_path))
+
+
+def test_put_is_content_addressed(store, tmp_path):
+    """Test that storing the same text twice reuses one blob."""
+    first = store.put("hello world")
+    second = store.put("hello world")
+
+    assert first == second
+    assert len(list(tmp_path.iterdir())) == 1
+    assert store.put("other") != first
+
+
+def test_read_pages_through_result(store):
+    """Test reading a stored result by offset and length."""
+    result_id = store.put("0123456789" * 10)
+
+    page = store.read(result_id, offset=10, length=5)
+
+    assert page.endswith("\n01234")
+    assert "bytes 10-15 of 100; continue with offset=15" in page
+    assert "end of result" in store.read(result_id, offset=95, length=50)
+
+
+def test_read_grep_returns_matching_lines(store):
+    """Test that grep returns only matching lines with their offsets."""
+    text = "\n".join(f"line {i}: {'error' if i % 3 == 0 else 'ok'}" for i in range(10))
+    result_id = store.put(text)
+
+    matches = store.read(result_id, grep="error")
+
+    assert "4 matching line(s)" in matches
+    assert "@0: line 0: error" in matches
+    assert "line 1:" not in matches
+
+
+def test_unknown_or_malformed_ids(store):
+    """Test that bad ids raise KeyError instead of touching other files."""
+    with pytest.raises(KeyError):
+        store.read("0" * 24)
+    with pytest.raises(KeyError):
+        store.read("../../etc/passwd")
+
+
+@pytest.mark.asyncio
+async def test_handle_read_result_reports_errors(store):
+    """Test that the built-in tool turns bad requests into error results."""
+    result_id = store.put("some text")
+
+    ok = await store.handle_read_result({"id": result_id})
+    bad = await store.handle_read_result({"id": result_id, "grep": "("})
+
+    assert not ok.isError and "some text" in ok.content[0].text
+    assert bad.isError and "Invalid grep pattern" in bad.content[0].text
+
+
+def test_builtin_tool_only_offered_with_mcp_tools():
+    """Test that the built-in tool is listed but only offered alongside MCP tools."""
+    manager = ToolManager(console=MagicMock())
+    manager.register_builtin_tool(READ_RESULT_TOOL)
+    manager.set_available_tools([])
+    manager.set_enabled_tools({})
+
+    assert [t.name for t in manager.get_available_tools()] == [READ_RESULT_TOOL.name]
+    assert manager.get_enabled_tool_objects() == []
+
+    tool = Tool(name="fs.read", inputSchema={"type": "object"})
+    manager.set_available_tools([tool])
+    connector_enabled = {"fs.read": True}
+    manager.set_enabled_tools(connector_enabled)
+
+    assert [t.name for t in manager.get_enabled_tool_objects()] == [
+        "fs.read",
+        READ_RESULT_TOOL.name,
+    ]
+    assert connector_enabled == {"fs.read": True}  # Built-ins stay client-side
+
+
+@pytest.mark.asyncio
+async def test_runaway_grep_times_out_without_blocking(store):
+    """Test that a catastrophic pattern is stopped by the tool timeout."""
+    result_id = store.put("a" * 40 + "b")
+    connector = MagicMock()
+    connector.get_server_limits.return_value = {}
+    executor = ToolExecutor(console=MagicMock(), server_connector=connector)
+    executor.set_settings({"toolTimeout": 1})
+    executor.register_builtin_handler(READ_RESULT_TOOL_NAME, store.handle_read_result)
+    call = {
+        "server_name": "ollmcp",
+        "tool_name": READ_RESULT_TOOL_NAME,
+        "actual_tool_name": "read_result",
+        "tool_args": {"id": result_id, "grep": "^(a+)+$"},
+    }
+    ticks = 0
+
+    async def tick():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.05)
+            ticks += 1
+
+    ticker = asyncio.create_task(tick())
+    try:
+        with pytest.raises(ToolTimeoutError):
+            await executor.call_tool(call)
+    finally:
+        ticker.cancel()
+
+    assert ticks >= 5
+    call["tool_args"]["grep"] = "b$"
+    result = await executor.call_tool(call)
+    assert "1 matching line(s)" in result.content[0].text
@@ -0,0 +1,60 @@
+"""Test local validation of tool arguments against their inputSchema."""
+
+from mcp_client_for_ollama.server.schema_validation import (
+    compile_validator,
+    validate_arguments,
+)
+
+SCHEMA = {
+    "type": "object",
+    "properties": {
+        "path": {"type": "string"},
+        "limit": {"type": "integer", "minimum": 1},
+    },
+    "required": ["path"],
+}
+
+
+def test_valid_arguments_pass():
+    """Test that matching arguments produce no errors."""
+    validator = compile_validator(SCHEMA)
+
+    assert validate_arguments(validator, {"path": "/tmp", "limit": 5}) == []
+
+
+def test_errors_name_the_offending_field():
+    """Test that missing and mistyped fields are reported."""
+    validator = compile_validator(SCHEMA)
+
+    errors = validate_arguments(validator, {"limit": "ten"})
+
+    assert "'path' is a required property" in errors
+    assert "limit: 'ten' is not of type 'integer'" in errors
+
+
+def test_missing_arguments_are_treated_as_empty():
+    """Test that a call without arguments is checked like an empty object."""
+    validator = compile_validator(SCHEMA)
+
+    assert validate_arguments(validator, None) == ["'path' is a required property"]
+
+
+def test_error_list_is_capped():
+    """Test that only the first few errors are reported."""
+    schema = {
+        "type": "object",
+        "properties": {f"f{i}": {"type": "integer"} for i in range(8)},
+    }
+    validator = compile_validator(schema)
+
+    errors = validate_arguments(validator, {f"f{i}": "x" for i in range(8)})
+
+    assert len(errors) == 6
+    assert errors[-1] == "... and 3 more error(s)"
+
+
+def test_unusable_schemas_are_skipped():
+    """Test that empty or invalid schemas compile to no validator."""
+    assert compile_validator({}) is None
+    assert compile_validator(None) is None
+    assert compile_validator({"type": 12}) is None
@@ -0,0 +1,62 @@
+"""Test the background health checks of connected MCP servers."""
+
+import asyncio
+import pytest
+from contextlib import AsyncExitStack
+from unittest.mock import AsyncMock, MagicMock
+
+from mcp_client_for_ollama.server.connector import ServerConnector
+from mcp_client_for_ollama.server.health import ServerHealth, HEALTHY, DEGRADED, DOWN
+
+
+def test_latency_percentiles_and_degraded_state():
+    """Test that a slow p95 marks the server degraded while p50 stays low."""
+    health = ServerHealth(window_size=10, degraded_latency_ms=500)
+    for _ in range(9):
+        health.record_success(0.010)
+    assert health.state == HEALTHY
+
+    health.record_success(0.800)
+
+    status = health.get_status()
+    assert status["p50_ms"] == pytest.approx(10)
+    assert status["p95_ms"] == pytest.approx(800)
+    assert status["state"] == DEGRADED
+
+
+def test_failed_pings_mark_the_server_down_until_it_answers():
+    """Test the failure count that separates degraded from down."""
+    health = ServerHealth(down_after_failures=2)
+
+    health.record_failure()
+    assert health.state == DEGRADED
+    health.record_failure()
+    assert health.state == DOWN
+
+    health.record_success(0.005)
+    assert health.state == HEALTHY
+    assert health.get_status()["consecutive_failures"] == 0
+
+
+@pytest.mark.asyncio
+async def test_health_check_pings_every_session():
+    """Test that a check records answered and unanswered pings per server."""
+    connector = ServerConnector(AsyncExitStack(), console=MagicMock())
+    connector.set_health_settings({"timeout": 0.05, "downAfterFailures": 1})
+
+    async def hang():
+        await asyncio.sleep(1)
+
+    connector.sessions = {
+        "fast": {"session": MagicMock(send_ping=AsyncMock())},
+        "stuck": {"session": MagicMock(send_ping=hang)},
+    }
+
+    await connector.check_server_health()
+
+    health = connector.get_server_health()
+    assert health["fast"]["state"] == HEALTHY
+    assert health["fast"]["p50_ms"] is not None
+    assert health["stuck"]["state"] == DOWN
+    connector.console.print.assert_called_once()
+    await connector.exit_stack.aclose()
@@ -0,0 +1,60 @@
+"""Test per-server request limits."""
+
+import asyncio
+import time
+import pytest
+
+from mcp_client_for_ollama.server.limits import (
+    ServerLimiter,
+    TokenBucket,
+    parse_server_limits,
+)
+
+
+def test_parse_server_limits():
+    """Test that limits are read from the server dict or its config subdict."""
+    assert parse_server_limits(
+        {"name": "a", "config": {"maxInFlight": 2, "requestsPerSecond": 1.5}}
+    ) == {"maxInFlight": 2, "requestsPerSecond": 1.5, "toolTimeout": None}
+    assert parse_server_limits(
+        {"name": "b", "maxInFlight": 3, "toolTimeout": None, "config": {"toolTimeout": 10}}
+    ) == {"maxInFlight": 3, "requestsPerSecond": None, "toolTimeout": 10}
+    assert parse_server_limits(
+        {"name": "c", "config": {"maxInFlight": 0, "requestsPerSecond": "fast"}}
+    ) == {"maxInFlight": None, "requestsPerSecond": None, "toolTimeout": None}
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_limits_rate():
+    """Test that calls beyond the burst wait for tokens to refill."""
+    bucket = TokenBucket(rate=50, capacity=2)
+    start = time.monotonic()
+
+    for _ in range(5):
+        await bucket.acquire()
+
+    # Two tokens from the burst, three more at 50 per second
+    assert time.monotonic() - start >= 0.05
+
+
+@pytest.mark.asyncio
+async def test_server_limiter_caps_in_flight_and_keeps_order():
+    """Test that the limiter caps concurrency and admits waiters in order."""
+    limiter = ServerLimiter(max_in_flight=2)
+    tracker = {"in_flight": 0, "max_in_flight": 0}
+    order = []
+
+    async def call(i):
+        async with limiter:
+            order.append(i)
+            tracker["in_flight"] += 1
+            tracker["max_in_flight"] = max(
+                tracker["max_in_flight"], tracker["in_flight"]
+            )
+            await asyncio.sleep(0.01)
+            tracker["in_flight"] -= 1
+
+    await asyncio.gather(*(call(i) for i in range(6)))
+
+    assert tracker["max_in_flight"] == 2
+    assert order == list(range(6))
@@ -0,0 +1,69 @@
+"""Test that reloading servers only restarts the ones that changed."""
+
+import json
+import pytest
+from unittest.mock import MagicMock
+
+from mcp_client_for_ollama.server.catalog_cache import ToolCatalogCache
+
+# Mark all tests in this file as asyncio
+pytestmark = pytest.mark.asyncio
+
+
+def write_config(path, servers):
+    path.write_text(
+        json.dumps(
+            {
+                "mcpServers": {
+                    name: {"command": "python", "args": [script]}
+                    for name, script in servers.items()
+                }
+            }
+        )
+    )
+
+
+def skip_catalog_cache(connector, tmp_path):
+    """Make every server connect live, without a cached tool catalog."""
+    connector.startup_settings = {**connector.startup_settings, "cacheToolCatalog": False}
+    connector.catalog_cache = ToolCatalogCache(str(tmp_path / "catalog"))
+
+
+async def test_reload_restarts_only_changed_servers(connector, connections, tmp_path):
+    """Test that unchanged servers keep their session and tool states."""
+    config_path = tmp_path / "servers.json"
+    write_config(config_path, {"a": "a.py", "b": "b.py"})
+    skip_catalog_cache(connector, tmp_path)
+    await connector.connect_to_servers(config_path=str(config_path))
+    session_a = connector.sessions["a"]["session"]
+    connector.set_tool_status("a.echo", False)
+
+    write_config(config_path, {"a": "a.py", "b": "b2.py", "c": "c.py"})
+    sessions, tools, enabled = await connector.reload_servers(config_path=str(config_path))
+
+    assert connections.connected == ["a", "b", "b", "c"]
+    assert sessions["a"]["session"] is session_a
+    assert enabled == {"a.echo": False, "b.echo": True, "c.echo": True}
+    assert [tool.name for tool in tools] == ["a.echo", "b.echo", "c.echo"]
+    assert list(sessions) == ["a", "b", "c"]
+    await connector.exit_stack.aclose()
+
+
+async def test_reload_stops_removed_servers(connector, connections, tmp_path):
+    """Test that servers no longer configured are stopped and their tools dropped."""
+    config_path = tmp_path / "servers.json"
+    write_config(config_path, {"a": "a.py", "b": "b.py"})
+    skip_catalog_cache(connector, tmp_path)
+    await connector.connect_to_servers(config_path=str(config_path))
+    connector.on_server_reset = MagicMock()
+
+    write_config(config_path, {"b": "b.py"})
+    sessions, tools, enabled = await connector.reload_servers(config_path=str(config_path))
+
+    connector.on_server_reset.assert_called_once_with("a")
+    assert connections.connected == ["a", "b"]
+    assert list(sessions) == ["b"]
+    assert [tool.name for tool in tools] == ["b.echo"]
+    assert enabled == {"b.echo": True}
+    assert "a" not in connector.server_runners
+    await connector.exit_stack.aclose()
@@ -0,0 +1,83 @@
+"""Test supervision and automatic restart of MCP servers."""
+
+import asyncio
+import pytest
+
+from mcp_client_for_ollama.server.supervisor import restart_delay
+
+# Mark all tests in this file as asyncio
+pytestmark = pytest.mark.asyncio
+
+
+def plan_attempts(connector, connections, outcomes, **restart_settings):
+    """Make the connection attempts succeed or fail in turn, restarting quickly."""
+    connector.set_restart_settings({"initialDelay": 0.01, **restart_settings})
+    connections.outcomes = outcomes
+
+
+async def start(connector):
+    await connector._connect_concurrently([{"name": "srv"}])
+    connector._register_server_tools("srv")
+
+
+async def crash(connector):
+    """Close the server's connection and let the supervisor notice."""
+    connector.sessions["srv"]["connection_closed"].set()
+    for _ in range(100):
+        if "srv" not in connector.sessions:
+            return
+        await asyncio.sleep(0)
+
+
+async def test_lost_server_is_restarted_with_its_new_tools(connector, connections):
+    """Test that a crashed server comes back and its tools are swapped in."""
+    plan_attempts(
+        connector, connections, [(True, ["echo"]), (False, []), (True, ["echo", "add"])]
+    )
+    await start(connector)
+    first_session = connector.sessions["srv"]["session"]
+
+    await crash(connector)
+    assert "srv" not in connector.sessions
+    assert connector.has_server("srv")
+
+    assert await connector.wait_for_server("srv")
+    assert connections.attempts == [True, False, True]
+    assert connector.sessions["srv"]["session"] is not first_session
+    assert [tool.name for tool in connector.available_tools] == ["srv.echo", "srv.add"]
+    connector.on_tools_changed.assert_called_once()
+    await connector.exit_stack.aclose()
+
+
+async def test_restart_gives_up_after_max_attempts(connector, connections):
+    """Test that the server's tools are removed once restarting keeps failing."""
+    plan_attempts(
+        connector, connections, [(True, ["echo"]), (False, [])], maxAttempts=2
+    )
+    await start(connector)
+
+    await crash(connector)
+
+    assert not await connector.wait_for_server("srv")
+    assert connections.attempts == [True, False, False]
+    assert connector.available_tools == []
+    assert not connector.has_server("srv")
+    await connector.exit_stack.aclose()
+
+
+async def test_stopped_server_is_not_restarted(connector, connections):
+    """Test that closing the connector does not count as a lost connection."""
+    plan_attempts(connector, connections, [(True, ["echo"])])
+    await start(connector)
+
+    await connector.exit_stack.aclose()
+
+    assert connections.attempts == [True]
+    assert connector.server_runners == {}
+
+
+async def test_restart_delay_doubles_up_to_the_maximum():
+    """Test the exponential backoff between restart attempts."""
+    settings = {"initialDelay": 1, "maxDelay": 5}
+
+    assert [restart_delay(attempt, settings) for attempt in range(1, 6)] == [1, 2, 4, 5, 5]
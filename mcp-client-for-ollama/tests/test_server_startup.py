@@ -0,0 +1,97 @@
+"""Test concurrent MCP server startup."""
+
+import pytest
+
+# Mark all tests in this file as asyncio
+pytestmark = pytest.mark.asyncio
+
+
+def make_servers(connector, connections, delays, **settings):
+    """Configure servers that take the given seconds to connect."""
+    connector.startup_settings = {"connectConcurrency": 8, "connectTimeout": 5, **settings}
+    connections.delays = delays
+    return [{"name": name} for name in delays]
+
+
+async def test_servers_connect_concurrently_in_stable_order(connector, connections):
+    """Test that startup overlaps and tools keep the configured server order."""
+    servers = make_servers(
+        connector, connections, {"slow": 0.2, "fast": 0.01, "mid": 0.1}
+    )
+
+    await connector._connect_concurrently(servers)
+    for server in servers:
+        connector._register_server_tools(server["name"])
+
+    # All three connections were in progress at once
+    assert connections.max_in_flight == 3
+    assert [tool.name for tool in connector.available_tools] == [
+        "slow.echo",
+        "fast.echo",
+        "mid.echo",
+    ]
+
+    await connector.exit_stack.aclose()
+    assert sorted(connections.closed) == ["fast", "mid", "slow"]
+    assert connector.server_runners == {}
+
+
+async def test_connect_concurrency_is_capped(connector, connections):
+    """Test that no more than connectConcurrency servers connect at once."""
+    servers = make_servers(
+        connector, connections, {f"s{i}": 0.02 for i in range(6)}, connectConcurrency=2
+    )
+
+    await connector._connect_concurrently(servers)
+
+    assert connections.max_in_flight == 2
+    assert len(connector.sessions) == 6
+    await connector.exit_stack.aclose()
+
+
+async def test_slow_server_is_abandoned_after_timeout(connector, connections):
+    """Test that a server exceeding connectTimeout does not block the others."""
+    servers = make_servers(
+        connector, connections, {"hung": 10, "fast": 0.01}, connectTimeout=0.1
+    )
+
+    await connector._connect_concurrently(servers)
+
+    assert list(connector.sessions) == ["fast"]
+    assert connections.in_flight == 0  # The hung connection was cancelled
+    await connector.exit_stack.aclose()
+
+
+async def test_restarting_a_server_does_not_grow_the_exit_stack(connector, connections):
+    """Test that repeated starts register no shutdown callbacks of their own."""
+    servers = make_servers(connector, connections, {"srv": 0})
+    callbacks = len(connector.exit_stack._exit_callbacks)
+
+    for _ in range(3):
+        assert await connector._start_server(servers[0], timeout=5)
+        await connector._stop_server("srv")
+    assert await connector._start_server(servers[0], timeout=5)
+
+    assert len(connector.exit_stack._exit_callbacks) == callbacks
+    await connector.exit_stack.aclose()
+    assert connections.closed == ["srv"] * 4
+    assert connector.server_runners == {}
+
+
+async def test_disconnect_all_servers_stops_runners_and_keeps_the_exit_stack(
+    connector, connections
+):
+    """Test that disconnecting uses the runner teardown and leaves the connector usable."""
+    servers = make_servers(connector, connections, {"a": 0, "b": 0})
+    exit_stack = connector.exit_stack
+    await connector._connect_concurrently(servers)
+
+    await connector.disconnect_all_servers()
+
+    assert sorted(connections.closed) == ["a", "b"]
+    assert connector.server_runners == {} and connector.sessions == {}
+    assert connector.exit_stack is exit_stack
+
+    await connector._connect_concurrently(servers[:1])
+    await connector.exit_stack.aclose()
+    assert sorted(connections.closed) == ["a", "a", "b"]
@@ -0,0 +1,85 @@
+"""Test streaming helpers."""
+
+import asyncio
+import io
+import pytest
+from types import SimpleNamespace
+
+from rich.console import Console
+
+from mcp_client_for_ollama.utils.streaming import (
+    StreamInactivityError,
+    StreamingManager,
+    iterate_with_inactivity_timeout,
+)
+
+# Mark all tests in this file as asyncio
+pytestmark = pytest.mark.asyncio
+
+
+async def make_stream(delays):
+    """Yield one chunk after each delay."""
+    for i, delay in enumerate(delays):
+        await asyncio.sleep(delay)
+        yield i
+
+
+async def test_stream_within_timeout_is_unchanged():
+    """Test that chunks pass through when they arrive in time."""
+    chunks = [c async for c in iterate_with_inactivity_timeout(make_stream([0, 0, 0]), 1)]
+
+    assert chunks == [0, 1, 2]
+
+
+async def test_stalled_stream_raises():
+    """Test that a gap longer than the timeout aborts the stream."""
+    chunks = []
+    with pytest.raises(StreamInactivityError):
+        async for chunk in iterate_with_inactivity_timeout(
+            make_stream([0, 0.5]), 0.05
+        ):
+            chunks.append(chunk)
+
+    assert chunks == [0]
+
+
+def make_chunk(content="", tool_calls=None):
+    """Create a streamed chat chunk."""
+    return SimpleNamespace(
+        message=SimpleNamespace(content=content, thinking=None, tool_calls=tool_calls),
+        done=False,
+    )
+
+
+@pytest.mark.parametrize("print_response", [True, False])
+async def test_tool_calls_are_dispatched_as_they_arrive(print_response):
+    """Test that on_tool_call sees each tool call before the stream ends."""
+    events = []
+
+    async def stream():
+        for chunk in (
+            make_chunk("Looking up"),
+            make_chunk(tool_calls=["first"]),
+            make_chunk(tool_calls=["second"]),
+        ):
+            events.append(("chunk", chunk.message.tool_calls))
+            yield chunk
+        events.append(("end", None))
+
+    manager = StreamingManager(console=Console(file=io.StringIO()))
+    text, tool_calls, _ = await manager.process_streaming_response(
+        stream(),
+        print_response=print_response,
+        on_tool_call=lambda tool: events.append(("dispatch", tool)),
+    )
+
+    assert text == "Looking up"
+    assert tool_calls == ["first", "second"]
+    assert events == [
+        ("chunk", None),
+        ("chunk", ["first"]),
+        ("dispatch", "first"),
+        ("chunk", ["second"]),
+        ("dispatch", "second"),
+        ("end", None),
+    ]
@@ -0,0 +1,47 @@
+"""Test that identical tool calls from one model turn run only once."""
+
+import pytest
+from unittest.mock import AsyncMock
+
+from mcp.types import CallToolResult, TextContent
+
+# Mark all tests in this file as asyncio
+pytestmark = pytest.mark.asyncio
+
+
+def echo_queries(client):
+    """Make the client's tool executor echo each call's 'q' argument."""
+
+    async def execute(calls):
+        return [
+            CallToolResult(
+                content=[TextContent(type="text", text=str(call["tool_args"]["q"]))]
+            )
+            for call in calls
+        ]
+
+    client.tool_executor.execute = AsyncMock(side_effect=execute)
+
+
+@pytest.mark.parametrize("parallel", [False, True])
+async def test_duplicate_calls_share_one_execution(client, make_tool_call, parallel):
+    """Test that repeats get the first call's result, in the original order."""
+    client.tool_executor.set_settings({"parallel": parallel})
+    echo_queries(client)
+    tool_calls = [
+        make_tool_call("srv.lookup", {"q": "a", "n": 1}),
+        make_tool_call("srv.lookup", {"q": "b"}),
+        make_tool_call("srv.lookup", {"n": 1, "q": "a"}),
+    ]
+    messages = []
+
+    await client._execute_tool_calls(tool_calls, messages)
+
+    executed = [
+        call["tool_args"]
+        for args in client.tool_executor.execute.call_args_list
+        for call in args.args[0]
+    ]
+    assert executed == [{"q": "a", "n": 1}, {"q": "b"}]
+    assert [m["content"] for m in messages] == ["a", "b", "a"]
+    assert client.tool_calls_collapsed == 1
@@ -0,0 +1,85 @@
+"""Test dispatching tool calls while the model response is still streaming."""
+
+import asyncio
+import pytest
+
+from mcp.types import CallToolResult, TextContent
+
+# Mark all tests in this file as asyncio
+pytestmark = pytest.mark.asyncio
+
+
+def dispatch_early(client, delays):
+    """Start tool calls while streaming; each finishes after the delay of its 'q'.
+
+    Returns:
+        List that receives the started tasks
+    """
+    client.tool_executor.set_settings({"dispatchWhileStreaming": True})
+    started = []
+
+    async def run(call):
+        await asyncio.sleep(delays[call["tool_args"]["q"]])
+        return CallToolResult(
+            content=[TextContent(type="text", text=call["tool_args"]["q"])]
+        )
+
+    def start(call):
+        task = asyncio.create_task(run(call))
+        started.append(task)
+        return task
+
+    client.tool_executor.start = start
+    return started
+
+
+async def test_early_results_are_appended_in_call_order(client, make_tool_call):
+    """Test that calls finishing out of order still produce ordered tool messages."""
+    started = dispatch_early(client, {"slow": 0.05, "fast": 0})
+    tool_calls = [
+        make_tool_call("srv.lookup", {"q": "slow"}),
+        make_tool_call("srv.lookup", {"q": "fast"}),
+    ]
+    started_tool_calls = {}
+    dispatch = client._make_streaming_dispatcher(started_tool_calls)
+    for tool in tool_calls:
+        dispatch(tool)
+    assert len(started) == 2
+
+    messages = []
+    await client._execute_tool_calls(tool_calls, messages, started_tool_calls)
+
+    assert [m["content"] for m in messages] == ["slow", "fast"]
+    assert len(started) == 2
+
+
+async def test_dispatcher_is_off_with_hil_confirmations(client):
+    """Test that calls wait for confirmation instead of starting early."""
+    dispatch_early(client, {})
+    client.hil_manager.set_enabled(True)
+
+    assert client._make_streaming_dispatcher({}) is None
+
+
+async def test_cancelling_cancels_every_early_call(client, make_tool_call):
+    """Test that cancelling the query cancels all calls, not only the awaited one."""
+    started = dispatch_early(client, {"a": 10, "b": 10})
+    tool_calls = [
+        make_tool_call("srv.lookup", {"q": "a"}),
+        make_tool_call("srv.lookup", {"q": "b"}),
+    ]
+    started_tool_calls = {}
+    dispatch = client._make_streaming_dispatcher(started_tool_calls)
+    for tool in tool_calls:
+        dispatch(tool)
+
+    waiting = asyncio.create_task(
+        client._execute_tool_calls(tool_calls, [], started_tool_calls)
+    )
+    await asyncio.sleep(0.01)
+    waiting.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiting
+    await asyncio.sleep(0)
+
+    assert all(task.cancelled() for task in started)
@@ -0,0 +1,174 @@
+"""Test tool execution."""
+
+import asyncio
+import pytest
+from unittest.mock import MagicMock
+
+from mcp_client_for_ollama.tools.executor import (
+    ToolArgumentError,
+    ToolExecutor,
+    ToolTimeoutError,
+)
+
+# Mark all tests in this file as asyncio
+pytestmark = pytest.mark.asyncio
+
+
+class FakeSession:
+    """A fake MCP session that records how many calls are in flight."""
+
+    def __init__(self, tracker, delay=0.01):
+        self.tracker = tracker
+        self.delay = delay
+
+    async def call_tool(self, name, arguments=None, **kwargs):
+        self.tracker["in_flight"] += 1
+        self.tracker["max_in_flight"] = max(
+            self.tracker["max_in_flight"], self.tracker["in_flight"]
+        )
+        await asyncio.sleep(self.delay)
+        self.tracker["in_flight"] -= 1
+        if name == "fail":
+            raise RuntimeError("boom")
+        return f"{name}:{arguments['i']}"
+
+
+def make_executor(servers, **settings):
+    """Create a ToolExecutor over fake sessions for the given server names."""
+    tracker = {"in_flight": 0, "max_in_flight": 0}
+    connector = MagicMock()
+    connector.get_sessions.return_value = {
+        name: {"session": FakeSession(tracker)} for name in servers
+    }
+    connector.get_tool.return_value = None
+    connector.get_server_limits.return_value = {}
+    connector.get_circuit_breaker.return_value = None
+    connector.validate_tool_arguments.return_value = []
+    executor = ToolExecutor(console=MagicMock(), server_connector=connector)
+    executor.set_settings({"parallel": True, **settings})
+    return executor, tracker
+
+
+def make_call(server, tool, i):
+    return {
+        "server_name": server,
+        "tool_name": f"{server}.{tool}",
+        "actual_tool_name": tool,
+        "tool_args": {"i": i},
+    }
+
+
+async def test_execute_preserves_call_order():
+    """Test that results come back in the original call order."""
+    executor, _ = make_executor(["a", "b"])
+    calls = [make_call("a" if i % 2 else "b", "lookup", i) for i in range(6)]
+
+    results = await executor.execute(calls)
+
+    assert results == [f"lookup:{i}" for i in range(6)]
+
+
+async def test_execute_respects_per_server_limit():
+    """Test that no more than the per-server limit run at once on one server."""
+    executor, tracker = make_executor(["a"], maxConcurrencyPerServer=2)
+    calls = [make_call("a", "lookup", i) for i in range(6)]
+
+    await executor.execute(calls)
+
+    assert tracker["max_in_flight"] == 2
+
+
+async def test_execute_respects_overall_limit():
+    """Test that the overall limit applies across servers."""
+    executor, tracker = make_executor(
+        ["a", "b", "c"], maxConcurrency=2, maxConcurrencyPerServer=4
+    )
+    calls = [make_call(server, "lookup", i) for i, server in enumerate("abcabc")]
+
+    await executor.execute(calls)
+
+    assert tracker["max_in_flight"] == 2
+
+
+async def test_execute_returns_exceptions_in_place():
+    """Test that a failing call does not abort the other calls."""
+    executor, _ = make_executor(["a"])
+    calls = [make_call("a", "lookup", 0), make_call("a", "fail", 1)]
+
+    results = await executor.execute(calls)
+
+    assert results[0] == "lookup:0"
+    assert isinstance(results[1], RuntimeError)
+
+
+async def test_tool_timeout_cancels_call():
+    """Test that a call exceeding its timeout is cancelled and reported."""
+    executor, tracker = make_executor(["a"], toolTimeouts={"a.lookup": 0.01})
+    executor.server_connector.get_sessions.return_value["a"]["session"].delay = 1
+
+    results = await executor.execute([make_call("a", "lookup", 0)])
+
+    assert isinstance(results[0], ToolTimeoutError)
+    assert "timed out after 0.01 seconds" in str(results[0])
+    assert tracker["in_flight"] == 1  # The fake call never finished
+
+
+async def test_hung_server_start_is_bounded_by_the_tool_timeout():
+    """Test that waiting for a server that never connects gives up at the timeout."""
+    executor, _ = make_executor([], toolTimeout=0.01)
+
+    async def never_connects(server_name):
+        await asyncio.sleep(10)
+
+    executor.server_connector.wait_for_server = never_connects
+
+    results = await executor.execute([make_call("a", "lookup", 0)])
+
+    assert isinstance(results[0], ConnectionError)
+    assert "did not connect within 0.01 seconds" in str(results[0])
+
+
+async def test_session_is_looked_up_after_queueing():
+    """Test that a call queued behind a slot does not use a removed server's session."""
+    executor, tracker = make_executor(["a"], maxConcurrencyPerServer=1)
+    sessions = executor.server_connector.get_sessions.return_value
+    sessions["a"]["session"].delay = 0.05
+
+    first = asyncio.create_task(executor.call_tool(make_call("a", "lookup", 0)))
+    second = asyncio.create_task(executor.call_tool(make_call("a", "lookup", 1)))
+    await asyncio.sleep(0.01)
+    del sessions["a"]
+
+    assert await first == "lookup:0"
+    with pytest.raises(ConnectionError, match="not connected"):
+        await second
+    assert tracker["max_in_flight"] == 1
+
+
+async def test_tool_timeout_precedence():
+    """Test that per-tool timeouts win over server timeouts and the default."""
+    executor, _ = make_executor(["a"], toolTimeout=30, toolTimeouts={"a.slow": 300})
+    executor.server_connector.get_server_limits.return_value = {"toolTimeout": 5}
+
+    assert executor.get_tool_timeout(make_call("a", "slow", 0)) == 300
+    assert executor.get_tool_timeout(make_call("a", "lookup", 0)) == 5
+
+    executor.server_connector.get_server_limits.return_value = {}
+    assert executor.get_tool_timeout(make_call("a", "lookup", 0)) == 30
+
+
+async def test_invalid_arguments_are_rejected_locally():
+    """Test that arguments failing validation never reach the server."""
+    executor, tracker = make_executor(["a"])
+    executor.server_connector.validate_tool_arguments.return_value = [
+        "'path' is a required property"
+    ]
+
+    results = await executor.execute([make_call("a", "lookup", 0)])
+
+    assert isinstance(results[0], ToolArgumentError)
+    assert "- 'path' is a required property" in str(results[0])
+    assert tracker["max_in_flight"] == 0
+
+    executor.set_settings({"validateArguments": False})
+    assert await executor.execute([make_call("a", "lookup", 0)]) == ["lookup:0"]
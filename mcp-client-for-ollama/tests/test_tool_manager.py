@@ -0,0 +1,65 @@
+"""Test tool management."""
+
+from unittest.mock import MagicMock
+
+from mcp import Tool
+
+from mcp_client_for_ollama.server.connector import ServerConnector
+from mcp_client_for_ollama.tools.manager import ToolManager
+
+
+def make_tool_manager(names):
+    """Create a ToolManager with all the given tools enabled."""
+    tools = [
+        Tool(name=name, description=f"{name} tool", inputSchema={"type": "object"})
+        for name in names
+    ]
+    manager = ToolManager(console=MagicMock())
+    manager.set_available_tools(tools)
+    manager.set_enabled_tools({name: True for name in names})
+    return manager
+
+
+def test_tool_specs_are_cached():
+    """Test that the tool spec payload is reused while the enabled set is unchanged."""
+    manager = make_tool_manager(["a.one", "a.two"])
+
+    specs = manager.get_tool_specs()
+
+    assert [spec["function"]["name"] for spec in specs] == ["a.one", "a.two"]
+    assert specs[0]["type"] == "function"
+    assert manager.get_tool_specs() is specs
+
+
+def test_tool_specs_rebuilt_after_status_change():
+    """Test that changing the enabled set rebuilds the payload in stable order."""
+    manager = make_tool_manager(["a.one", "a.two", "b.three"])
+    specs = manager.get_tool_specs()
+
+    manager.set_tool_status("a.two", False)
+    assert [s["function"]["name"] for s in manager.get_tool_specs()] == [
+        "a.one",
+        "b.three",
+    ]
+
+    manager.disable_all_tools()
+    assert manager.get_tool_specs() == []
+
+    manager.enable_all_tools()
+    assert manager.get_tool_specs() == specs
+    assert manager.get_tool_specs() is not specs
+
+
+def test_normalize_input_schema():
+    """Test that tool input schemas are normalized into the shape Ollama accepts."""
+    normalized = ServerConnector._normalize_input_schema(
+        {"$schema": "http://json-schema.org/draft-07/schema#", "required": "x"}
+    )
+    assert normalized == {"type": "object", "properties": {}}
+
+    schema = {"type": "object", "properties": {"q": {"type": "string"}}}
+    assert ServerConnector._normalize_input_schema(schema) == schema
+    assert ServerConnector._normalize_input_schema(None) == {
+        "type": "object",
+        "properties": {},
+    }
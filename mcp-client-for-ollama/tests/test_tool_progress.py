@@ -0,0 +1,59 @@
+"""Test tracking of tool call progress notifications."""
+
+import pytest
+
+from mcp_client_for_ollama.tools.progress import ToolProgressTracker
+
+# Mark all tests in this file as asyncio
+pytestmark = pytest.mark.asyncio
+
+
+async def test_describe_shows_percentage_and_message():
+    """Test that the status line reflects the latest progress notification."""
+    tracker = ToolProgressTracker()
+    call = {"tool_name": "db.export"}
+    tracker.start(call)
+    callback = tracker.progress_callback(call)
+
+    assert tracker.describe().startswith("db.export ")
+
+    await callback(25, 100, "exporting rows")
+    description = tracker.describe()
+
+    assert "25%" in description
+    assert "exporting rows" in description
+
+
+async def test_progress_without_total_and_unknown_calls():
+    """Test progress without a total, and notifications for finished calls."""
+    tracker = ToolProgressTracker()
+    call = {"tool_name": "fs.scan"}
+    tracker.start(call)
+    callback = tracker.progress_callback(call)
+
+    await callback(42, None, None)
+    assert "· 42" in tracker.describe()
+
+    tracker.finish(call)
+    await callback(50, None, None)  # Late notifications are ignored
+    assert tracker.describe() == ""
+
+
+async def test_take_metrics_reports_timings_once():
+    """Test that finished calls are summarized and then cleared."""
+    tracker = ToolProgressTracker()
+    slow, quiet = {"tool_name": "db.export"}, {"tool_name": "fs.stat"}
+    tracker.start(slow)
+    tracker.start(quiet)
+    await tracker.progress_callback(slow)(1, 2, None)
+    await tracker.progress_callback(slow)(2, 2, None)
+    tracker.finish(quiet)
+    tracker.finish(slow)
+
+    metrics = tracker.take_metrics()
+
+    assert metrics["tool_calls"] == 2
+    assert metrics["tool_progress_updates"] == 2
+    assert metrics["tool_progress_max_gap"][0] == "db.export"
+    assert metrics["slowest_tool"][0] in ("db.export", "fs.stat")
+    assert tracker.take_metrics() == {}
@@ -0,0 +1,169 @@
+"""Test the tool result cache."""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from mcp import Tool
+from mcp.types import CallToolResult, TextContent, ToolAnnotations
+
+from mcp_client_for_ollama.tools.executor import ToolExecutor
+from mcp_client_for_ollama.tools.result_cache import (
+    ToolResultCache,
+    canonicalize_args,
+)
+
+
+def make_tool(name, **hints):
+    """Create a Tool with the given annotation hints."""
+    return Tool(
+        name=name,
+        inputSchema={"type": "object"},
+        annotations=ToolAnnotations(**hints) if hints else None,
+    )
+
+
+def make_result(text, is_error=False):
+    return CallToolResult(content=[TextContent(type="text", text=text)], isError=is_error)
+
+
+def test_canonicalize_args_ignores_key_order():
+    """Test that argument order does not change the cache key."""
+    assert canonicalize_args({"b": 1, "a": [1, 2]}) == canonicalize_args(
+        {"a": [1, 2], "b": 1}
+    )
+    assert canonicalize_args(None) == canonicalize_args({})
+
+
+def test_is_cacheable_uses_annotations_and_opt_in():
+    """Test which tools are cached."""
+    cache = ToolResultCache()
+
+    assert cache.is_cacheable(make_tool("fs.read", readOnlyHint=True))
+    assert not cache.is_cacheable(make_tool("fs.mkdir", idempotentHint=True))
+    assert not cache.is_cacheable(make_tool("fs.write", readOnlyHint=False))
+    assert not cache.is_cacheable(make_tool("web.search"))
+    assert not cache.is_cacheable(None)
+
+    cache.set_settings({"cacheTools": ["web.search"], "useAnnotations": False})
+    assert cache.is_cacheable(make_tool("web.search"))
+    assert not cache.is_cacheable(make_tool("fs.read", readOnlyHint=True))
+
+
+def test_lru_eviction():
+    """Test that the least recently used entry is evicted first."""
+    cache = ToolResultCache()
+    cache.set_settings({"maxEntries": 2})
+    keys = [cache.make_key("fs", "fs.read", {"path": p}) for p in "abc"]
+
+    cache.put(keys[0], make_result("a"))
+    cache.put(keys[1], make_result("b"))
+    assert cache.get(keys[0]) is not None
+    cache.put(keys[2], make_result("c"))
+
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) is not None
+    assert cache.get(keys[2]) is not None
+
+
+def test_ttl_and_errors():
+    """Test that expired entries and error results are not served."""
+    cache = ToolResultCache()
+    cache.set_settings({"toolTtls": {"fs.list": 0}})
+    list_key = cache.make_key("fs", "fs.list", {})
+    read_key = cache.make_key("fs", "fs.read", {})
+
+    cache.put(list_key, make_result("listing"))
+    cache.put(read_key, make_result("boom", is_error=True))
+
+    assert cache.get(list_key) is None
+    assert cache.get(read_key) is None
+    assert cache.get_entries() == []
+
+
+@pytest.mark.asyncio
+async def test_executor_serves_repeated_calls_from_cache():
+    """Test that the executor calls the server only once for identical calls."""
+    session = MagicMock()
+    session.call_tool = AsyncMock(return_value=make_result("contents"))
+    connector = MagicMock()
+    connector.get_sessions.return_value = {"fs": {"session": session}}
+    connector.get_tool.return_value = make_tool("fs.read", readOnlyHint=True)
+    connector.get_server_limits.return_value = {}
+    connector.get_circuit_breaker.return_value = None
+    connector.validate_tool_arguments.return_value = []
+    executor = ToolExecutor(console=MagicMock(), server_connector=connector)
+
+    calls = [
+        {
+            "server_name": "fs",
+            "tool_name": "fs.read",
+            "actual_tool_name": "read",
+            "tool_args": args,
+        }
+        for args in ({"path": "x", "n": 1}, {"n": 1, "path": "x"})
+    ]
+    first = await executor.call_tool(calls[0])
+    second = await executor.call_tool(calls[1])
+
+    assert second is first
+    assert calls[1]["cached"] and "cached" not in calls[0]
+    session.call_tool.assert_awaited_once()
+    assert executor.result_cache.hits == 1
+
+
+@pytest.mark.asyncio
+async def test_write_to_a_server_drops_its_cached_reads():
+    """Test that a read after a write on the same server sees the new contents."""
+    contents = {"x": "old"}
+
+    async def call_tool(name, args, progress_callback=None):
+        if name == "write":
+            contents[args["path"]] = args["text"]
+            return make_result("ok")
+        return make_result(contents[args["path"]])
+
+    session = MagicMock()
+    session.call_tool = AsyncMock(side_effect=call_tool)
+    tools = {
+        "fs.read": make_tool("fs.read", readOnlyHint=True),
+        "fs.write": make_tool("fs.write", readOnlyHint=False, idempotentHint=True),
+    }
+    connector = MagicMock()
+    connector.get_sessions.return_value = {"fs": {"session": session}}
+    connector.get_tool.side_effect = tools.get
+    connector.get_server_limits.return_value = {}
+    connector.get_circuit_breaker.return_value = None
+    connector.validate_tool_arguments.return_value = []
+    executor = ToolExecutor(console=MagicMock(), server_connector=connector)
+
+    def call(tool, **args):
+        return {
+            "server_name": "fs",
+            "tool_name": f"fs.{tool}",
+            "actual_tool_name": tool,
+            "tool_args": args,
+        }
+
+    assert (await executor.call_tool(call("read", path="x"))).content[0].text == "old"
+    await executor.call_tool(call("write", path="x", text="new"))
+    assert (await executor.call_tool(call("read", path="x"))).content[0].text == "new"
+
+    # Repeated writes always reach the server
+    await executor.call_tool(call("write", path="x", text="new"))
+    assert session.call_tool.await_count == 4
+
+
+def test_invalidate_server_drops_only_its_entries_and_late_results():
+    """Test that a reset server's entries and in-flight results are discarded."""
+    cache = ToolResultCache()
+    fs_key = cache.make_key("fs", "fs.read", {"path": "x"})
+    web_key = cache.make_key("web", "web.fetch", {})
+    cache.put(fs_key, make_result("a"))
+    cache.put(web_key, make_result("b"))
+    started = cache.generation("fs")
+
+    assert cache.invalidate_server("fs") == 1
+    cache.put(fs_key, make_result("stale"), started)
+
+    assert cache.get(fs_key) is None
+    assert cache.get(web_key) is not None